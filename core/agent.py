@@ -21,6 +21,8 @@ Usage:
 
 from typing import Optional, List
 from pathlib import Path
+import asyncio
+import functools
 import sys
 
 # Handle imports for both module and script execution
@@ -168,6 +170,19 @@ class Agent:
             agent_instance=self
         )
     
+    async def run_async(self, intent: str) -> dict:
+        """
+        Awaitable Agent.run().
+        
+        The graph itself is synchronous, so the run happens in a worker
+        thread; independent intents can be gathered and their LLM requests
+        overlap on the Ollama server (up to OLLAMA_NUM_PARALLEL slots).
+        
+        Example:
+            >>> results = await asyncio.gather(finn.run_async(a), finn.run_async(b))
+        """
+        return await asyncio.to_thread(self.run, intent)
+    
     def __repr__(self) -> str:
         status = "initialized" if self._initialized else "not initialized"
         skill_count = len(self.registry.get_all_skills()) if self._initialized else 0
@@ -178,6 +193,25 @@ class Agent:
 # CONVENIENCE FUNCTIONS
 # ============================================================================
 
+@functools.lru_cache(maxsize=4)
+def get_agent(name: str, description: str = "") -> Agent:
+    """
+    Get a shared, initialized agent for (name, description).
+    
+    The first call builds the agent (skill discovery and registry setup);
+    later calls return the same instance. Use Agent(...) directly when an
+    independent instance is needed.
+    
+    Args:
+        name: Agent name
+        description: Brief description of agent's purpose
+        
+    Returns:
+        Initialized Agent
+    """
+    return Agent(name=name, description=description)
+
+
 def create_finn_agent() -> Agent:
     """
     Create and initialize the Finn agent (financial portfolio management).
@@ -24,17 +24,38 @@ Usage:
 """
 
 import os
-from typing import Optional, Literal
+from functools import cached_property
+from types import MappingProxyType
+from typing import Mapping, Optional, Literal
 from dataclasses import dataclass
 from dotenv import load_dotenv
 
-# Load environment variables
+# Load environment variables (once; values are snapshotted into `config` below)
 load_dotenv()
 
 
-@dataclass
+def normalize_ollama_url(url: str) -> str:
+    """
+    Strip trailing slashes and a trailing /v1 or /api suffix from an Ollama URL.
+    
+    Suffixes are removed as whole path segments (str.rstrip would strip any
+    trailing '/', 'v', '1', 'a', 'p', 'i' characters, e.g. mangling port 11431).
+    """
+    url = url.rstrip('/')
+    for suffix in ('/v1', '/api'):
+        if url.endswith(suffix):
+            url = url[:-len(suffix)].rstrip('/')
+    return url
+
+
+@dataclass(frozen=True)
 class AgentOSConfig:
-    """Centralized configuration for AgentOS."""
+    """
+    Centralized configuration for AgentOS.
+    
+    Frozen: values are resolved from the environment once, in from_env().
+    Use reload_config() to pick up environment changes.
+    """
     
     # ========================================================================
     # LLM PROVIDER CONFIGURATION
@@ -78,6 +99,41 @@ class AgentOSConfig:
     Examples: nomic-embed-text, mxbai-embed-large, all-minilm
     """
     
+    OLLAMA_KEEP_ALIVE: str = "2h"
+    """
+    How long Ollama keeps a model resident after a request (sent as keep_alive).
+    Prevents the reasoning/parser models being unloaded between planner runs.
+    """
+    
+    OLLAMA_MAX_LOADED_MODELS: int = 2
+    """
+    Mirror of the Ollama *server* setting of the same name. Set it on the
+    server to >= 2 so the reasoning and parser models stay loaded together;
+    when >= 2 here, the two-stage client preloads the parser model while
+    Stage 1 runs instead of paying the model swap afterwards.
+    """
+    
+    OLLAMA_STRUCTURED_OUTPUT: bool = False
+    """
+    Plan with one call to the reasoning model constrained by the schema's
+    JSON schema (Ollama >= 0.5 structured outputs) instead of the
+    reasoning → parsing two-stage pipeline.
+    """
+    
+    PROMPT_CACHE: bool = False
+    """
+    Reuse plans for repeated requests (exact match on schema, skills and
+    request text, persisted in .tmp/semantic_cache.sqlite). Off by default:
+    it only pays off when the same requests recur.
+    """
+    
+    OLLAMA_NUM_PARALLEL: int = 2
+    """
+    Mirror of the Ollama *server* setting of the same name (requests served
+    concurrently per model). Set it on the server to >= 2 so concurrent
+    plans are not queued.
+    """
+    
     # ========================================================================
     # GOOGLE GEMINI CONFIGURATION (Future)
     # ========================================================================
@@ -146,6 +202,13 @@ class AgentOSConfig:
                 return default
             return value.lower() in ("true", "1", "yes", "on")
         
+        # Helper to convert string to int
+        def to_int(value: Optional[str], default: int) -> int:
+            try:
+                return int(value) if value is not None else default
+            except ValueError:
+                return default
+        
         # Determine provider
         provider = os.getenv("LLM_PROVIDER", "ollama").lower()
         
@@ -153,7 +216,7 @@ class AgentOSConfig:
         ollama_base_url = os.getenv("OLLAMA_BASE_URL", "http://192.168.4.102:11434")
         # Sanitize URL: remove /v1, /api, and trailing slashes
         if ollama_base_url:
-            ollama_base_url = ollama_base_url.rstrip('/').rstrip('/v1').rstrip('/api').rstrip('/')
+            ollama_base_url = normalize_ollama_url(ollama_base_url)
 
         
         # Load model names based on provider
@@ -176,25 +239,35 @@ class AgentOSConfig:
             REASONING_MODEL=reasoning_model,
             PARSER_MODEL=parser_model,
             TOOL_MODEL=tool_model,
+            OLLAMA_KEEP_ALIVE=os.getenv("OLLAMA_KEEP_ALIVE", "2h"),
+            OLLAMA_MAX_LOADED_MODELS=to_int(os.getenv("OLLAMA_MAX_LOADED_MODELS"), 2),
+            OLLAMA_NUM_PARALLEL=to_int(os.getenv("OLLAMA_NUM_PARALLEL"), 2),
+            OLLAMA_STRUCTURED_OUTPUT=to_bool(os.getenv("OLLAMA_STRUCTURED_OUTPUT"), default=False),
+            PROMPT_CACHE=to_bool(os.getenv("PROMPT_CACHE"), default=False),
             GOOGLE_API_KEY=os.getenv("GOOGLE_API_KEY"),
             GOOGLE_REASONING_MODEL=os.getenv("MODEL_PLANNER", "gemini-1.5-pro-latest"),
             GOOGLE_PARSER_MODEL=os.getenv("MODEL_ACTOR", "gemini-1.5-flash-latest"),
             ENABLE_OBSERVABILITY=to_bool(os.getenv("ENABLE_OBSERVABILITY"), default=True)
         )
     
-    def get_active_models(self) -> dict:
+    def get_active_models(self) -> Mapping[str, str]:
         """
         Get the currently active model configuration.
         
         Returns:
-            Dict with reasoning_model, parser_model, tool_model
+            Read-only mapping with reasoning_model, parser_model, tool_model
+            and provider (built once per config instance)
         """
-        return {
+        return self._active_models
+    
+    @cached_property
+    def _active_models(self) -> Mapping[str, str]:
+        return MappingProxyType({
             "reasoning_model": self.REASONING_MODEL,
             "parser_model": self.PARSER_MODEL,
             "tool_model": self.TOOL_MODEL,
             "provider": self.LLM_PROVIDER
-        }
+        })
     
     def __repr__(self) -> str:
         """String representation for debugging."""
@@ -241,6 +241,10 @@ def run_agent_with_instance(intent: str, agent_instance):
 
 if __name__ == "__main__":
     import argparse
+    import logging
+    
+    # Surface library progress logs (e.g. two-stage planner) on the CLI
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     
     parser = argparse.ArgumentParser(description="Run AgentOS with a given intent")
     parser.add_argument("intent", nargs="+", help="The user's intent/request")
@@ -10,25 +10,155 @@ Each agent instance has isolated memory storage.
 """
 
 import os
+import re
+import atexit
+import importlib.util
 import sqlite3
 import hashlib
+import threading
+import time
+import weakref
+from collections import OrderedDict, deque
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Any, Tuple
 from datetime import datetime
 import json
 import requests
 
-# LanceDB imports
+# Optional: orjson (Rust) for metadata/facts JSON, stdlib json otherwise
 try:
-    import lancedb
-    LANCEDB_AVAILABLE = True
-except (ImportError, Exception) as e:
-    LANCEDB_AVAILABLE = False
-    print(f"INFO: LanceDB not available ({type(e).__name__}). Cold memory disabled.")
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# LanceDB (cold memory) is imported on first use: the import alone takes over
+# a second, and most runs only touch NOW.md, LOG.md and facts
+LANCEDB_AVAILABLE = importlib.util.find_spec("lancedb") is not None
+if not LANCEDB_AVAILABLE:
+    print("INFO: LanceDB not available (ImportError). Cold memory disabled.")
 
 from core.config import config
 
 
+# Per-connection SQLite tuning for memory.db.
+# synchronous=NORMAL in WAL mode only fsyncs at checkpoints: a power loss or
+# OS crash can drop the last few committed transactions (the database itself
+# stays consistent). Acceptable for agent logs/facts in exchange for much
+# cheaper commits.
+SQLITE_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",       # 64MB page cache
+    "PRAGMA busy_timeout=5000",       # Wait up to 5s for a writer lock
+    "PRAGMA mmap_size=268435456",     # 256MB memory-mapped reads
+)
+
+# LOG.md is write-behind: entries are buffered and written in batches (one
+# file append + one metadata transaction) by a background writer thread
+# LOG_FLUSH_INTERVAL seconds after the first pending append. The caller's
+# thread writes only for ERROR entries, once LOG_FLUSH_ENTRIES are pending
+# (backpressure), on flush(), before any read of the same memory, and at exit.
+LOG_FLUSH_ENTRIES = 64
+LOG_FLUSH_INTERVAL = 0.05
+
+# No newline translation on Windows: entries are pre-encoded with '\n'
+_O_BINARY = getattr(os, "O_BINARY", 0)
+
+# Entry types that log rotation never drops and metadata pruning never deletes
+LOG_PINNED_TYPES = ("ERROR", "USER_FEEDBACK")
+_ENTRY_TYPE_RE = re.compile(r"^\s*## \[(\w+)\] (\S+ \S+)")
+
+# Rows per multi-row INSERT in save_facts (3 bound parameters each; stays
+# under SQLite's 999-variable limit on older builds)
+FACTS_PER_INSERT = 300
+
+# LOG.md entries mirrored in memory for read_log(last_n_entries), so prompt
+# context doesn't re-read and re-split the whole file every turn
+LOG_TAIL_ENTRIES = 200
+
+
+
+def _dumps_indented(data: Any) -> str:
+    """JSON with 2-space indent, as json.dumps(data, indent=2) but non-ASCII kept as-is."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(
+                data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ).decode("utf-8")
+        except TypeError:
+            pass  # Types orjson doesn't know; let json raise or handle them
+    return json.dumps(data, indent=2)
+
+
+_timestamp_cache: Tuple[int, str] = (-1, "")
+
+
+def _timestamp() -> str:
+    """Local 'YYYY-MM-DD HH:MM:SS', formatted at most once per second."""
+    global _timestamp_cache
+    second = int(time.time())
+    cached = _timestamp_cache
+    if cached[0] != second:
+        cached = _timestamp_cache = (
+            second, time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(second))
+        )
+    return cached[1]
+
+
+# Live managers, so reads and new instances see every buffered entry for the
+# same memory directory (the engine and the memory skills use separate
+# instances) and pending entries are written at interpreter exit
+_live_managers = weakref.WeakSet()
+
+
+def _flush_managers(memory_path: Optional[Path] = None):
+    """Flush pending log entries of live managers (optionally for one path)."""
+    for manager in list(_live_managers):
+        if memory_path is None or manager.memory_path == memory_path:
+            manager.flush()
+
+
+@atexit.register
+def _flush_pending():
+    """Write what is still buffered, skipping memory directories removed since."""
+    for manager in list(_live_managers):
+        pending = manager._pending_log or manager._now_pending is not None
+        if pending and manager.memory_path.exists():
+            manager.flush()
+
+
+_writer_wakeup = threading.Event()
+_writer_thread: Optional[threading.Thread] = None
+_writer_start_lock = threading.Lock()
+
+
+def _writer_loop():
+    """Background writer: sleeps until entries are buffered, then batches them."""
+    while True:
+        _writer_wakeup.wait()
+        # Let a burst of appends collect into one batch
+        time.sleep(LOG_FLUSH_INTERVAL)
+        _writer_wakeup.clear()
+        try:
+            _flush_pending()
+        except Exception as e:
+            print(f"ERROR in memory log writer: {e}")
+
+
+def _wake_writer():
+    """Start the writer thread on first use and signal pending entries."""
+    global _writer_thread
+    if _writer_thread is None:
+        with _writer_start_lock:
+            if _writer_thread is None:
+                _writer_thread = threading.Thread(
+                    target=_writer_loop, name="memory-log-writer", daemon=True
+                )
+                _writer_thread.start()
+    _writer_wakeup.set()
+
 
 class MemoryManager:
     """
@@ -37,15 +167,25 @@ class MemoryManager:
     Each agent gets its own MemoryManager instance with isolated storage.
     """
     
-    def __init__(self, agent_name: str, base_path: Optional[Path] = None):
+    def __init__(
+        self,
+        agent_name: str,
+        base_path: Optional[Path] = None,
+        in_memory: bool = False
+    ):
         """
         Initialize memory manager for a specific agent.
         
         Args:
             agent_name: Name of the agent (e.g., 'finn', 'code-agent')
             base_path: Base path for agent files (defaults to ./agents/<agent_name>)
+            in_memory: Keep the SQLite tier in a private in-memory database
+                instead of memory.db (for short-lived managers such as test
+                fixtures). Facts and log metadata are lost on close() and
+                are not shared with other instances.
         """
         self.agent_name = agent_name
+        self.in_memory = in_memory
         # UPDATE: Default path is now ./agents/<agent_name>
         self.base_path = base_path or Path(f"./agents/{agent_name}")
         self.memory_path = self.base_path / "memory"
@@ -59,16 +199,54 @@ class MemoryManager:
         # Configuration
         self.log_max_size_kb = 50  # Trigger compaction at 50KB
         self.log_max_entries = 100  # Or 100 entries
+        # Hard cap for when no LLM compaction has run: rotate_log() keeps the
+        # newest entries (and pinned ones) within log_max_size_kb
+        self.log_rotate_size_kb = 4 * self.log_max_size_kb
+        self.log_metadata_retention_days = 30  # Compacted metadata rows kept this long
         self.embedding_dimension = 768  # Default for nomic-embed-text
+        self.vector_index_min_rows = 256  # Build ANN index once cold memory reaches this size
+        self._vector_index_checked = False
+        
+        # Write-behind log buffer: (formatted entry, metadata row) pairs.
+        # _flush_lock keeps batches in order; _pending_lock only guards the list.
+        self._pending_log: List[Tuple[bytes, Tuple[str, str, int]]] = []
+        self._pending_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._log_fd: Optional[int] = None  # LOG.md O_APPEND descriptor, opened on first write
+        self._db_lock = threading.Lock()  # One memory.db connection, shared by threads
+        
+        # NOW.md as (mtime_ns, size, content) and the last LOG.md entries
+        # (valid while LOG.md is _log_size bytes), re-read when changed on disk
+        self._now_cache: Optional[Tuple[int, int, str]] = None
+        self._now_pending: Optional[str] = None  # NOW.md content not yet on disk
+        self._log_tail: Optional[deque] = None
+        self._log_size: Optional[int] = None
+        
+        # user_facts snapshot (key -> (value, category)), reloaded when
+        # PRAGMA data_version shows another connection has committed
+        self._facts_cache: Optional[Dict[str, Tuple[str, str]]] = None
+        self._facts_by_category: Dict[str, Dict[str, str]] = {}  # category -> {key: value}
+        self._facts_version = None
+        self._facts_edits = 0  # Bumped by our own writes (data_version isn't)
+        
+        # read_context() snapshot and the state it was built from, and
+        # format_context_for_prompt() rendered from that snapshot
+        self._context_cache: Optional[Tuple[tuple, Mapping[str, str]]] = None
+        self._prompt_cache: Optional[Tuple[Mapping[str, str], str]] = None
+        
+        # A restart must see what other live instances have buffered
+        _flush_managers(self.memory_path)
         
         # Initialize storage
         self._initialize_storage()
         self._initialize_database()
-        if LANCEDB_AVAILABLE:
-            self._initialize_lancedb()
-        else:
-            self.lance_db = None
-            self.lance_table = None
+        
+        # Cold memory connects on first use (see lance_db)
+        self._lance_db = None
+        self._lance_initialized = False
+        self.lance_table = None
+        
+        _live_managers.add(self)
     
     def _initialize_storage(self):
         """Create memory directory structure if it doesn't exist."""
@@ -97,9 +275,13 @@ class MemoryManager:
         """Initialize SQLite database with schema."""
         schema_file = Path(__file__).parent / "memory_schema.sql"
         
-        conn = sqlite3.connect(str(self.db_file))
+        # Kept open for the manager's lifetime (see close())
+        conn = self._db = self._connect()
         cursor = conn.cursor()
         
+        # WAL is persistent in the database file, so set it once here
+        cursor.execute("PRAGMA journal_mode=WAL")
+        
         # Execute schema
         if schema_file.exists():
             schema_sql = schema_file.read_text()
@@ -116,6 +298,9 @@ class MemoryManager:
                     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 );
                 
+                CREATE INDEX IF NOT EXISTS idx_user_facts_category_key
+                    ON user_facts(category, key);
+                
                 CREATE TABLE IF NOT EXISTS log_metadata (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
@@ -138,12 +323,29 @@ class MemoryManager:
             """)
         
         conn.commit()
-        conn.close()
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection to memory.db with the standard pragmas applied."""
+        database = ":memory:" if self.in_memory else str(self.db_file)
+        conn = sqlite3.connect(database, check_same_thread=False)
+        for pragma in SQLITE_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+    
+    @property
+    def lance_db(self):
+        """LanceDB connection for cold memory, opened on first use (None if unavailable)."""
+        if not self._lance_initialized:
+            self._lance_initialized = True
+            if LANCEDB_AVAILABLE:
+                self._initialize_lancedb()
+        return self._lance_db
     
     def _initialize_lancedb(self):
         """Initialize LanceDB for semantic/cold memory."""
         try:
-            self.lance_db = lancedb.connect(self.lancedb_path)
+            import lancedb
+            self._lance_db = lancedb.connect(self.lancedb_path)
             
             # Table name includes agent name to avoid collisions if sharing DB (though we segregate folders)
             table_name = f"{self.agent_name}_memory"
@@ -151,14 +353,14 @@ class MemoryManager:
             # Create table if not exists (schema is inferred from first data or we can force it)
             # We'll lazy load/create on first store to avoid schema definition complexity here
             # Or check if exists
-            if table_name in self.lance_db.table_names():
-                self.lance_table = self.lance_db.open_table(table_name)
+            if table_name in self._lance_db.table_names():
+                self.lance_table = self._lance_db.open_table(table_name)
             else:
                 self.lance_table = None # Will create on first insert
                 
         except Exception as e:
             print(f"WARNING: LanceDB initialization failed: {e}")
-            self.lance_db = None
+            self._lance_db = None
             self.lance_table = None
 
     def _get_embedding(self, text: str) -> List[float]:
@@ -178,20 +380,63 @@ class MemoryManager:
             print(f"Error calling embedding API: {e}")
             return [0.0] * self.embedding_dimension
     
+    def _get_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """
+        Generate embeddings for several texts in one Ollama request.
+        
+        Uses the batched /api/embed endpoint so the model runs one forward
+        pass over the whole batch; falls back to one request per text on
+        servers without it.
+        """
+        if not texts:
+            return []
+        
+        try:
+            url = f"{config.OLLAMA_BASE_URL}/api/embed"
+            response = requests.post(url, json={
+                "model": config.EMBEDDING_MODEL,
+                "input": texts
+            })
+            if response.status_code == 200:
+                embeddings = response.json().get("embeddings") or []
+                if len(embeddings) == len(texts):
+                    return embeddings
+            print(f"Batch embedding unavailable ({response.status_code}), embedding one by one")
+        except Exception as e:
+            print(f"Error calling batch embedding API: {e}")
+        
+        return [self._get_embedding(text) for text in texts]
+    
     # ========================================
     # HOT MEMORY (NOW.md) - Current State
     # ========================================
     
     def read_now(self) -> str:
-        """Read current status from NOW.md."""
-        if self.now_file.exists():
-            return self.now_file.read_text(encoding='utf-8')
-        return "Status: Idle"
+        """Read current status from NOW.md (cached until the file changes)."""
+        # Another instance for this directory may hold a newer status
+        _flush_managers(self.memory_path)
+        pending = self._now_pending
+        if pending is not None:
+            return pending
+        try:
+            stat = self.now_file.stat()
+        except FileNotFoundError:
+            return "Status: Idle"
+        
+        cached = self._now_cache
+        if cached is None or cached[:2] != (stat.st_mtime_ns, stat.st_size):
+            content = self.now_file.read_text(encoding='utf-8')
+            cached = self._now_cache = (stat.st_mtime_ns, stat.st_size, content)
+        return cached[2]
     
     def update_now(self, new_status: str, next_steps: Optional[List[str]] = None) -> bool:
         """
         Update NOW.md with new status and next steps.
         
+        The new content is served from memory at once and written back to
+        disk with the next log flush (background writer, ERROR entry,
+        flush() or exit), so frequent status pings cost no file write.
+        
         Args:
             new_status: Current objective/goal
             next_steps: Optional list of next actions
@@ -202,14 +447,15 @@ class MemoryManager:
         try:
             content = f"# Current Status\n\n"
             content += f"Status: {new_status}\n\n"
-            content += f"Updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+            content += f"Updated: {_timestamp()}\n\n"
             
             if next_steps:
                 content += "## Next Steps\n"
                 for step in next_steps:
                     content += f"- {step}\n"
             
-            self.now_file.write_text(content, encoding='utf-8')
+            with self._pending_lock:
+                self._now_pending = content
             
             # Log the status update
             self.append_log(
@@ -231,14 +477,22 @@ class MemoryManager:
         Read recent activity log.
         
         Args:
-            last_n_entries: Optional, return only last N entries
+            last_n_entries: Optional, return only last N entries (served
+                from memory when N <= LOG_TAIL_ENTRIES)
             
         Returns:
             LOG.md content
         """
+        _flush_managers(self.memory_path)
+        
         if not self.log_file.exists():
             return ""
         
+        if last_n_entries and last_n_entries <= LOG_TAIL_ENTRIES:
+            with self._flush_lock:
+                entries = list(self._tail_entries())
+            return '\n---\n'.join(entries[-last_n_entries:])
+        
         content = self.log_file.read_text(encoding='utf-8')
         
         if last_n_entries:
@@ -248,6 +502,43 @@ class MemoryManager:
         
         return content
     
+    def read_log_tail(self, max_bytes: int = 64 * 1024) -> str:
+        """
+        Read the end of LOG.md without reading the whole file.
+        
+        Args:
+            max_bytes: Bytes to read from the end of the file
+            
+        Returns:
+            Up to max_bytes of the most recent LOG.md content (a character
+            cut at the start of the window is dropped)
+        """
+        _flush_managers(self.memory_path)
+        
+        try:
+            with open(self.log_file, 'rb') as f:
+                size = f.seek(0, os.SEEK_END)
+                f.seek(max(0, size - max_bytes))
+                data = f.read()
+        except FileNotFoundError:
+            return ""
+        
+        return data.decode('utf-8', errors='ignore').replace('\r\n', '\n')
+    
+    def _tail_entries(self) -> deque:
+        """
+        Last LOG_TAIL_ENTRIES pieces of LOG.md split on the entry separator.
+        
+        Caller must hold _flush_lock. Reloaded from disk when LOG.md's size
+        is not the one the mirror was built for (another writer, compaction).
+        """
+        size = self.log_file.stat().st_size
+        if self._log_tail is None or size != self._log_size:
+            entries = self.log_file.read_text(encoding='utf-8').split('\n---\n')
+            self._log_tail = deque(entries, maxlen=LOG_TAIL_ENTRIES)
+            self._log_size = size
+        return self._log_tail
+    
     def append_log(
         self, 
         entry_type: str, 
@@ -265,50 +556,178 @@ class MemoryManager:
         Returns:
             True if successful
         """
-        try:
-            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            content_hash = hashlib.sha256(content.encode()).hexdigest()[:16]
-            
-            # Format entry
-            entry = f"\n## [{entry_type}] {timestamp}\n\n"
-            entry += f"{content}\n"
-            
-            if metadata:
-                entry += f"\nMetadata: {json.dumps(metadata, indent=2)}\n"
+        return self.append_logs([(entry_type, content, metadata)])
+    
+    def append_logs(
+        self,
+        entries: List[Tuple]
+    ) -> bool:
+        """
+        Append several entries to LOG.md in one batch.
+        
+        Entries are buffered and written by the background writer with a
+        single file append and a single metadata transaction (see
+        LOG_FLUSH_INTERVAL); ERROR entries are written immediately. Reads
+        flush first, so callers never see a stale log.
+        
+        Args:
+            entries: List of (entry_type, content, metadata) tuples, optionally
+                     with a fourth 'YYYY-MM-DD HH:MM:SS' timestamp element
+                     (defaults to now)
             
-            entry += "\n---\n"
+        Returns:
+            True if successful
+        """
+        if not entries:
+            return True
+        
+        try:
+            timestamp = _timestamp()
             
-            # Append to file
-            with open(self.log_file, 'a', encoding='utf-8') as f:
-                f.write(entry)
+            pending = []
+            for entry_type, content, metadata, *entry_timestamp in entries:
+                entry_time = entry_timestamp[0] if entry_timestamp else timestamp
+                content_hash = hashlib.sha256(content.encode()).hexdigest()[:16]
+                
+                # Format entry
+                entry = f"\n## [{entry_type}] {entry_time}\n\n"
+                entry += f"{content}\n"
+                
+                if metadata:
+                    entry += f"\nMetadata: {_dumps_indented(metadata)}\n"
+                
+                entry += "\n---\n"
+                
+                # Rough token estimate
+                pending.append((entry.encode('utf-8'), (entry_type, content_hash, len(content.split()))))
             
-            # Store metadata in database
-            self._store_log_metadata(
-                entry_type=entry_type,
-                content_hash=content_hash,
-                token_count=len(content.split())  # Rough estimate
-            )
+            with self._pending_lock:
+                self._pending_log.extend(pending)
+                backlog = len(self._pending_log)
             
-            # Check if compaction needed
-            self._check_compaction_needed()
+            # Errors go to disk right away, so a crash cannot lose them
+            if backlog >= LOG_FLUSH_ENTRIES or any(row[0] == "ERROR" for _, row in pending):
+                return self.flush()
             
+            _wake_writer()
             return True
         except Exception as e:
             print(f"ERROR appending to LOG.md: {e}")
             return False
     
-    def _store_log_metadata(self, entry_type: str, content_hash: str, token_count: int):
-        """Store log entry metadata in database."""
-        conn = sqlite3.connect(str(self.db_file))
-        cursor = conn.cursor()
+    def flush(self) -> bool:
+        """
+        Write buffered NOW.md content and log entries to disk.
         
-        cursor.execute(
-            "INSERT INTO log_metadata (entry_type, content_hash, token_count) VALUES (?, ?, ?)",
-            (entry_type, content_hash, token_count)
-        )
+        Returns:
+            True if successful (or nothing was pending)
+        """
+        with self._flush_lock:
+            if self._now_pending is not None and not self._write_now():
+                return False
+            
+            with self._pending_lock:
+                pending, self._pending_log = self._pending_log, []
+            if not pending:
+                return True
+            
+            try:
+                # Append to file: one write of the pre-encoded batch
+                data = b"".join(entry for entry, _ in pending)
+                log_fd = self._log_handle()
+                size_before = os.fstat(log_fd).st_size
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(log_fd, view):]
+                size_after = os.fstat(log_fd).st_size
+                self._extend_tail(data, size_before, size_after)
+                
+                # Store metadata in database
+                self._store_log_metadata([row for _, row in pending])
+                
+                # Check if compaction needed
+                if size_after > self.log_rotate_size_kb * 1024:
+                    self._rotate_log()
+                else:
+                    self._check_compaction_needed()
+                
+                return True
+            except Exception as e:
+                print(f"ERROR appending to LOG.md: {e}")
+                return False
+    
+    def _write_now(self) -> bool:
+        """Write back pending NOW.md content (caller holds _flush_lock)."""
+        content = self._now_pending
+        try:
+            self.now_file.write_text(content, encoding='utf-8')
+            stat = self.now_file.stat()
+            self._now_cache = (stat.st_mtime_ns, stat.st_size, content)
+        except Exception as e:
+            print(f"ERROR updating NOW.md: {e}")
+            return False
+        # A newer update_now() may have landed meanwhile; keep that one pending
+        with self._pending_lock:
+            if self._now_pending is content:
+                self._now_pending = None
+        return True
+    
+    def _extend_tail(self, data: bytes, size_before: int, size_after: int):
+        """Keep the LOG.md mirror in step with an append (caller holds _flush_lock)."""
+        if self._log_tail is None:
+            return
+        if size_before != self._log_size:
+            # Someone else wrote to LOG.md: rebuild on the next read
+            self._log_tail = None
+            return
+        # The last piece is the (possibly empty) text after the last separator
+        text = data.decode('utf-8')
+        self._log_tail.extend((self._log_tail.pop() + text).split('\n---\n'))
+        self._log_size = size_after
+    
+    def _log_handle(self) -> int:
+        """LOG.md descriptor opened for binary append, kept open across batches."""
+        log_fd = self._log_fd
+        if log_fd is not None and os.fstat(log_fd).st_nlink == 0:
+            # LOG.md was deleted or replaced underneath us: reopen by path
+            os.close(log_fd)
+            log_fd = None
+        if log_fd is None:
+            log_fd = self._log_fd = os.open(
+                self.log_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT | _O_BINARY, 0o644
+            )
+        return log_fd
+    
+    def close(self):
+        """
+        Write buffered entries and release the LOG.md and memory.db handles.
         
-        conn.commit()
-        conn.close()
+        The manager must not be used afterwards.
+        """
+        if self.memory_path.exists():
+            self.flush()
+        with self._flush_lock:
+            if self._log_fd is not None:
+                os.close(self._log_fd)
+                self._log_fd = None
+        with self._db_lock:
+            if getattr(self, "_db", None) is not None:
+                self._db.close()
+                self._db = None
+    
+    def __del__(self):
+        # Managers are often short-lived (one per engine run): don't drop
+        # entries still in the buffer
+        if hasattr(self, "_log_fd"):
+            self.close()
+    
+    def _store_log_metadata(self, rows: List[Tuple[str, str, int]]):
+        """Store log entry metadata rows (entry_type, content_hash, token_count)."""
+        with self._db_lock, self._db:
+            self._db.executemany(
+                "INSERT INTO log_metadata (entry_type, content_hash, token_count) VALUES (?, ?, ?)",
+                rows
+            )
     
     def _check_compaction_needed(self) -> bool:
         """Check if LOG.md needs compaction."""
@@ -320,11 +739,10 @@ class MemoryManager:
             return True
         
         # Check entry count
-        conn = sqlite3.connect(str(self.db_file))
-        cursor = conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM log_metadata WHERE compacted = 0")
-        count = cursor.fetchone()[0]
-        conn.close()
+        with self._db_lock:
+            count = self._db.execute(
+                "SELECT COUNT(*) FROM log_metadata WHERE compacted = 0"
+            ).fetchone()[0]
         
         if count > self.log_max_entries:
             print(f"LOG.md entries ({count}) exceeds limit. Triggering compaction...")
@@ -349,7 +767,7 @@ class MemoryManager:
             
             # Archive to LanceDB
             archive_id = None
-            if self.lance_db:
+            if self.lance_db is not None:
                 archive_id = f"archive_{datetime.now().timestamp()}"
                 self.store_memory(
                     content=original_content,
@@ -361,25 +779,23 @@ class MemoryManager:
                     }
                 )
             
-            # Count entries
-            conn = sqlite3.connect(str(self.db_file))
-            cursor = conn.cursor()
-            cursor.execute("SELECT COUNT(*) FROM log_metadata WHERE compacted = 0")
-            entries_count = cursor.fetchone()[0]
-            
-            # Mark all as compacted
-            cursor.execute("UPDATE log_metadata SET compacted = 1 WHERE compacted = 0")
-            
-            # Record compaction
-            cursor.execute(
-                """INSERT INTO compaction_history 
-                   (entries_count, summary, archive_id, original_size_kb) 
-                   VALUES (?, ?, ?, ?)""",
-                (entries_count, summary, archive_id, original_size)
-            )
-            
-            conn.commit()
-            conn.close()
+            with self._db_lock, self._db:
+                cursor = self._db.cursor()
+                
+                # Count entries
+                cursor.execute("SELECT COUNT(*) FROM log_metadata WHERE compacted = 0")
+                entries_count = cursor.fetchone()[0]
+                
+                # Mark all as compacted
+                cursor.execute("UPDATE log_metadata SET compacted = 1 WHERE compacted = 0")
+                
+                # Record compaction
+                cursor.execute(
+                    """INSERT INTO compaction_history 
+                       (entries_count, summary, archive_id, original_size_kb) 
+                       VALUES (?, ?, ?, ?)""",
+                    (entries_count, summary, archive_id, original_size)
+                )
             
             # Rewrite LOG.md with summary
             new_content = f"# Activity Log - {self.agent_name}\n\n"
@@ -388,15 +804,126 @@ class MemoryManager:
             new_content += "---\n\n"
             
             self.log_file.write_text(new_content, encoding='utf-8')
+            with self._flush_lock:
+                self._log_tail = None
             
             new_size = self.log_file.stat().st_size / 1024
             print(f"Compaction complete: {original_size:.2f}KB → {new_size:.2f}KB")
             
+            self._prune_log_metadata()
+            
             return True
         except Exception as e:
             print(f"ERROR during log compaction: {e}")
             return False
     
+    def rotate_log(self) -> bool:
+        """
+        Trim LOG.md to its newest entries without an LLM summary.
+        
+        Runs automatically once LOG.md exceeds log_rotate_size_kb. Entries
+        are kept newest-first within log_max_size_kb; older ERROR and
+        USER_FEEDBACK entries are always kept. The dropped entries are
+        summarized (counts per type, time span) in the new LOG.md header
+        and in compaction_history.
+        
+        Returns:
+            True if successful
+        """
+        self.flush()
+        with self._flush_lock:
+            try:
+                self._rotate_log()
+                return True
+            except Exception as e:
+                print(f"ERROR during log rotation: {e}")
+                return False
+    
+    def _rotate_log(self):
+        """rotate_log() body; caller holds _flush_lock and has flushed."""
+        content = self.log_file.read_text(encoding='utf-8')
+        original_size = len(content.encode('utf-8')) / 1024
+        _, *entries = content.split('\n---\n')
+        trailing = entries.pop() if entries and not entries[-1].strip() else ""
+        
+        # Newest entries that fit the budget
+        budget = self.log_max_size_kb * 1024
+        keep_from = len(entries)
+        used = 0
+        while keep_from > 0:
+            used += len(entries[keep_from - 1].encode('utf-8')) + 5
+            if used > budget:
+                break
+            keep_from -= 1
+        
+        kept, dropped = [], []
+        for i, entry in enumerate(entries):
+            match = _ENTRY_TYPE_RE.match(entry)
+            if i >= keep_from or (match and match.group(1) in LOG_PINNED_TYPES):
+                kept.append(entry)
+            else:
+                dropped.append(match)
+        if not dropped:
+            return
+        
+        counts: Dict[str, int] = {}
+        for match in dropped:
+            entry_type = match.group(1) if match else "OTHER"
+            counts[entry_type] = counts.get(entry_type, 0) + 1
+        times = [match.group(2) for match in dropped if match]
+        summary = f"Rotated out {len(dropped)} entries"
+        if times:
+            summary += f" from {times[0]} to {times[-1]}"
+        summary += ": " + ", ".join(f"{t} x{n}" for t, n in sorted(counts.items()))
+        
+        header = (
+            f"# Activity Log - {self.agent_name}\n\n"
+            f"Rotated: {_timestamp()}\n\n"
+            f"## Summary of Previous Activity\n\n{summary}\n"
+        )
+        new_content = '\n---\n'.join([header, *kept, trailing])
+        self.log_file.write_text(new_content, encoding='utf-8')
+        self._log_tail = None
+        
+        with self._db_lock, self._db:
+            # Metadata rows are in log order: retire the oldest ones
+            self._db.execute(
+                """UPDATE log_metadata SET compacted = 1 WHERE id IN (
+                       SELECT id FROM log_metadata WHERE compacted = 0
+                       ORDER BY id LIMIT ?)""",
+                (len(dropped),)
+            )
+            self._db.execute(
+                """INSERT INTO compaction_history 
+                   (entries_count, summary, archive_id, original_size_kb, new_size_kb) 
+                   VALUES (?, ?, NULL, ?, ?)""",
+                (len(dropped), summary, original_size, len(new_content.encode('utf-8')) / 1024)
+            )
+        
+        self._prune_log_metadata()
+    
+    def _prune_log_metadata(self, batch: int = 1000) -> int:
+        """
+        Delete compacted log_metadata rows past the retention period.
+        
+        Rows for pinned entry types are kept. Deletes at most `batch` rows
+        per call so a long backlog never holds the write lock for long.
+        
+        Returns:
+            Number of rows deleted
+        """
+        placeholders = ", ".join("?" * len(LOG_PINNED_TYPES))
+        with self._db_lock, self._db:
+            return self._db.execute(
+                f"""DELETE FROM log_metadata WHERE id IN (
+                        SELECT id FROM log_metadata
+                        WHERE compacted = 1
+                          AND timestamp < datetime('now', ?)
+                          AND entry_type NOT IN ({placeholders})
+                        LIMIT ?)""",
+                (f"-{self.log_metadata_retention_days} days", *LOG_PINNED_TYPES, batch)
+            ).rowcount
+    
     # ========================================
     # COLD MEMORY (LanceDB) - Semantic Search
     # ========================================
@@ -412,7 +939,7 @@ class MemoryManager:
         Returns:
             List of relevant memory chunks with metadata
         """
-        if not self.lance_db:
+        if self.lance_db is None:
             print("WARNING: LanceDB not available. Cannot recall from cold memory.")
             return []
         
@@ -427,20 +954,70 @@ class MemoryManager:
             query_embedding = self._get_embedding(query)
             
             # Search
-            results = tbl.search(query_embedding).limit(n_results).to_list()
+            return self._search_memories(tbl, query_embedding, n_results)
+        except Exception as e:
+            print(f"ERROR recalling memory: {e}")
+            return []
+    
+    def recall_memories(self, queries: List[str], n_results: int = 3) -> List[List[Dict[str, Any]]]:
+        """
+        Search cold memory for several queries at once.
+        
+        All query embeddings are computed in a single batched request.
+        
+        Args:
+            queries: Search queries
+            n_results: Number of results to return per query
+            
+        Returns:
+            One list of memory chunks per query, in query order
+        """
+        if self.lance_db is None:
+            print("WARNING: LanceDB not available. Cannot recall from cold memory.")
+            return [[] for _ in queries]
+        
+        try:
+            table_name = f"{self.agent_name}_memory"
+            if table_name not in self.lance_db.table_names():
+                return [[] for _ in queries]
+            
+            tbl = self.lance_db.open_table(table_name)
             
-            memories = []
-            for res in results:
-                memories.append({
-                    'content': res['text'],
-                    'metadata': json.loads(res['metadata']) if res.get('metadata') else {},
-                    'distance': res.get('_distance', 0.0)
-                })
+            all_memories = []
+            for query_embedding in self._get_embeddings(queries):
+                all_memories.append(self._search_memories(tbl, query_embedding, n_results))
             
-            return memories
+            return all_memories
         except Exception as e:
             print(f"ERROR recalling memory: {e}")
-            return []
+            return [[] for _ in queries]
+    
+    @staticmethod
+    def _search_memories(tbl, query_embedding: List[float], n_results: int) -> List[Dict[str, Any]]:
+        """
+        Nearest cold-memory chunks for one embedding.
+        
+        Only the returned columns are read, as Arrow columns, so the stored
+        vectors are never decoded into Python lists.
+        """
+        results = (
+            tbl.search(query_embedding)
+            .select(["text", "metadata", "_distance"])
+            .limit(n_results)
+            .to_arrow()
+        )
+        return [
+            {
+                'content': text,
+                'metadata': json.loads(metadata) if metadata else {},
+                'distance': distance if distance is not None else 0.0
+            }
+            for text, metadata, distance in zip(
+                results['text'].to_pylist(),
+                results['metadata'].to_pylist(),
+                results['_distance'].to_pylist()
+            )
+        ]
     
     def store_memory(self, content: str, metadata: Optional[Dict[str, Any]] = None) -> bool:
         """
@@ -453,7 +1030,7 @@ class MemoryManager:
         Returns:
             True if successful
         """
-        if not self.lance_db:
+        if self.lance_db is None:
             print("WARNING: LanceDB not available. Cannot store to cold memory.")
             return False
         
@@ -476,6 +1053,7 @@ class MemoryManager:
             if table_name in self.lance_db.table_names():
                 tbl = self.lance_db.open_table(table_name)
                 tbl.add(data)
+                self._ensure_vector_index(tbl)
             else:
                 self.lance_db.create_table(table_name, data=data)
             
@@ -484,6 +1062,46 @@ class MemoryManager:
             print(f"ERROR storing memory: {e}")
             return False
     
+    def _ensure_vector_index(self, tbl) -> None:
+        """
+        Build an HNSW index with 8-bit scalar-quantized vectors (IVF_HNSW_SQ).
+        
+        Until the table has enough rows to train the index, LanceDB does an
+        exact flat scan, which is fast at that size. SQ8 stores each vector
+        dimension in one byte instead of four, for a small recall loss that
+        top-k memory recall tolerates. The metric stays L2 so distances
+        match unindexed searches. Rows added later are still searched
+        (unindexed rows are scanned exactly).
+        """
+        if self._vector_index_checked:
+            return
+        
+        try:
+            if tbl.count_rows() < self.vector_index_min_rows:
+                return
+            
+            self._vector_index_checked = True
+            if not tbl.list_indices():
+                try:
+                    from lancedb.index import IvfHnswSq
+                except ImportError:
+                    # Older lancedb: keyword API (deprecated in newer releases)
+                    tbl.create_index(
+                        metric="L2",
+                        index_type="IVF_HNSW_SQ",
+                        m=16,
+                        ef_construction=200
+                    )
+                else:
+                    tbl.create_index(
+                        "vector",
+                        config=IvfHnswSq(distance_type="l2", m=16, ef_construction=200)
+                    )
+        except Exception as e:
+            # Don't retry on every store; flat search still works
+            self._vector_index_checked = True
+            print(f"WARNING: LanceDB vector index creation failed: {e}")
+    
     # ========================================
     # USER FACTS (SQLite) - Structured Data
     # ========================================
@@ -505,24 +1123,50 @@ class MemoryManager:
         Returns:
             True if successful
         """
-        try:
-            conn = sqlite3.connect(str(self.db_file))
-            cursor = conn.cursor()
+        return self.save_facts([(key, value, category)])
+    
+    def save_facts(self, facts: List[Tuple[str, str, str]]) -> bool:
+        """
+        Save several user facts in a single transaction.
+        
+        Args:
+            facts: List of (key, value, category) tuples
             
-            cursor.execute(
-                """INSERT OR REPLACE INTO user_facts (key, value, category, updated_at) 
-                   VALUES (?, ?, ?, CURRENT_TIMESTAMP)""",
-                (key, value, category)
-            )
+        Returns:
+            True if successful
+        """
+        if not facts:
+            return True
+        
+        try:
+            with self._db_lock, self._db:
+                # Many rows per statement; later duplicates of a key win
+                for start in range(0, len(facts), FACTS_PER_INSERT):
+                    chunk = facts[start:start + FACTS_PER_INSERT]
+                    values = ", ".join(["(?, ?, ?, CURRENT_TIMESTAMP)"] * len(chunk))
+                    self._db.execute(
+                        f"""INSERT OR REPLACE INTO user_facts (key, value, category, updated_at) 
+                            VALUES {values}""",
+                        [field for fact in chunk for field in fact]
+                    )
             
-            conn.commit()
-            conn.close()
+            # Our own commits don't bump data_version: update the snapshot
+            with self._db_lock:
+                self._facts_edits += 1
+                if self._facts_cache is not None:
+                    for key, value, category in facts:
+                        # REPLACE re-inserts the row, moving it to the end
+                        old = self._facts_cache.pop(key, None)
+                        if old is not None:
+                            self._facts_by_category[old[1]].pop(key, None)
+                        self._facts_cache[key] = (value, category)
+                        self._facts_by_category.setdefault(category, {})[key] = value
             
-            # Log the fact save
-            self.append_log(
-                entry_type="SYSTEM",
-                content=f"Saved fact: {key} = {value} (category: {category})"
-            )
+            # Log the fact saves
+            self.append_logs([
+                ("SYSTEM", f"Saved fact: {key} = {value} (category: {category})", None)
+                for key, value, category in facts
+            ])
             
             return True
         except Exception as e:
@@ -540,13 +1184,8 @@ class MemoryManager:
             Fact value or None if not found
         """
         try:
-            conn = sqlite3.connect(str(self.db_file))
-            cursor = conn.cursor()
-            
-            cursor.execute("SELECT value FROM user_facts WHERE key = ?", (key,))
-            result = cursor.fetchone()
-            
-            conn.close()
+            with self._db_lock:
+                result = self._load_facts().get(key)
             
             return result[0] if result else None
         except Exception as e:
@@ -564,58 +1203,144 @@ class MemoryManager:
             Dictionary of key-value pairs
         """
         try:
-            conn = sqlite3.connect(str(self.db_file))
-            cursor = conn.cursor()
-            
-            if category:
-                cursor.execute("SELECT key, value FROM user_facts WHERE category = ?", (category,))
-            else:
-                cursor.execute("SELECT key, value FROM user_facts")
-            
-            facts = {row[0]: row[1] for row in cursor.fetchall()}
-            
-            conn.close()
-            
-            return facts
+            with self._db_lock:
+                facts = self._load_facts()
+                if category:
+                    return dict(self._facts_by_category.get(category, {}))
+                return {key: value for key, (value, _) in facts.items()}
         except Exception as e:
             print(f"ERROR retrieving facts: {e}")
             return {}
     
+    def _load_facts(self) -> Dict[str, Tuple[str, str]]:
+        """
+        Current user_facts snapshot. Caller must hold _db_lock.
+        
+        Reads are served from memory; the table is re-read only on first use
+        or after another connection (another manager or process) committed.
+        Also refreshes _facts_by_category, the per-category view.
+        """
+        version = self._db.execute("PRAGMA data_version").fetchone()[0]
+        if self._facts_cache is None or version != self._facts_version:
+            rows = self._db.execute("SELECT key, value, category FROM user_facts").fetchall()
+            self._facts_cache = {}
+            self._facts_by_category = {}
+            for key, value, category in rows:
+                self._facts_cache[key] = (value, category)
+                self._facts_by_category.setdefault(category, {})[key] = value
+            self._facts_version = version
+        return self._facts_cache
+    
     # ========================================
     # CONTEXT INJECTION - For LLM Prompts
     # ========================================
     
-    def read_context(self) -> Dict[str, str]:
+    def read_context(self) -> Mapping[str, str]:
         """
         Read all memory context for injection into LLM prompts.
         
+        The same read-only snapshot is returned until NOW.md, LOG.md or the
+        facts change.
+        
         Returns:
-            Dictionary with 'now', 'log', and 'facts' sections
+            Mapping with 'now', 'log', and 'facts' sections
         """
-        return {
+        key = self._context_key()
+        cached = self._context_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        
+        context = MappingProxyType({
             'now': self.read_now(),
             'log': self.read_log(last_n_entries=20),  # Last 20 entries
-            'facts': json.dumps(self.get_all_facts(), indent=2)
-        }
+            'facts': _dumps_indented(self.get_all_facts())
+        })
+        # Built after the key was taken, so it is never older than the key
+        self._context_cache = (key, context)
+        return context
     
     def format_context_for_prompt(self) -> str:
         """
         Format memory context for inclusion in system prompt.
         
+        The result is cached until NOW.md, LOG.md or the facts change, so
+        repeated calls within a turn only re-validate the in-memory mirrors.
+        
         Returns:
             Formatted string ready for prompt injection
         """
         context = self.read_context()
+        cached = self._prompt_cache
+        if cached is not None and cached[0] is context:
+            return cached[1]
         
-        formatted = "=== CURRENT MENTAL STATE (Do not ignore) ===\n"
-        formatted += "You are currently working on:\n"
-        formatted += context['now'] + "\n\n"
-        
-        formatted += "=== RECENT ACTIVITY LOG ===\n"
-        formatted += context['log'] + "\n\n"
-        
+        parts = [
+            "=== CURRENT MENTAL STATE (Do not ignore) ===\n",
+            "You are currently working on:\n",
+            context['now'], "\n\n",
+            "=== RECENT ACTIVITY LOG ===\n",
+            context['log'], "\n\n",
+        ]
         if context['facts'] != "{}":
-            formatted += "=== KNOWN USER FACTS ===\n"
-            formatted += context['facts'] + "\n\n"
+            parts += ["=== KNOWN USER FACTS ===\n", context['facts'], "\n\n"]
         
+        formatted = "".join(parts)
+        self._prompt_cache = (context, formatted)
         return formatted
+    
+    def _context_key(self) -> tuple:
+        """Cheap fingerprint of the state read_context() snapshots."""
+        now = self.read_now()
+        
+        _flush_managers(self.memory_path)
+        with self._flush_lock:
+            try:
+                self._tail_entries()
+                log_size = self._log_size
+            except FileNotFoundError:
+                log_size = None
+        
+        with self._db_lock:
+            self._load_facts()
+            facts_key = (self._facts_version, self._facts_edits)
+        
+        return (now, log_size, facts_key)
+
+
+# Shared managers for get_memory_manager, least recently used first
+_SHARED_MANAGERS_MAX = 16
+_shared_managers: "OrderedDict[Tuple[str, Optional[Path]], MemoryManager]" = OrderedDict()
+_shared_managers_lock = threading.Lock()
+
+
+def get_memory_manager(agent_name: str, base_path: Optional[Path] = None) -> MemoryManager:
+    """
+    Get a shared MemoryManager for an agent.
+    
+    Memory skills are invoked many times per run; reusing one manager per
+    (agent_name, base_path) avoids re-running storage and schema setup on
+    every call. If the memory directory was deleted since (e.g. by
+    reset_test_memory), the cached manager is closed and rebuilt so writes
+    don't go to a removed database file.
+    
+    Args:
+        agent_name: Name of the agent
+        base_path: Optional base path (defaults to ./agents/<agent_name>)
+        
+    Returns:
+        Cached MemoryManager instance
+    """
+    key = (agent_name, base_path)
+    with _shared_managers_lock:
+        manager = _shared_managers.get(key)
+        if manager is not None:
+            if manager.db_file.exists():
+                _shared_managers.move_to_end(key)
+                return manager
+            manager.close()
+        
+        manager = _shared_managers[key] = MemoryManager(agent_name, base_path)
+        _shared_managers.move_to_end(key)
+        if len(_shared_managers) > _SHARED_MANAGERS_MAX:
+            _shared_managers.popitem(last=False)
+        return manager
@@ -14,7 +14,10 @@ CREATE TABLE IF NOT EXISTS user_facts (
 
 -- Index for fast fact retrieval
 CREATE INDEX IF NOT EXISTS idx_user_facts_key ON user_facts(key);
-CREATE INDEX IF NOT EXISTS idx_user_facts_category ON user_facts(category);
+-- get_all_facts(category=...) seeks on category and reads keys in order;
+-- supersedes the single-column idx_user_facts_category
+DROP INDEX IF EXISTS idx_user_facts_category;
+CREATE INDEX IF NOT EXISTS idx_user_facts_category_key ON user_facts(category, key);
 
 -- Metadata for LOG.md entries (for tracking and compaction)
 CREATE TABLE IF NOT EXISTS log_metadata (
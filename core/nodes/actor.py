@@ -6,6 +6,9 @@ import re
 from core.state import AgentState
 from core.llm import get_llm
 
+# "use/execute/run [skill] <name>" in an Actor instruction
+_SKILL_MENTION_RE = re.compile(r'(?:use|execute|run)\s+(?:skill\s+)?[\"\']?(\w[\w-]+)[\"\']?', re.IGNORECASE)
+
 def actor_node(state: AgentState):
     idx = state.get("current_step_index", 0)
     plan = state.get("plan", [])
@@ -26,7 +29,7 @@ def actor_node(state: AgentState):
     agent_instance = state.get("agent_instance")
     if agent_instance:
         # Check if instruction mentions a skill
-        skill_match = re.search(r'(?:use|execute|run)\s+(?:skill\s+)?[\"\']?(\w[\w-]+)[\"\']?', instruction, re.IGNORECASE)
+        skill_match = _SKILL_MENTION_RE.search(instruction)
         if skill_match:
             skill_name = skill_match.group(1)
             if agent_instance.registry.has_skill(skill_name):
@@ -146,7 +146,10 @@ If the user says "continue" or similar, check NOW.md to see what you should resu
                 parser_model=parser_model,
                 prompt=user_intent,
                 schema=Plan,
-                system_prompt=system_prompt
+                system_prompt=system_prompt,
+                # Memory context changes every call; key cached plans on
+                # the skills and the request only
+                cache_context=skills_context
             )
             
             print(f"\n[Planner] ✅ Generated {len(plan_obj.plan)} steps with full reasoning")
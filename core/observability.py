@@ -9,6 +9,7 @@ When Phoenix adds 3.14 support, we can upgrade to the full Phoenix experience.
 import os
 import json
 import time
+import contextvars
 from typing import Optional, Dict, Any
 from functools import wraps
 
@@ -20,8 +21,19 @@ class SimpleTracer:
     
     def __init__(self):
         self.traces = []
-        self.current_trace = None
+        # Per-context, so concurrent runs (threads, asyncio tasks) each
+        # build their own trace instead of sharing one slot
+        self._current_trace = contextvars.ContextVar(f"current_trace_{id(self)}", default=None)
         self.start_time = None
+    
+    @property
+    def current_trace(self) -> Optional[Dict[str, Any]]:
+        """The trace being recorded in the current context, if any."""
+        return self._current_trace.get()
+    
+    @current_trace.setter
+    def current_trace(self, trace: Optional[Dict[str, Any]]):
+        self._current_trace.set(trace)
         
     def start_trace(self, name: str, metadata: Optional[Dict[str, Any]] = None):
         """Start a new trace."""
@@ -37,7 +49,8 @@ class SimpleTracer:
         
     def add_span(self, span_name: str, span_type: str, details: Dict[str, Any]):
         """Add a span to the current trace."""
-        if not ENABLE_TRACING or not self.current_trace:
+        trace = self.current_trace
+        if not ENABLE_TRACING or not trace:
             return
             
         span = {
@@ -46,40 +59,44 @@ class SimpleTracer:
             "timestamp": time.time(),
             "details": details
         }
-        self.current_trace["spans"].append(span)
+        trace["spans"].append(span)
         
     def end_trace(self, status: str = "success"):
         """End the current trace."""
-        if not ENABLE_TRACING or not self.current_trace:
+        trace = self.current_trace
+        if not ENABLE_TRACING or not trace:
             return
             
-        self.current_trace["end_time"] = time.time()
-        self.current_trace["duration"] = self.current_trace["end_time"] - self.current_trace["start_time"]
-        self.current_trace["status"] = status
+        trace["end_time"] = time.time()
+        trace["duration"] = trace["end_time"] - trace["start_time"]
+        trace["status"] = status
         
-        self.traces.append(self.current_trace)
-        self._print_trace_summary(self.current_trace)
+        self.traces.append(trace)
+        self._print_trace_summary(trace)
         
         self.current_trace = None
         
     def _print_trace_summary(self, trace: Dict[str, Any]):
-        """Print a summary of the trace."""
-        print(f"\n{'='*60}")
-        print(f"📊 Trace: {trace['name']}")
-        print(f"⏱️  Duration: {trace['duration']:.3f}s")
-        print(f"✓ Status: {trace['status']}")
-        print(f"{'='*60}")
+        """Print a summary of the trace (one write, so concurrent runs don't interleave)."""
+        lines = [
+            f"\n{'='*60}",
+            f"📊 Trace: {trace['name']}",
+            f"⏱️  Duration: {trace['duration']:.3f}s",
+            f"✓ Status: {trace['status']}",
+            f"{'='*60}"
+        ]
         
         for i, span in enumerate(trace["spans"], 1):
-            print(f"\n  [{i}] {span['name']} ({span['type']})")
+            lines.append(f"\n  [{i}] {span['name']} ({span['type']})")
             if "model" in span["details"]:
-                print(f"      Model: {span['details']['model']}")
+                lines.append(f"      Model: {span['details']['model']}")
             if "tokens" in span["details"]:
-                print(f"      Tokens: {span['details']['tokens']}")
+                lines.append(f"      Tokens: {span['details']['tokens']}")
             if "prompt_length" in span["details"]:
-                print(f"      Prompt length: {span['details']['prompt_length']} chars")
+                lines.append(f"      Prompt length: {span['details']['prompt_length']} chars")
                 
-        print(f"\n{'='*60}\n")
+        lines.append(f"\n{'='*60}\n")
+        print("\n".join(lines))
     
     def get_traces(self):
         """Get all traces."""
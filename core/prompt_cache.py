@@ -0,0 +1,241 @@
+"""
+Prompt Cache - Reuse structured LLM outputs for repeated requests
+
+Two tiers, checked in order:
+- EXACT: hash of (schema, system prompt, prompt) → stored result
+- SEMANTIC: cosine similarity of prompt embeddings, within the same
+  schema + system prompt + literal values, above a threshold
+
+Literal values (quoted strings, numbers, paths/filenames) are part of the
+semantic scope, so "create a.txt" never reuses the plan for "create b.txt"
+even though their embeddings are nearly identical.
+
+Results are stored as JSON and re-validated on every hit, so callers always
+get a fresh model instance. Entries persist in SQLite and are evicted LRU.
+"""
+
+import re
+import logging
+import sqlite3
+import hashlib
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Type, TypeVar
+from pydantic import BaseModel
+
+# Optional: numpy for the semantic tier (exact tier works without it)
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T', bound=BaseModel)
+
+# Quoted strings, tokens containing a path separator or dot, and numbers
+_LITERAL_RE = re.compile(r'"[^"]*"|\'[^\']*\'|\S*[./\\]\S+|\d+(?:\.\d+)?')
+
+
+class PromptCache:
+    """
+    Exact + semantic cache of validated structured outputs.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = Path(".tmp/semantic_cache.sqlite"),
+        max_entries: int = 1000,
+        threshold: float = 0.87,
+        semantic: bool = True
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            path: SQLite file for persistence across runs. None keeps the
+                cache in memory only.
+            max_entries: Entries kept before least-recently-used eviction
+            threshold: Minimum cosine similarity for a semantic hit
+            semantic: Enable the semantic tier (needs numpy). False keeps
+                exact hits only and skips the embedding request.
+        """
+        self.path = Path(path) if path is not None else None
+        self.max_entries = max_entries
+        self.threshold = threshold
+        self.semantic = semantic and NUMPY_AVAILABLE
+
+        # key -> (scope, result_json, embedding or None), oldest first
+        self._entries: "OrderedDict[str, Tuple[str, str, Optional[list]]]" = OrderedDict()
+        # scope -> (keys, normalized embedding matrix), rebuilt on change
+        self._matrices: Dict[str, Tuple[List[str], "np.ndarray"]] = {}
+
+        self._conn = None
+        if self.path is not None:
+            self._open()
+
+    # ------------------------------------------------------------------
+    # Keys
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def make_keys(prompt: str, system_prompt: str, schema: Type[BaseModel]) -> Tuple[str, str]:
+        """
+        Compute (scope, key) for a request.
+
+        Returns:
+            scope: hash of schema, system prompt and prompt literals
+            key: hash of scope and the full prompt text
+        """
+        literals = "\x1f".join(sorted(set(_LITERAL_RE.findall(prompt))))
+        scope = hashlib.blake2b(
+            "\x1e".join((schema.__name__, system_prompt, literals)).encode("utf-8"),
+            digest_size=16
+        ).hexdigest()
+        key = hashlib.blake2b(
+            f"{scope}\x1e{prompt}".encode("utf-8"), digest_size=16
+        ).hexdigest()
+        return scope, key
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    def get(self, key: str, schema: Type[T]) -> Optional[T]:
+        """Return the cached result for an exact key, or None."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        return schema.model_validate_json(entry[1])
+
+    def get_similar(self, scope: str, embedding: list, schema: Type[T]) -> Optional[T]:
+        """
+        Return the most similar cached result in scope, or None.
+
+        Only hits when cosine similarity exceeds the threshold.
+        """
+        if not self.semantic or not embedding:
+            return None
+
+        keys, matrix = self._matrix(scope)
+        if not keys:
+            return None
+
+        query = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        if norm == 0:
+            return None
+
+        scores = matrix @ (query / norm)
+        best = int(np.argmax(scores))
+        if scores[best] <= self.threshold:
+            return None
+        return self.get(keys[best], schema)
+
+    # ------------------------------------------------------------------
+    # Store
+    # ------------------------------------------------------------------
+
+    def put(self, key: str, scope: str, result: BaseModel, embedding: Optional[list] = None):
+        """Store a validated result, evicting the oldest entry when full."""
+        result_json = result.model_dump_json()
+        self._entries[key] = (scope, result_json, embedding)
+        self._entries.move_to_end(key)
+        self._matrices.pop(scope, None)
+
+        evicted = []
+        while len(self._entries) > self.max_entries:
+            old_key, (old_scope, _, _) = self._entries.popitem(last=False)
+            self._matrices.pop(old_scope, None)
+            evicted.append((old_key,))
+
+        if self._conn is not None:
+            self._persist(key, scope, result_json, embedding, evicted)
+
+    def clear(self):
+        """Drop all entries (memory and disk)."""
+        self._entries.clear()
+        self._matrices.clear()
+        if self._conn is not None:
+            with self._conn:
+                self._conn.execute("DELETE FROM prompt_cache")
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _matrix(self, scope: str):
+        """Normalized embedding matrix for one scope (cached)."""
+        cached = self._matrices.get(scope)
+        if cached is not None:
+            return cached
+
+        keys, rows = [], []
+        for key, (entry_scope, _, embedding) in self._entries.items():
+            if entry_scope == scope and embedding:
+                keys.append(key)
+                rows.append(embedding)
+
+        if rows:
+            matrix = np.asarray(rows, dtype=np.float32)
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            matrix /= norms
+        else:
+            matrix = None
+
+        self._matrices[scope] = (keys, matrix)
+        return keys, matrix
+
+    def _open(self):
+        """Open (or create) the SQLite store and load entries LRU-first."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS prompt_cache (
+                    key TEXT PRIMARY KEY,
+                    scope TEXT NOT NULL,
+                    result TEXT NOT NULL,
+                    embedding BLOB,
+                    stored_at REAL NOT NULL
+                )
+            """)
+            rows = self._conn.execute("""
+                SELECT key, scope, result, embedding FROM prompt_cache
+                ORDER BY stored_at DESC LIMIT ?
+            """, (self.max_entries,)).fetchall()
+        except sqlite3.Error as e:
+            logger.warning("⚠️ Prompt cache persistence disabled: %s", e)
+            self._conn = None
+            return
+
+        for key, scope, result_json, blob in reversed(rows):
+            embedding = None
+            if blob is not None and NUMPY_AVAILABLE:
+                embedding = np.frombuffer(blob, dtype=np.float32).tolist()
+            self._entries[key] = (scope, result_json, embedding)
+
+    def _persist(self, key, scope, result_json, embedding, evicted):
+        """Write one entry and drop evicted keys in a single transaction."""
+        blob = None
+        if embedding and NUMPY_AVAILABLE:
+            blob = np.asarray(embedding, dtype=np.float32).tobytes()
+        try:
+            with self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO prompt_cache VALUES (?, ?, ?, ?, ?)",
+                    (key, scope, result_json, blob, time.time())
+                )
+                if evicted:
+                    self._conn.executemany(
+                        "DELETE FROM prompt_cache WHERE key = ?", evicted
+                    )
+        except sqlite3.Error as e:
+            logger.warning("⚠️ Failed to persist prompt cache entry: %s", e)
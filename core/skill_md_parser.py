@@ -1,10 +1,52 @@
 """
 Helper function to load SKILL.md from a skill directory.
-Uses PyYAML for proper frontmatter parsing.
+Uses a precompiled regex for the common flat key/value frontmatter and
+falls back to PyYAML for anything richer.
 """
 
+import re
 import yaml
-from typing import Tuple, Dict, Any
+from typing import Tuple, Dict, Any, Optional
+
+
+# Frontmatter keys the fast path understands (all plain string values)
+_FM_KEYS = ("name", "description", "category", "version", "tags")
+
+_FM_LINE_RE = re.compile(r"^(%s) *: +(\S.*?) *$" % "|".join(_FM_KEYS))
+
+# Values YAML would interpret as something other than a plain string
+# (flow collections, block scalars, quoting, anchors, comments, and
+# anything starting like a number: ints, floats, hex/octal, dates and
+# sexagesimal values such as 12:30 all resolve to non-strings), or that
+# YAML rejects (trailing colons, tabs)
+_FM_NON_PLAIN_RE = re.compile(
+    r"^[\[\]{}|>'\"&*!%@`#,?:<=-]"
+    r"|: | #|:$|\t"
+    r"|^\+?\.?\d"
+    r"|^(?:\.inf|\.nan|true|false|yes|no|on|off|null|~)$",
+    re.IGNORECASE,
+)
+
+
+def _parse_frontmatter_fast(frontmatter_text: str) -> Optional[Dict[str, Any]]:
+    """
+    Parse flat ``key: value`` frontmatter without invoking YAML.
+    
+    Returns:
+        Parsed dict, or None if the text needs the full YAML parser
+    """
+    frontmatter = {}
+    for line in frontmatter_text.splitlines():
+        if not line.strip():
+            continue
+        match = _FM_LINE_RE.match(line)
+        if match is None:
+            return None
+        key, value = match.groups()
+        if key in frontmatter or _FM_NON_PLAIN_RE.search(value):
+            return None
+        frontmatter[key] = value
+    return frontmatter
 
 
 def parse_skill_md(skill_md_path: str) -> Tuple[Dict[str, Any], str]:
@@ -36,13 +78,16 @@ def parse_skill_md(skill_md_path: str) -> Tuple[Dict[str, Any], str]:
     if len(parts) < 3:
         return {}, content
     
-    # Use PyYAML for proper parsing
     frontmatter_text = parts[1].strip()
-    try:
-        frontmatter = yaml.safe_load(frontmatter_text) or {}
-    except yaml.YAMLError as e:
-        print(f"[SkillMDParser] Warning: YAML parsing error: {e}")
-        frontmatter = {}
+    frontmatter = _parse_frontmatter_fast(frontmatter_text)
+    
+    # Slow path: use PyYAML for proper parsing
+    if frontmatter is None:
+        try:
+            frontmatter = yaml.safe_load(frontmatter_text) or {}
+        except yaml.YAMLError as e:
+            print(f"[SkillMDParser] Warning: YAML parsing error: {e}")
+            frontmatter = {}
     
     markdown_body = parts[2].strip()
     
@@ -26,12 +26,49 @@ Usage:
 import os
 import sys
 import importlib.util
-from typing import Dict, List, Optional, Any, Callable
+import functools
+from types import ModuleType
+from typing import Dict, List, Optional, Any, Callable, Tuple
 from pathlib import Path
 from dataclasses import dataclass, field
 import traceback
 
 
+# Loaded skill modules keyed by (resolved path, mtime_ns). Shared across all
+# SkillRegistry instances so each skill file is exec'd once per process
+# (re-loaded only when the file changes on disk).
+_module_cache: Dict[Tuple[str, int], ModuleType] = {}
+
+
+def _load_module(module_name: str, file_path: Path) -> Optional[ModuleType]:
+    """
+    Import a Python file as a module, reusing a previously loaded copy.
+    
+    Args:
+        module_name: Name to give the module on first load
+        file_path: Path to the Python file
+        
+    Returns:
+        Loaded module, or None if no import spec could be built
+    """
+    resolved = file_path.resolve()
+    key = (str(resolved), resolved.stat().st_mtime_ns)
+    
+    module = _module_cache.get(key)
+    if module is not None:
+        return module
+    
+    spec = importlib.util.spec_from_file_location(module_name, resolved)
+    if spec is None or spec.loader is None:
+        return None
+    
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    
+    _module_cache[key] = module
+    return module
+
+
 @dataclass
 class Skill:
     """
@@ -75,6 +112,21 @@ class Skill:
         except Exception as e:
             raise RuntimeError(f"Skill '{self.name}' execution failed: {str(e)}") from e
     
+    @functools.cached_property
+    def name_variants(self) -> Tuple[str, str]:
+        """Lowercased name, as written and with underscores as spaces (for text matching)."""
+        name = self.name.lower()
+        return name, name.replace("_", " ")
+    
+    @functools.cached_property
+    def search_text(self) -> Tuple[str, str, Tuple[str, ...]]:
+        """Lowercased name, description and tags, computed once for search_skills()."""
+        return (
+            self.name_variants[0],
+            self.description.lower(),
+            tuple(tag.lower() for tag in self.tags)
+        )
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dict for serialization."""
         return {
@@ -125,10 +177,25 @@ class SkillRegistry:
         self.agent_name = agent_name
         self._skills: Dict[str, Skill] = {}
         self._core_skills: Dict[str, Skill] = {}  # Track core skills separately
-        self._skills_by_agent: Dict[str, List[str]] = {}
-        self._skills_by_category: Dict[str, List[str]] = {}
         self._initialized = False
     
+    # Agent / category views, built from _skills on first read and dropped
+    # on register_skill(), so registering is a single dict store
+    
+    @functools.cached_property
+    def _skills_by_agent(self) -> Dict[str, List[Skill]]:
+        by_agent: Dict[str, List[Skill]] = {}
+        for skill in self._skills.values():
+            by_agent.setdefault(skill.agent, []).append(skill)
+        return by_agent
+    
+    @functools.cached_property
+    def _skills_by_category(self) -> Dict[str, List[Skill]]:
+        by_category: Dict[str, List[Skill]] = {}
+        for skill in self._skills.values():
+            by_category.setdefault(skill.category, []).append(skill)
+        return by_category
+    
     def initialize(self) -> None:
         """
         Initialize the registry with layered loading.
@@ -264,17 +331,11 @@ class SkillRegistry:
             Skill object if valid, None otherwise
         """
         try:
-            # Dynamically import the module
-            spec = importlib.util.spec_from_file_location(
-                f"skill_{file_path.stem}", 
-                file_path
-            )
-            if spec is None or spec.loader is None:
+            # Dynamically import the module (cached across registries)
+            module = _load_module(f"skill_{file_path.stem}", file_path)
+            if module is None:
                 return None
             
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-            
             # Check for required components
             if not hasattr(module, "SKILL_METADATA"):
                 print(f"[SkillRegistry] Skipping {file_path.name}: No SKILL_METADATA")
@@ -358,14 +419,11 @@ class SkillRegistry:
                     
                 # Try to load execute function
                 try:
-                    spec = importlib.util.spec_from_file_location(
+                    module = _load_module(
                         f"skill_{skill_dir.name}_{py_file.stem}",
                         py_file
                     )
-                    if spec and spec.loader:
-                        module = importlib.util.module_from_spec(spec)
-                        spec.loader.exec_module(module)
-                        
+                    if module is not None:
                         if hasattr(module, "execute"):
                             execute_func = module.execute
                             
@@ -437,17 +495,9 @@ class SkillRegistry:
         # Register
         self._skills[skill.name] = skill
         
-        # Index by agent
-        if skill.agent not in self._skills_by_agent:
-            self._skills_by_agent[skill.agent] = []
-        if skill.name not in self._skills_by_agent[skill.agent]:
-            self._skills_by_agent[skill.agent].append(skill.name)
-        
-        # Index by category
-        if skill.category not in self._skills_by_category:
-            self._skills_by_category[skill.category] = []
-        if skill.name not in self._skills_by_category[skill.category]:
-            self._skills_by_category[skill.category].append(skill.name)
+        # Agent / category views are rebuilt on next read
+        self.__dict__.pop("_skills_by_agent", None)
+        self.__dict__.pop("_skills_by_category", None)
     
     def get_skill(self, name: str) -> Optional[Skill]:
         """Get skill by name."""
@@ -463,13 +513,11 @@ class SkillRegistry:
     
     def get_skills_by_agent(self, agent: str) -> List[Skill]:
         """Get all skills owned by an agent."""
-        skill_names = self._skills_by_agent.get(agent, [])
-        return [self._skills[name] for name in skill_names]
+        return list(self._skills_by_agent.get(agent, ()))
     
     def get_skills_by_category(self, category: str) -> List[Skill]:
         """Get all skills in a category."""
-        skill_names = self._skills_by_category.get(category, [])
-        return [self._skills[name] for name in skill_names]
+        return list(self._skills_by_category.get(category, ()))
     
     def search_skills(self, query: str) -> List[Skill]:
         """
@@ -485,18 +533,20 @@ class SkillRegistry:
         matches = []
         
         for skill in self._skills.values():
+            name, description, tags = skill.search_text
+            
             # Search in name
-            if query in skill.name.lower():
+            if query in name:
                 matches.append(skill)
                 continue
             
             # Search in description
-            if query in skill.description.lower():
+            if query in description:
                 matches.append(skill)
                 continue
             
             # Search in tags
-            if any(query in tag.lower() for tag in skill.tags):
+            if any(query in tag for tag in tags):
                 matches.append(skill)
                 continue
         
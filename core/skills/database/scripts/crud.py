@@ -8,6 +8,9 @@ import os
 from typing import Any, Dict, List, Optional, Tuple
 from pathlib import Path
 
+# Database paths whose parent directory has already been created
+_ensured_dirs: set = set()
+
 # ============================================================================
 # SKILL METADATA - Required for AgentOS Skill Registry
 # ============================================================================
@@ -110,8 +113,10 @@ def execute(**params) -> Dict[str, Any]:
     many = params.get("many", False)
     
     try:
-        # Ensure database directory exists
-        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        # Ensure database directory exists (once per path)
+        if db_path not in _ensured_dirs:
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+            _ensured_dirs.add(db_path)
         
         # Connect to database
         conn = sqlite3.connect(db_path)
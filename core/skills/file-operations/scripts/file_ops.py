@@ -18,35 +18,95 @@ Usage:
 
 import json
 import csv
+import codecs
+import errno
+import mmap
 import os
 import shutil
 from pathlib import Path
-from typing import Any, Optional, List, Dict
+from typing import Any, Callable, Optional, List, Dict, Iterator, Tuple
+
+# Optional: orjson (Rust) for JSON encode/decode, stdlib json otherwise
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional: Arrow's multithreaded C++ CSV parser for large files
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
 
 
 # ============================================================================
 # READ OPERATIONS
 # ============================================================================
 
-def read_text(filepath: str, encoding: str = "utf-8") -> Optional[str]:
+# Standard comma-separated dialect, registered once at import
+CSV_DIALECT = "agentos"
+csv.register_dialect(
+    CSV_DIALECT,
+    delimiter=",",
+    quotechar='"',
+    doublequote=True,
+    skipinitialspace=False,
+    lineterminator="\n",
+    quoting=csv.QUOTE_MINIMAL,
+)
+
+
+def _readable(filepath: Optional[str]) -> bool:
+    """Cheap access(2) pre-check so missing files don't cost an exception."""
+    return bool(filepath) and os.access(filepath, os.R_OK)
+
+
+def read_text(filepath: str, encoding: str = "utf-8", max_bytes: Optional[int] = None) -> Optional[str]:
     """
     Read a text file and return its contents.
     
+    The file is read as raw bytes in one call and decoded once, which avoids
+    the per-chunk decode buffering of a text-mode handle.
+    
     Args:
         filepath: Path to the file
         encoding: File encoding (default: utf-8)
+        max_bytes: Read at most this many bytes (default: whole file)
         
     Returns:
         File contents as string, or None on error
     """
+    if not _readable(filepath):
+        print(f"[file_ops] Error reading {filepath}: not found or not readable")
+        return None
+    
     try:
-        with open(filepath, 'r', encoding=encoding) as f:
-            return f.read()
-    except Exception as e:
+        # Unbuffered binary read: readall() sizes its buffer from fstat
+        with open(filepath, 'rb', buffering=0) as f:
+            data = f.read() if max_bytes is None else f.read(max_bytes)
+        
+        if max_bytes is not None and len(data) == max_bytes:
+            # Truncated read: drop any partial multi-byte sequence at the end
+            text = codecs.getincrementaldecoder(encoding)().decode(data, final=False)
+        else:
+            text = data.decode(encoding)
+        
+        # Match text-mode universal newlines
+        if '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        return text
+    except (OSError, UnicodeDecodeError, LookupError) as e:
         print(f"[file_ops] Error reading {filepath}: {e}")
         return None
 
 
+# Files at least this large are memory-mapped instead of read into a buffer
+JSON_MMAP_THRESHOLD = 64 * 1024
+
+
 def read_json(filepath: str, encoding: str = "utf-8") -> Optional[Any]:
     """
     Read and parse a JSON file.
@@ -58,10 +118,25 @@ def read_json(filepath: str, encoding: str = "utf-8") -> Optional[Any]:
     Returns:
         Parsed JSON (dict/list), or None on error
     """
+    if not _readable(filepath):
+        print(f"[file_ops] Error reading JSON {filepath}: not found or not readable")
+        return None
+    
     try:
+        if ORJSON_AVAILABLE and encoding.lower().replace("-", "") == "utf8":
+            # orjson parses UTF-8 bytes directly, no text decode step
+            with open(filepath, 'rb') as f:
+                if os.fstat(f.fileno()).st_size < JSON_MMAP_THRESHOLD:
+                    return orjson.loads(f.read())
+                
+                # Large file: parse straight from the page cache
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    with memoryview(mm) as view:
+                        return orjson.loads(view)
+        
         with open(filepath, 'r', encoding=encoding) as f:
             return json.load(f)
-    except Exception as e:
+    except (OSError, ValueError, LookupError) as e:
         print(f"[file_ops] Error reading JSON {filepath}: {e}")
         return None
 
@@ -77,11 +152,62 @@ def read_csv(filepath: str, encoding: str = "utf-8") -> Optional[List[List[str]]
     Returns:
         List of rows (each row is a list of values), or None on error
     """
+    if not _readable(filepath):
+        print(f"[file_ops] Error reading CSV {filepath}: not found or not readable")
+        return None
+    
     try:
         with open(filepath, 'r', encoding=encoding, newline='') as f:
-            reader = csv.reader(f)
+            reader = csv.reader(f, dialect=CSV_DIALECT)
             return list(reader)
-    except Exception as e:
+    except (OSError, csv.Error, UnicodeDecodeError, LookupError) as e:
+        print(f"[file_ops] Error reading CSV {filepath}: {e}")
+        return None
+
+
+def read_csv_columns(filepath: str, encoding: str = "utf-8") -> Optional[Dict[str, List[str]]]:
+    """
+    Read a CSV file with a header row into columns.
+    
+    Returns column-major data ({header: [values...]}), which avoids building
+    one Python list per row. Uses pyarrow's CSV parser when installed and
+    falls back to the stdlib csv module otherwise. Values are always strings.
+    
+    Args:
+        filepath: Path to CSV file
+        encoding: File encoding (default: utf-8)
+        
+    Returns:
+        Dict mapping column name to list of values, or None on error
+    """
+    if not _readable(filepath):
+        print(f"[file_ops] Error reading CSV {filepath}: not found or not readable")
+        return None
+    
+    try:
+        with open(filepath, 'r', encoding=encoding, newline='') as f:
+            reader = csv.reader(f, dialect=CSV_DIALECT)
+            header = next(reader, None)
+            if header is None:
+                return {}
+            
+            if not PYARROW_AVAILABLE:
+                columns = {name: [] for name in header}
+                for row in reader:
+                    for name, value in zip(header, row):
+                        columns[name].append(value)
+                return columns
+        
+        # Pin every column to string so output matches the stdlib path
+        table = pa_csv.read_csv(
+            filepath,
+            read_options=pa_csv.ReadOptions(encoding=encoding),
+            convert_options=pa_csv.ConvertOptions(
+                column_types={name: pa.string() for name in header}
+            ),
+        )
+        return table.to_pydict()
+    except (OSError, ValueError, csv.Error, LookupError) as e:
         print(f"[file_ops] Error reading CSV {filepath}: {e}")
         return None
 
@@ -90,7 +216,35 @@ def read_csv(filepath: str, encoding: str = "utf-8") -> Optional[List[List[str]]
 # WRITE OPERATIONS
 # ============================================================================
 
-def write_text(filepath: str, content: str, encoding: str = "utf-8", create_dirs: bool = True) -> bool:
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+_APPEND_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, "O_BINARY", 0)
+
+
+def _write_bytes(filepath: str, data: bytes, create_dirs: bool = True, append: bool = False) -> None:
+    """
+    Write bytes to a file with raw os.write calls (no TextIOWrapper buffer).
+    
+    Parent directories are only created when the first open fails, so the
+    common case (directory already exists) costs no mkdir syscalls.
+    """
+    flags = _APPEND_FLAGS if append else _WRITE_FLAGS
+    try:
+        fd = os.open(filepath, flags, 0o644)
+    except FileNotFoundError:
+        if not create_dirs:
+            raise
+        os.makedirs(os.path.dirname(os.path.abspath(filepath)), exist_ok=True)
+        fd = os.open(filepath, flags, 0o644)
+    
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def write_text(filepath: str, content: str = "", encoding: str = "utf-8", create_dirs: bool = True) -> bool:
     """
     Write text to a file (overwrites existing content).
     
@@ -104,18 +258,17 @@ def write_text(filepath: str, content: str, encoding: str = "utf-8", create_dirs
         True on success, False on error
     """
     try:
-        if create_dirs:
-            Path(filepath).parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(filepath, 'w', encoding=encoding) as f:
-            f.write(content)
+        # Encode once and hand the kernel a single buffer
+        if os.linesep != "\n":
+            content = content.replace("\n", os.linesep)  # Match text-mode output
+        _write_bytes(filepath, content.encode(encoding), create_dirs)
         return True
     except Exception as e:
         print(f"[file_ops] Error writing {filepath}: {e}")
         return False
 
 
-def append_text(filepath: str, content: str, encoding: str = "utf-8") -> bool:
+def append_text(filepath: str, content: str = "", encoding: str = "utf-8") -> bool:
     """
     Append text to a file.
     
@@ -136,39 +289,135 @@ def append_text(filepath: str, content: str, encoding: str = "utf-8") -> bool:
         return False
 
 
-def write_json(filepath: str, data: Any, encoding: str = "utf-8", indent: int = 2, create_dirs: bool = True) -> bool:
+def write_json(
+    filepath: str,
+    data: Any,
+    encoding: str = "utf-8",
+    indent: Optional[int] = None,
+    create_dirs: bool = True,
+    pretty: bool = False
+) -> bool:
     """
     Write data to a JSON file.
     
+    Output is compact by default (fastest to encode, smallest on disk);
+    pass pretty=True for human-edited files.
+    
     Args:
         filepath: Path to JSON file
         data: Data to write (must be JSON-serializable)
         encoding: File encoding (default: utf-8)
-        indent: JSON indentation (default: 2)
+        indent: JSON indentation (default: None = compact)
         create_dirs: Create parent directories if they don't exist
+        pretty: Indent with 2 spaces (shorthand for indent=2)
         
     Returns:
         True on success, False on error
     """
+    if pretty and indent is None:
+        indent = 2
+    
     try:
-        if create_dirs:
-            Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+        if (
+            ORJSON_AVAILABLE
+            and indent in (None, 2)
+            and encoding.lower().replace("-", "") == "utf8"
+        ):
+            option = orjson.OPT_NON_STR_KEYS
+            if indent:
+                option |= orjson.OPT_INDENT_2
+            payload = orjson.dumps(data, option=option)
+        else:
+            separators = (",", ":") if indent is None else None
+            payload = json.dumps(data, indent=indent, separators=separators).encode(encoding)
         
-        with open(filepath, 'w', encoding=encoding) as f:
-            json.dump(data, f, indent=indent)
+        _write_bytes(filepath, payload, create_dirs)
         return True
     except Exception as e:
         print(f"[file_ops] Error writing JSON {filepath}: {e}")
         return False
 
 
+def append_json_line(filepath: str, data: Any, create_dirs: bool = True) -> bool:
+    """
+    Append data as one compact JSON line (JSON Lines format).
+    
+    Suited to log-like workloads: each call is a single small append of a
+    UTF-8 line, with no read-modify-write of the whole file.
+    
+    Args:
+        filepath: Path to .jsonl file
+        data: Data to write (must be JSON-serializable)
+        create_dirs: Create parent directories if they don't exist
+        
+    Returns:
+        True on success, False on error
+    """
+    try:
+        if ORJSON_AVAILABLE:
+            line = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+        else:
+            line = (json.dumps(data, separators=(",", ":")) + "\n").encode("utf-8")
+        
+        _write_bytes(filepath, line, create_dirs, append=True)
+        return True
+    except Exception as e:
+        print(f"[file_ops] Error appending JSON line to {filepath}: {e}")
+        return False
+
+
 # ============================================================================
 # FILE MANAGEMENT
 # ============================================================================
 
 def file_exists(filepath: str) -> bool:
     """Check if a file exists."""
-    return Path(filepath).is_file()
+    return os.path.isfile(filepath)
+
+
+def files_exist(filepaths: List[str]) -> List[bool]:
+    """
+    Check several files at once.
+    
+    Paths are grouped by parent directory; a directory holding more than one
+    of them is listed with a single os.scandir() instead of one stat() per
+    file. Single-path directories use a plain os.path.isfile().
+    
+    Args:
+        filepaths: Paths to check
+        
+    Returns:
+        List of booleans, in the same order as filepaths
+    """
+    by_dir: Dict[str, List[int]] = {}
+    for index, filepath in enumerate(filepaths):
+        by_dir.setdefault(os.path.dirname(filepath) or ".", []).append(index)
+    
+    results = [False] * len(filepaths)
+    for dirpath, indexes in by_dir.items():
+        if len(indexes) == 1:
+            results[indexes[0]] = os.path.isfile(filepaths[indexes[0]])
+            continue
+        
+        # normcase keeps lookups case-insensitive on Windows
+        wanted = {os.path.normcase(os.path.basename(filepaths[i])) for i in indexes}
+        try:
+            with os.scandir(dirpath) as entries:
+                # is_file() may stat (symlinks, some filesystems): only
+                # ask for the requested names
+                is_file = {
+                    name: e.is_file()
+                    for e in entries
+                    if (name := os.path.normcase(e.name)) in wanted
+                }
+        except OSError:
+            continue  # Missing/unreadable directory: none of its files exist
+        
+        for index in indexes:
+            name = os.path.normcase(os.path.basename(filepaths[index]))
+            results[index] = is_file.get(name, False)
+    
+    return results
 
 
 def delete_file(filepath: str) -> bool:
@@ -205,7 +454,17 @@ def move_file(src: str, dst: str, create_dirs: bool = True) -> bool:
         if create_dirs:
             Path(dst).parent.mkdir(parents=True, exist_ok=True)
         
-        shutil.move(src, dst)
+        # Same semantics as shutil.move: move into dst if it is a directory
+        if os.path.isdir(dst):
+            dst = os.path.join(dst, os.path.basename(src))
+        
+        try:
+            # Same filesystem: atomic directory-entry update, no data copy
+            os.replace(src, dst)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            shutil.move(src, dst)  # Cross-device: copy + unlink
         return True
     except Exception as e:
         print(f"[file_ops] Error moving {src} to {dst}: {e}")
@@ -228,13 +487,45 @@ def copy_file(src: str, dst: str, create_dirs: bool = True) -> bool:
         if create_dirs:
             Path(dst).parent.mkdir(parents=True, exist_ok=True)
         
-        shutil.copy2(src, dst)
+        # Same semantics as shutil.copy2: copy into dst if it is a directory
+        if os.path.isdir(dst):
+            dst = os.path.join(dst, os.path.basename(src))
+        
+        # Opening dst truncates it, so refuse before src could be emptied
+        if os.path.exists(dst) and os.path.samefile(src, dst):
+            raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+        
+        _copy_file_data(src, dst)
+        shutil.copystat(src, dst)
         return True
     except Exception as e:
         print(f"[file_ops] Error copying {src} to {dst}: {e}")
         return False
 
 
+def _copy_file_data(src: str, dst: str) -> None:
+    """
+    Copy file contents from src to dst.
+    
+    Uses os.copy_file_range (Linux) so the bytes never pass through user
+    space, falling back to a 1MB-buffer copy loop where unsupported.
+    """
+    # Python opens files O_CLOEXEC (non-inheritable) by default
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        if hasattr(os, "copy_file_range"):
+            try:
+                while os.copy_file_range(fsrc.fileno(), fdst.fileno(), 1 << 30) > 0:
+                    pass
+                return
+            except OSError:
+                # e.g. EXDEV/EINVAL on older kernels or special filesystems
+                fsrc.seek(0)
+                fdst.seek(0)
+                fdst.truncate()
+        
+        shutil.copyfileobj(fsrc, fdst, length=1 << 20)
+
+
 # ============================================================================
 # DIRECTORY OPERATIONS
 # ============================================================================
@@ -250,12 +541,33 @@ def list_dir(dirpath: str) -> Optional[List[str]]:
         List of file/directory names, or None on error
     """
     try:
-        return os.listdir(dirpath)
+        with os.scandir(dirpath) as entries:
+            return [entry.name for entry in entries]
     except Exception as e:
         print(f"[file_ops] Error listing {dirpath}: {e}")
         return None
 
 
+def iter_dir(dirpath: str) -> Iterator[os.DirEntry]:
+    """
+    Lazily iterate directory entries.
+    
+    Yields os.DirEntry objects, whose is_file()/is_dir() answers come from
+    the directory listing itself, so filtering needs no extra stat() calls.
+    
+    Args:
+        dirpath: Path to directory
+        
+    Yields:
+        os.DirEntry for each child (nothing on error)
+    """
+    try:
+        with os.scandir(dirpath) as entries:
+            yield from entries
+    except Exception as e:
+        print(f"[file_ops] Error listing {dirpath}: {e}")
+
+
 def create_dir(dirpath: str, parents: bool = True) -> bool:
     """
     Create a directory.
@@ -295,7 +607,7 @@ def delete_dir(dirpath: str) -> bool:
 
 def dir_exists(dirpath: str) -> bool:
     """Check if a directory exists."""
-    return Path(dirpath).is_dir()
+    return os.path.isdir(dirpath)
 
 
 # ============================================================================
@@ -312,10 +624,10 @@ SKILL_METADATA = {
             "required": True,
             "description": "Operation to perform",
             "options": [
-                "read_text", "read_json", "read_csv",
-                "write_text", "append_text", "write_json",
-                "file_exists", "delete_file", "move_file", "copy_file",
-                "list_dir", "create_dir", "delete_dir", "dir_exists"
+                "read_text", "read_json", "read_csv", "read_csv_columns",
+                "write_text", "append_text", "write_json", "append_json_line",
+                "file_exists", "files_exist", "delete_file", "move_file", "copy_file",
+                "list_dir", "iter_dir", "create_dir", "delete_dir", "dir_exists"
             ]
         },
         "filepath": {
@@ -323,6 +635,11 @@ SKILL_METADATA = {
             "required": False,
             "description": "File path (for file operations)"
         },
+        "filepaths": {
+            "type": "list",
+            "required": False,
+            "description": "File paths (for files_exist)"
+        },
         "dirpath": {
             "type": "string",
             "required": False,
@@ -333,6 +650,11 @@ SKILL_METADATA = {
             "required": False,
             "description": "Content to write (for write operations)"
         },
+        "max_bytes": {
+            "type": "int",
+            "required": False,
+            "description": "Maximum number of bytes to read (for read_text)"
+        },
         "data": {
             "type": "any",
             "required": False,
@@ -368,6 +690,67 @@ SKILL_METADATA = {
 }
 
 
+# Operation name -> implementing function
+_OPS = {
+    "read_text": read_text,
+    "read_json": read_json,
+    "read_csv": read_csv,
+    "read_csv_columns": read_csv_columns,
+    "write_text": write_text,
+    "append_text": append_text,
+    "write_json": write_json,
+    "append_json_line": append_json_line,
+    "file_exists": file_exists,
+    "files_exist": files_exist,
+    "delete_file": delete_file,
+    "move_file": move_file,
+    "copy_file": copy_file,
+    "list_dir": list_dir,
+    "iter_dir": iter_dir,
+    "create_dir": create_dir,
+    "delete_dir": delete_dir,
+    "dir_exists": dir_exists,
+}
+
+
+def _op_signature(func) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Return (all parameter names, parameter names without defaults)."""
+    code = func.__code__
+    params = code.co_varnames[:code.co_argcount]
+    n_required = len(params) - len(func.__defaults__ or ())
+    return params, params[:n_required]
+
+
+# Precomputed per-operation kwarg whitelist, so execute() does no introspection
+_OP_ARGS = {name: _op_signature(func) for name, func in _OPS.items()}
+
+
+def _build_dispatcher(name: str, func) -> Callable[[Dict[str, Any]], Any]:
+    """
+    Generate a dispatcher specialized to one operation's signature.
+    
+    The kwarg names and defaults are baked into generated source (the same
+    technique namedtuple/dataclasses use), so a call is one function call
+    with plain kw.get() lookups: no per-call dict building or looping.
+    Missing required args become None so the operation reports the error.
+    """
+    params, required = _OP_ARGS[name]
+    args = [
+        f"kw.get({param!r})" if index < len(required)
+        else f"kw.get({param!r}, _defaults[{index - len(required)}])"
+        for index, param in enumerate(params)
+    ]
+    source = f"def _dispatch(kw):\n    return _func({', '.join(args)})\n"
+    
+    namespace = {"_func": func, "_defaults": func.__defaults__ or ()}
+    exec(compile(source, f"<file_ops dispatch: {name}>", "exec"), namespace)
+    return namespace["_dispatch"]
+
+
+# Operation name -> specialized dispatcher
+_DISPATCH = {name: _build_dispatcher(name, func) for name, func in _OPS.items()}
+
+
 def execute(operation: str, **kwargs) -> Any:
     """
     Execute a file operation.
@@ -379,29 +762,12 @@ def execute(operation: str, **kwargs) -> Any:
     Returns:
         Result of the operation (varies by operation type)
     """
-    # Map operations to functions
-    ops = {
-        "read_text": lambda: read_text(kwargs.get("filepath"), kwargs.get("encoding", "utf-8")),
-        "read_json": lambda: read_json(kwargs.get("filepath"), kwargs.get("encoding", "utf-8")),
-        "read_csv": lambda: read_csv(kwargs.get("filepath"), kwargs.get("encoding", "utf-8")),
-        "write_text": lambda: write_text(kwargs.get("filepath"), kwargs.get("content", ""), kwargs.get("encoding", "utf-8")),
-        "append_text": lambda: append_text(kwargs.get("filepath"), kwargs.get("content", ""), kwargs.get("encoding", "utf-8")),
-        "write_json": lambda: write_json(kwargs.get("filepath"), kwargs.get("data"), kwargs.get("encoding", "utf-8")),
-        "file_exists": lambda: file_exists(kwargs.get("filepath")),
-        "delete_file": lambda: delete_file(kwargs.get("filepath")),
-        "move_file": lambda: move_file(kwargs.get("src"), kwargs.get("dst")),
-        "copy_file": lambda: copy_file(kwargs.get("src"), kwargs.get("dst")),
-        "list_dir": lambda: list_dir(kwargs.get("dirpath")),
-        "create_dir": lambda: create_dir(kwargs.get("dirpath")),
-        "delete_dir": lambda: delete_dir(kwargs.get("dirpath")),
-        "dir_exists": lambda: dir_exists(kwargs.get("dirpath")),
-    }
-    
-    if operation not in ops:
+    dispatch = _DISPATCH.get(operation)
+    if dispatch is None:
         print(f"[file_ops] Unknown operation: {operation}")
         return None
     
-    return ops[operation]()
+    return dispatch(kwargs)
 
 
 # ============================================================================
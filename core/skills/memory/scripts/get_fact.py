@@ -77,9 +77,9 @@ def execute(
         Fact value or None if not found
     """
     try:
-        from core.memory_manager import MemoryManager
+        from core.memory_manager import get_memory_manager
         
-        manager = MemoryManager(agent_name, base_path)
+        manager = get_memory_manager(agent_name, base_path)
         return manager.get_fact(key)
         
     except Exception as e:
@@ -9,7 +9,7 @@ Use this when:
 - Recording errors or system events
 """
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 from pathlib import Path
 
 
@@ -75,6 +75,17 @@ SKILL_METADATA = {
 }
 
 
+VALID_ENTRY_TYPES = ["TOOL_USE", "THOUGHT", "USER_FEEDBACK", "ERROR", "SYSTEM"]
+
+
+def _validate_entry_type(entry_type: str) -> str:
+    """Return entry_type if valid, otherwise warn and fall back to 'SYSTEM'."""
+    if entry_type not in VALID_ENTRY_TYPES:
+        print(f"WARNING: Invalid entry_type '{entry_type}'. Using 'SYSTEM'.")
+        return "SYSTEM"
+    return entry_type
+
+
 def execute(
     agent_name: str,
     entry_type: str,
@@ -85,6 +96,9 @@ def execute(
     """
     Append entry to LOG.md.
     
+    The shared MemoryManager batches the file append; ERROR entries and
+    reads of the log flush it immediately.
+    
     Args:
         agent_name: Name of the agent
         entry_type: TOOL_USE, THOUGHT, USER_FEEDBACK, ERROR, SYSTEM
@@ -96,17 +110,47 @@ def execute(
         True if successful, False otherwise
     """
     try:
-        from core.memory_manager import MemoryManager
+        from core.memory_manager import get_memory_manager
         
-        # Validate entry type
-        valid_types = ["TOOL_USE", "THOUGHT", "USER_FEEDBACK", "ERROR", "SYSTEM"]
-        if entry_type not in valid_types:
-            print(f"WARNING: Invalid entry_type '{entry_type}'. Using 'SYSTEM'.")
-            entry_type = "SYSTEM"
+        entry_type = _validate_entry_type(entry_type)
         
-        manager = MemoryManager(agent_name, base_path)
+        manager = get_memory_manager(agent_name, base_path)
         return manager.append_log(entry_type, content, metadata)
         
     except Exception as e:
         print(f"ERROR in log_activity: {e}")
         return False
+
+
+def execute_bulk(
+    agent_name: str,
+    entries: List[Tuple],
+    base_path: Optional[Path] = None
+) -> bool:
+    """
+    Write many log entries now, with one LOG.md append and one transaction.
+    
+    Prefer this over calling execute() in a loop.
+    
+    Args:
+        agent_name: Name of the agent
+        entries: List of (entry_type, content) or (entry_type, content, metadata) tuples
+        base_path: Optional base path
+        
+    Returns:
+        True if successful, False otherwise
+    """
+    try:
+        from core.memory_manager import get_memory_manager
+        
+        batch = [
+            (_validate_entry_type(entry[0]), entry[1], entry[2] if len(entry) > 2 else None)
+            for entry in entries
+        ]
+        
+        manager = get_memory_manager(agent_name, base_path)
+        return manager.append_logs(batch)
+        
+    except Exception as e:
+        print(f"ERROR in log_activity: {e}")
+        return False
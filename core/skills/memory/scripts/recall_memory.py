@@ -87,11 +87,42 @@ def execute(
         - distance: Similarity score (lower is better)
     """
     try:
-        from core.memory_manager import MemoryManager
+        from core.memory_manager import get_memory_manager
         
-        manager = MemoryManager(agent_name, base_path)
+        manager = get_memory_manager(agent_name, base_path)
         return manager.recall_memory(query, n_results)
         
     except Exception as e:
         print(f"ERROR in recall_memory: {e}")
         return []
+
+
+def execute_bulk(
+    agent_name: str,
+    queries: List[str],
+    n_results: int = 3,
+    base_path: Optional[Path] = None
+) -> List[List[Dict[str, Any]]]:
+    """
+    Search cold memory for several queries with one batched embedding call.
+    
+    Prefer this over calling execute() in a loop.
+    
+    Args:
+        agent_name: Name of the agent
+        queries: Search queries
+        n_results: Number of results to return per query
+        base_path: Optional base path
+        
+    Returns:
+        One list of memory chunks per query (see execute())
+    """
+    try:
+        from core.memory_manager import get_memory_manager
+        
+        manager = get_memory_manager(agent_name, base_path)
+        return manager.recall_memories(queries, n_results)
+        
+    except Exception as e:
+        print(f"ERROR in recall_memory: {e}")
+        return [[] for _ in queries]
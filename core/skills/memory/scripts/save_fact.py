@@ -8,7 +8,7 @@ Use this when:
 - Any information that should be permanently remembered
 """
 
-from typing import Optional
+from typing import Optional, List, Tuple
 from pathlib import Path
 
 
@@ -75,6 +75,17 @@ SKILL_METADATA = {
 }
 
 
+VALID_CATEGORIES = ["general", "preference", "personal", "config"]
+
+
+def _validate_category(category: str) -> str:
+    """Return category if valid, otherwise warn and fall back to 'general'."""
+    if category not in VALID_CATEGORIES:
+        print(f"WARNING: Invalid category '{category}'. Using 'general'.")
+        return "general"
+    return category
+
+
 def execute(
     agent_name: str,
     key: str,
@@ -96,17 +107,47 @@ def execute(
         True if successful, False otherwise
     """
     try:
-        from core.memory_manager import MemoryManager
+        from core.memory_manager import get_memory_manager
         
-        # Validate category
-        valid_categories = ["general", "preference", "personal", "config"]
-        if category not in valid_categories:
-            print(f"WARNING: Invalid category '{category}'. Using 'general'.")
-            category = "general"
+        category = _validate_category(category)
         
-        manager = MemoryManager(agent_name, base_path)
+        manager = get_memory_manager(agent_name, base_path)
         return manager.save_fact(key, value, category)
         
     except Exception as e:
         print(f"ERROR in save_fact: {e}")
         return False
+
+
+def execute_bulk(
+    agent_name: str,
+    items: List[Tuple],
+    base_path: Optional[Path] = None
+) -> bool:
+    """
+    Save many user facts in one database transaction.
+    
+    Prefer this over calling execute() in a loop.
+    
+    Args:
+        agent_name: Name of the agent
+        items: List of (key, value) or (key, value, category) tuples
+        base_path: Optional base path
+        
+    Returns:
+        True if successful, False otherwise
+    """
+    try:
+        from core.memory_manager import get_memory_manager
+        
+        facts = [
+            (item[0], item[1], _validate_category(item[2] if len(item) > 2 else "general"))
+            for item in items
+        ]
+        
+        manager = get_memory_manager(agent_name, base_path)
+        return manager.save_facts(facts)
+        
+    except Exception as e:
+        print(f"ERROR in save_fact: {e}")
+        return False
@@ -78,9 +78,9 @@ def execute(
         True if successful, False otherwise
     """
     try:
-        from core.memory_manager import MemoryManager
+        from core.memory_manager import get_memory_manager
         
-        manager = MemoryManager(agent_name, base_path)
+        manager = get_memory_manager(agent_name, base_path)
         return manager.update_now(new_status, next_steps)
         
     except Exception as e:
@@ -31,6 +31,13 @@ WORKFLOW (Step-by-Step):
 5. Parser model converts to JSON with exact field names
 6. Pydantic validates and returns typed object
 
+SINGLE-CALL MODE (OLLAMA_STRUCTURED_OUTPUT=true):
+Ollama >= 0.5 can constrain decoding to a JSON schema, so the reasoning
+model can emit the validated structure directly (reasoning goes into the
+schema's reasoning/expected_outcome fields). This skips Stage 2 entirely -
+one model call per plan instead of two. The two-stage path stays the
+default and the fallback for servers without structured outputs.
+
 WHY THIS WORKS:
 - gpt-oss:20b excels at reasoning but struggles with JSON
 - llama3.1:8b excels at JSON structure but less sophisticated reasoning
@@ -48,21 +55,180 @@ plan = client.generate_with_reasoning(
 # Returns: Plan(objective="...", plan=[PlanStep(...), ...])
 ```
 
+ASYNC / BATCH USAGE:
+```python
+plan = await client.generate_with_reasoning_async(...)   # same args
+plans = await client.generate_batch(
+    reasoning_model, parser_model, prompts=[...], schema=Plan
+)  # Stage 1 calls for all prompts overlap on one keep-alive pool
+```
+
+For many concurrent callers, BatchedTwoStageClient.submit() coalesces
+requests and caps in-flight calls at OLLAMA_NUM_PARALLEL.
+
 PRODUCTION STATUS: ✅ Ready
-DEPENDENCIES: requests, pydantic
+DEPENDENCIES: httpx, pydantic (h2 optional, enables HTTP/2)
 RELATED: core/models.py (schemas), core/nodes/planner.py (integration)
 """
 
-import requests
+import asyncio
+import atexit
+import functools
+import hashlib
+import httpx
+import itertools
 import json
+import logging
 import os
+import queue
+import re
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import TypeVar, Type, Optional
-from pydantic import BaseModel
+from typing import TypeVar, Type, Optional, List, Union, Set
+from pydantic import BaseModel, TypeAdapter
+
+from core.prompt_cache import PromptCache
+
+# Tracing is optional for this module; resolve it once at import
+try:
+    from core.observability import get_tracer
+except ImportError:
+    class _NullTracer:
+        """Stand-in when observability is unavailable."""
+        def add_span(self, *args, **kwargs):
+            pass
+    
+    _null_tracer = _NullTracer()
+    
+    def get_tracer():
+        return _null_tracer
+
+# HTTP/2 needs the optional h2 package; fall back to HTTP/1.1 keep-alive
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Optional: orjson (Rust) for request/response JSON, stdlib json otherwise
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 T = TypeVar('T', bound=BaseModel)
 
+# Progress goes to INFO; full stage outputs to DEBUG. Library callers get no
+# stdout writes unless they configure logging (the CLIs do).
+logger = logging.getLogger(__name__)
+RULE = '─' * 70
+
+# Plan-bearing lines of Stage 1 output: numbered/bulleted lines and any line
+# naming a role. Used to shrink the Stage 2 prompt when compact_reasoning is on.
+_PLAN_LINE_RE = re.compile(
+    r'^[ \t]*(?:\d+[.)]|[-*•])[ \t]+\S.*$|^.*\b(?:Actor|Auditor)\b.*$',
+    re.MULTILINE
+)
+
+# Request bodies are serialized by hand (orjson), so set the type explicitly
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Reasoning calls can run for minutes; only the connect phase is kept short
+HTTP_TIMEOUT = httpx.Timeout(300.0, connect=10.0)
+HTTP_LIMITS = httpx.Limits(
+    max_keepalive_connections=40,
+    max_connections=100,
+    keepalive_expiry=30.0
+)
+
+@functools.lru_cache(maxsize=32)
+def _adapter(schema: type) -> TypeAdapter:
+    """
+    Shared TypeAdapter per schema.
+    
+    Module-level so the planner's per-request clients reuse it. Also the
+    single place to hang validation options (e.g. strict mode) later.
+    """
+    return TypeAdapter(schema)
+
+
+@functools.lru_cache(maxsize=32)
+def _json_schema(schema: type) -> dict:
+    """
+    JSON schema per model class, generated once.
+    
+    model_json_schema() rebuilds the whole schema (refs, defs) on every
+    call. The returned dict is shared: treat it as read-only.
+    """
+    return schema.model_json_schema()
+
+
+class _OutputWriter:
+    """
+    Writes debug output files from one background thread.
+    
+    Shared by all clients (the planner creates a client per request), so
+    saving a stage output is just a queue put on the request path.
+    """
+    
+    def __init__(self):
+        self._queue: "queue.Queue" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._worker_lock = threading.Lock()
+    
+    def put(self, filepath: Path, data: bytes) -> None:
+        """Queue data to be written to filepath."""
+        self._queue.put((filepath, data))
+        self._ensure_worker()
+    
+    def join(self) -> None:
+        """Block until every queued file has been written."""
+        if self._worker is not None:
+            self._queue.join()
+    
+    def _ensure_worker(self) -> None:
+        if self._worker is not None and self._worker.is_alive():
+            return
+        with self._worker_lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._run, name="two-stage-output-writer", daemon=True
+                )
+                self._worker.start()
+    
+    def _run(self) -> None:
+        while True:
+            filepath, data = self._queue.get()
+            try:
+                filepath.write_bytes(data)
+            except OSError as e:
+                logger.warning("⚠️ Failed to save output to %s: %s", filepath, e)
+            finally:
+                self._queue.task_done()
+
+
+_output_writer = _OutputWriter()
+atexit.register(_output_writer.join)
+
+# Debug output filenames: one timestamp per process plus a sequence number,
+# so saves within the same second (both stages, concurrent plans) never
+# overwrite each other and sort in save order
+_RUN_ID = datetime.now().strftime("%Y%m%d_%H%M%S")
+_save_counter = itertools.count()
+
+# Pre-encoded separators for the debug output files
+_SAVE_RULE = b"=" * 70 + b"\n"
+_SAVE_DASHES = b"-" * 70 + b"\n"
+
+
+def flush_outputs() -> None:
+    """Wait for all queued debug output files to be written."""
+    _output_writer.join()
+
+
 class TwoStageOllamaClient:
     """
     Two-stage pipeline for structured output generation:
@@ -70,7 +236,67 @@ class TwoStageOllamaClient:
     2. Parser model structures it into JSON
     """
     
-    def __init__(self, base_url: str = None, verbose: bool = True, save_outputs: bool = True):
+    # Prompt templates, built once; only the request text is substituted
+    _REASONING_TMPL = """{system_prompt}
+
+User request: {prompt}
+
+Think through this request step-by-step and create a detailed execution plan. For each step:
+- Specify who should do it (Actor performs actions, Auditor validates)
+- Explain what needs to be done
+- Explain why it's necessary
+- Describe what success looks like
+
+Generate a comprehensive, well-reasoned plan:"""
+
+    # Stage 2 is a chat call: the static instructions are the system message
+    # so every parse shares an identical prefix the server can reuse
+    # (prompt/KV cache), and only the reasoning plan varies per call.
+    _PARSER_SYSTEM_PROMPT = """Convert the reasoning plan you are given into valid JSON.
+
+REQUIRED JSON STRUCTURE:
+{
+  "objective": "brief description of the overall goal",
+  "plan": [
+    {
+      "role": "Actor or Auditor",
+      "instruction": "what to do",
+      "reasoning": "why it's needed (optional)",
+      "expected_outcome": "what success looks like (optional)"
+    }
+  ],
+  "total_steps": number
+}
+
+CRITICAL RULES:
+- Use EXACTLY these field names: "objective", "plan", "role", "instruction", "reasoning", "expected_outcome", "total_steps"
+- "role" must be EITHER "Actor" OR "Auditor" - no other values
+- Each step must have "role" and "instruction" at minimum
+- Maintain the reasoning and expected outcomes from the original plan"""
+
+    _PARSING_TMPL = """REASONING PLAN:
+{reasoning}
+
+Generate the JSON now:"""
+
+    _STRUCTURED_TMPL = """{system_prompt}
+
+User request: {prompt}
+
+Think through this request step-by-step and create a detailed execution plan. For each step:
+- Specify who should do it (Actor performs actions, Auditor validates)
+- Explain what needs to be done, why it's necessary (reasoning) and what success looks like (expected_outcome)
+
+Respond with JSON only."""
+    
+    def __init__(
+        self,
+        base_url: str = None,
+        verbose: bool = True,
+        save_outputs: bool = True,
+        cache: Union[PromptCache, bool, None] = None,
+        use_structured_grammar: Optional[bool] = None
+    ):
         """
         Initialize client.
         
@@ -78,16 +304,70 @@ class TwoStageOllamaClient:
             base_url: Ollama server URL. If None, loads from config.
             verbose: If True, print full outputs. If False, print summaries only.
             save_outputs: If True, save outputs to .tmp/llm_outputs/
+            cache: PromptCache to reuse results for repeated/paraphrased
+                prompts. True uses an exact-match cache in the default
+                .tmp/semantic_cache.sqlite, False disables caching. If None,
+                loads from config (PROMPT_CACHE).
+            use_structured_grammar: If True, generate_with_reasoning makes one
+                schema-constrained call instead of two stages. If None,
+                loads from config (OLLAMA_STRUCTURED_OUTPUT).
         """
+        from core.config import config, normalize_ollama_url
         if base_url is None:
-            from core.config import config
             base_url = config.OLLAMA_BASE_URL
         
+        # Keep both models resident between stages and between plans
+        self.keep_alive = config.OLLAMA_KEEP_ALIVE
+        # Only preload the parser during Stage 1 if the server can hold both
+        self.preload_parser = config.OLLAMA_MAX_LOADED_MODELS >= 2
+        self.embedding_model = config.EMBEDDING_MODEL
+        if use_structured_grammar is None:
+            use_structured_grammar = config.OLLAMA_STRUCTURED_OUTPUT
+        self.use_structured_grammar = use_structured_grammar
+        
+        if cache is None:
+            cache = config.PROMPT_CACHE
+        if cache is True:
+            # Paraphrase hits only check literals, so "delete hello.txt" could
+            # reuse the plan for "create hello.txt"; pass a PromptCache
+            # explicitly to opt into the semantic tier
+            cache = PromptCache(semantic=False)
+        self.cache: Optional[PromptCache] = cache if cache is not False else None
+        
         # Remove /v1 or /api suffix if present for consistency
-        self.base_url = base_url.rstrip('/v1').rstrip('/api').rstrip('/')
+        self.base_url = normalize_ollama_url(base_url)
+        self._generate_url = f"{self.base_url}/api/generate"
+        self._chat_url = f"{self.base_url}/api/chat"
+        self._embed_url = f"{self.base_url}/api/embed"
         self.verbose = verbose
         self.save_outputs = save_outputs
         
+        # Transient failures (connection errors, 5xx while a model loads or
+        # OOMs) are retried with exponential backoff: 1s, 2s, ... capped
+        self.retry_attempts = 3
+        self.retry_base_delay = 1.0
+        self.retry_max_delay = 10.0
+        
+        # Opt-in: Stage 1 output is kept until its plan validates, so a
+        # failed Stage 2 can be rerun without redoing the reasoning. A kept
+        # file is reused once (a reasoning output that breaks Stage 2 is not
+        # replayed forever) and only while younger than the max age.
+        self.reuse_stage1 = False
+        self.stage1_cache_dir = Path(".tmp/stage1_cache")
+        self.stage1_cache_max_age = 3600.0
+        
+        # Send Stage 2 only the plan-bearing lines of the reasoning (steps,
+        # bullets, role lines) instead of the full text. Cuts parser prefill
+        # several-fold but drops free-form prose, so it is opt-in.
+        self.compact_reasoning = False
+        
+        # Tracer for observability (global instance, looked up once)
+        self._tracer = get_tracer()
+        
+        # Async HTTP client, created lazily inside the running event loop
+        self._client: Optional[httpx.AsyncClient] = None
+        self._transport: Optional[httpx.AsyncBaseTransport] = None
+        
         # Create output directory
         if self.save_outputs:
             self.output_dir = Path(".tmp/llm_outputs")
@@ -99,7 +379,67 @@ class TwoStageOllamaClient:
         parser_model: str,
         prompt: str,
         schema: Type[T],
+        system_prompt: str = "",
+        cache_context: Optional[str] = None
+    ) -> T:
+        """
+        Two-stage generation: reasoning → parsing (blocking).
+        
+        Thin wrapper that runs generate_with_reasoning_async in a fresh
+        event loop. Must not be called from inside a running loop - await
+        generate_with_reasoning_async there instead.
+        
+        Returns:
+            Validated Pydantic model instance
+        """
+        return asyncio.run(self._run_and_close(
+            self.generate_with_reasoning_async(
+                reasoning_model=reasoning_model,
+                parser_model=parser_model,
+                prompt=prompt,
+                schema=schema,
+                system_prompt=system_prompt,
+                cache_context=cache_context
+            )
+        ))
+    
+    async def generate_batch(
+        self,
+        reasoning_model: str,
+        parser_model: str,
+        prompts: List[str],
+        schema: Type[T],
         system_prompt: str = ""
+    ) -> List[T]:
+        """
+        Run the two-stage pipeline for several prompts concurrently.
+        
+        Each prompt still goes reasoning → parsing in order, but the
+        pipelines overlap, so the Stage 1 calls share the connection pool
+        instead of queueing behind one another on the client side.
+        
+        Returns:
+            Validated Pydantic model instances, in the order of prompts
+        """
+        return await asyncio.gather(*[
+            self.generate_with_reasoning_async(
+                reasoning_model=reasoning_model,
+                parser_model=parser_model,
+                prompt=prompt,
+                schema=schema,
+                system_prompt=system_prompt
+            )
+            for prompt in prompts
+        ])
+    
+    async def generate_with_reasoning_async(
+        self,
+        reasoning_model: str,
+        parser_model: str,
+        prompt: str,
+        schema: Type[T],
+        system_prompt: str = "",
+        cache_context: Optional[str] = None
     ) -> T:
         """
         Two-stage generation: reasoning → parsing.
@@ -110,28 +450,55 @@ class TwoStageOllamaClient:
             prompt: User's request
             schema: Pydantic model to validate against
             system_prompt: Optional system instructions
+            cache_context: Stable part of the system prompt to key the
+                prompt cache on. If None, the whole system prompt is used;
+                pass this when the system prompt carries per-call context
+                (timestamps, recent log lines) that would never repeat.
             
         Returns:
             Validated Pydantic model instance
         """
-        # Get tracer for observability
-        from core.observability import get_tracer
-        tracer = get_tracer()
+        tracer = self._tracer
+        
+        # Skip both stages for a repeated or paraphrased request
+        embedding = None
+        if self.cache is not None:
+            scope, cache_key = self.cache.make_keys(
+                prompt, system_prompt if cache_context is None else cache_context, schema
+            )
+            cached = self.cache.get(cache_key, schema)
+            if cached is None and self.cache.semantic:
+                embedding = await self._embed(prompt)
+                cached = self.cache.get_similar(scope, embedding, schema)
+            if cached is not None:
+                logger.info("♻️ Prompt cache hit - skipping reasoning and parsing")
+                tracer.add_span(
+                    span_name="Prompt Cache Hit",
+                    span_type="cache",
+                    details={"schema": schema.__name__}
+                )
+                return cached
+        
+        if self.use_structured_grammar:
+            result = await self.generate_structured_async(
+                model=reasoning_model,
+                prompt=prompt,
+                schema=schema,
+                system_prompt=system_prompt
+            )
+            if self.cache is not None:
+                self.cache.put(cache_key, scope, result, embedding)
+            return result
+        
+        # Load the parser model while the reasoning model is busy
+        preload = None
+        if self.preload_parser and parser_model != reasoning_model:
+            preload = asyncio.create_task(self.warmup(parser_model))
         
         # STAGE 1: Reasoning model generates detailed plan
-        print(f"\n[Stage 1] 🧠 {reasoning_model} - Generating reasoning plan...")
+        logger.info("[Stage 1] 🧠 %s - Generating reasoning plan...", reasoning_model)
         
-        reasoning_prompt = f"""{system_prompt}
-
-User request: {prompt}
-
-Think through this request step-by-step and create a detailed execution plan. For each step:
-- Specify who should do it (Actor performs actions, Auditor validates)
-- Explain what needs to be done
-- Explain why it's necessary
-- Describe what success looks like
-
-Generate a comprehensive, well-reasoned plan:"""
+        reasoning_prompt = self._REASONING_TMPL.format(system_prompt=system_prompt, prompt=prompt)
 
         # Trace Stage 1
         tracer.add_span(
@@ -144,25 +511,42 @@ Generate a comprehensive, well-reasoned plan:"""
             }
         )
         
-        stage1_response = self._call_ollama(
-            model=reasoning_model,
-            prompt=reasoning_prompt,
-            json_mode=False  # Let it reason naturally
-        )
+        stage1_path = None
+        stage1_response = None
+        if self.reuse_stage1:
+            digest = hashlib.blake2b(
+                f"{reasoning_model}\x1e{reasoning_prompt}".encode("utf-8"), digest_size=16
+            ).hexdigest()
+            stage1_path = self.stage1_cache_dir / f"{digest}.txt"
+            stage1_response = self._take_stage1(stage1_path)
         
-        print(f"✅ Generated reasoning ({len(stage1_response)} chars)")
+        if stage1_response is not None:
+            logger.info("♻️ Reusing Stage 1 reasoning from %s", stage1_path)
+        else:
+            stage1_response = await self._call_ollama(
+                model=reasoning_model,
+                prompt=reasoning_prompt,
+                json_mode=False,  # Let it reason naturally
+                stream=True
+            )
+            if stage1_path is not None:
+                try:
+                    stage1_path.parent.mkdir(parents=True, exist_ok=True)
+                    self._prune_stage1_cache()
+                    stage1_path.write_text(stage1_response, encoding="utf-8")
+                except OSError as e:
+                    logger.warning("⚠️ Failed to cache Stage 1 reasoning: %s", e)
         
-        # Display full output if verbose
+        logger.info("✅ Generated reasoning (%d chars)", len(stage1_response))
+        
+        # Display full output if verbose (DEBUG), otherwise a short preview
         if self.verbose:
-            print(f"\n{'─'*70}")
-            print("FULL REASONING OUTPUT:")
-            print(f"{'─'*70}")
-            print(stage1_response)
-            print(f"{'─'*70}\n")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("FULL REASONING OUTPUT:\n%s\n%s\n%s", RULE, stage1_response, RULE)
         else:
-            print(f"Preview: {stage1_response[:1000]}...\n")
+            logger.info("Preview: %s...", stage1_response[:1000])
         
-        # Save Stage 1 output
+        # Save Stage 1 output (queued to the writer thread; Stage 2 starts now)
         if self.save_outputs:
             self._save_output(
                 stage="stage1_reasoning",
@@ -171,35 +555,21 @@ Generate a comprehensive, well-reasoned plan:"""
                 prompt=reasoning_prompt
             )
         
+        if preload is not None:
+            await preload
+        
         # STAGE 2: Parser model structures the reasoning into JSON
-        print(f"\n[Stage 2] 🔧 {parser_model} - Parsing into structured format...")
+        logger.info("[Stage 2] 🔧 %s - Parsing into structured format...", parser_model)
         
-        parsing_prompt = f"""Convert the following reasoning plan into valid JSON.
-
-REASONING PLAN:
-{stage1_response}
-
-REQUIRED JSON STRUCTURE:
-{{
-  "objective": "brief description of the overall goal",
-  "plan": [
-    {{
-      "role": "Actor or Auditor",
-      "instruction": "what to do",
-      "reasoning": "why it's needed (optional)",
-      "expected_outcome": "what success looks like (optional)"
-    }}
-  ],
-  "total_steps": number
-}}
-
-CRITICAL RULES:
-- Use EXACTLY these field names: "objective", "plan", "role", "instruction", "reasoning", "expected_outcome", "total_steps"
-- "role" must be EITHER "Actor" OR "Auditor" - no other values
-- Each step must have "role" and "instruction" at minimum
-- Maintain the reasoning and expected outcomes from the original plan
-
-Generate the JSON now:"""
+        reasoning_text = stage1_response
+        if self.compact_reasoning:
+            reasoning_text = self._compact_reasoning(stage1_response)
+            logger.info("✂️ Compacted reasoning %d → %d chars", len(stage1_response), len(reasoning_text))
+        parsing_prompt = self._PARSING_TMPL.format(reasoning=reasoning_text)
+        parsing_messages = [
+            {"role": "system", "content": self._PARSER_SYSTEM_PROMPT},
+            {"role": "user", "content": parsing_prompt}
+        ]
 
         # Trace Stage 2
         tracer.add_span(
@@ -207,31 +577,30 @@ Generate the JSON now:"""
             span_type="llm",
             details={
                 "model": parser_model,
-                "prompt_length": len(parsing_prompt),
+                "prompt_length": len(self._PARSER_SYSTEM_PROMPT) + len(parsing_prompt),
                 "stage": "parsing"
             }
         )
         
-        stage2_response = self._call_ollama(
+        stage2_response = await self._chat_ollama(
             model=parser_model,
-            prompt=parsing_prompt,
+            messages=parsing_messages,
             json_mode=True  # Force JSON output
         )
         
-        print(f"✅ Parsed JSON ({len(stage2_response)} chars)")
+        logger.info("✅ Parsed JSON (%d chars)", len(stage2_response))
         
-        # Display full JSON if verbose
-        if self.verbose:
-            print(f"\n{'─'*70}")
-            print("FULL JSON OUTPUT:")
-            print(f"{'─'*70}")
+        # Display full JSON if verbose (DEBUG). The parsed object is reused
+        # for validation below so the body is only parsed once either way.
+        parsed = None
+        if self.verbose and logger.isEnabledFor(logging.DEBUG):
             # Pretty print JSON
             try:
-                parsed = json.loads(stage2_response)
-                print(json.dumps(parsed, indent=2))
-            except:
-                print(stage2_response)
-            print(f"{'─'*70}\n")
+                parsed = self._loads(stage2_response)
+                pretty = self._dumps_pretty(parsed)
+            except ValueError:
+                pretty = stage2_response
+            logger.debug("FULL JSON OUTPUT:\n%s\n%s\n%s", RULE, pretty, RULE)
         
         # Save Stage 2 output
         if self.save_outputs:
@@ -239,58 +608,465 @@ Generate the JSON now:"""
                 stage="stage2_json",
                 model=parser_model,
                 content=stage2_response,
-                prompt=parsing_prompt
+                prompt=f"{self._PARSER_SYSTEM_PROMPT}\n\n{parsing_prompt}"
+            )
+        
+        # Validate and return (pydantic-core parses the raw JSON itself
+        # unless the verbose branch already did)
+        try:
+            if parsed is not None:
+                result = _adapter(schema).validate_python(parsed)
+            else:
+                result = _adapter(schema).validate_json(stage2_response)
+        except Exception as e:
+            logger.error("❌ Validation error: %s\nRaw JSON: %s", e, stage2_response[:500])
+            raise
+        
+        if self.cache is not None:
+            self.cache.put(cache_key, scope, result, embedding)
+        if stage1_path is not None:
+            stage1_path.unlink(missing_ok=True)
+        
+        return result
+    
+    def _take_stage1(self, path: Path) -> Optional[str]:
+        """
+        Return kept Stage 1 reasoning and remove it, or None.
+        
+        Removing on read caps reuse at one rerun; files older than
+        stage1_cache_max_age are dropped unread.
+        """
+        try:
+            fresh = time.time() - path.stat().st_mtime < self.stage1_cache_max_age
+            text = path.read_text(encoding="utf-8") if fresh else None
+            path.unlink()
+        except OSError:
+            return None
+        return text
+    
+    def _prune_stage1_cache(self):
+        """Delete kept Stage 1 files older than stage1_cache_max_age."""
+        cutoff = time.time() - self.stage1_cache_max_age
+        for path in self.stage1_cache_dir.glob("*.txt"):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+            except OSError:
+                pass
+    
+    def generate_structured(
+        self,
+        model: str,
+        prompt: str,
+        schema: Type[T],
+        system_prompt: str = ""
+    ) -> T:
+        """Blocking wrapper around generate_structured_async."""
+        return asyncio.run(self._run_and_close(
+            self.generate_structured_async(
+                model=model,
+                prompt=prompt,
+                schema=schema,
+                system_prompt=system_prompt
+            )
+        ))
+    
+    async def generate_structured_async(
+        self,
+        model: str,
+        prompt: str,
+        schema: Type[T],
+        system_prompt: str = ""
+    ) -> T:
+        """
+        Single-call generation constrained by the schema's JSON schema.
+        
+        Requires Ollama >= 0.5 (structured outputs). The model reasons
+        inside the schema's own fields, so no parser stage is needed.
+        
+        Args:
+            model: Model to generate with (e.g., gpt-oss:20b)
+            prompt: User's request
+            schema: Pydantic model to validate against
+            system_prompt: Optional system instructions
+            
+        Returns:
+            Validated Pydantic model instance
+        """
+        tracer = self._tracer
+        
+        logger.info("[Structured] 🧠 %s - Generating schema-constrained plan...", model)
+        
+        structured_prompt = self._STRUCTURED_TMPL.format(system_prompt=system_prompt, prompt=prompt)
+        
+        tracer.add_span(
+            span_name="Structured Output Model",
+            span_type="llm",
+            details={
+                "model": model,
+                "prompt_length": len(structured_prompt),
+                "stage": "structured"
+            }
+        )
+        
+        response = await self._call_ollama(
+            model=model,
+            prompt=structured_prompt,
+            json_schema=_json_schema(schema)
+        )
+        
+        logger.info("✅ Generated JSON (%d chars)", len(response))
+        
+        if self.save_outputs:
+            self._save_output(
+                stage="structured_json",
+                model=model,
+                content=response,
+                prompt=structured_prompt
             )
         
-        # Validate and return
         try:
-            return schema.model_validate_json(stage2_response)
+            return _adapter(schema).validate_json(response)
         except Exception as e:
-            print(f"❌ Validation error: {e}")
-            print(f"Raw JSON: {stage2_response[:500]}")
+            logger.error("❌ Validation error: %s\nRaw JSON: %s", e, response[:500])
             raise
     
     def _save_output(self, stage: str, model: str, content: str, prompt: str):
-        """Save LLM output to file for debugging."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{timestamp}_{stage}_{model.replace(':', '_')}.txt"
+        """Queue LLM output to be saved to file for debugging (non-blocking)."""
+        seq = next(_save_counter)
+        filename = f"{_RUN_ID}_{seq:04d}_{stage}_{model.replace(':', '_')}.txt"
         filepath = self.output_dir / filename
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(f"=" * 70 + "\n")
-            f.write(f"Stage: {stage}\n")
-            f.write(f"Model: {model}\n")
-            f.write(f"Timestamp: {timestamp}\n")
-            f.write(f"=" * 70 + "\n\n")
-            f.write("PROMPT:\n")
-            f.write(f"{'-' * 70}\n")
-            f.write(prompt)
-            f.write(f"\n{'-' * 70}\n\n")
-            f.write("OUTPUT:\n")
-            f.write(f"{'-' * 70}\n")
-            f.write(content)
-            f.write(f"\n{'-' * 70}\n")
-        
-        print(f"💾 Saved output to: {filepath}")
-    
-    def _call_ollama(self, model: str, prompt: str, json_mode: bool = False) -> str:
-        """Internal method to call Ollama API."""
-        url = f"{self.base_url}/api/generate"
+        data = b"".join([
+            _SAVE_RULE,
+            f"Stage: {stage}\nModel: {model}\nRun: {_RUN_ID} #{seq}\n".encode('utf-8'),
+            _SAVE_RULE,
+            b"\nPROMPT:\n",
+            _SAVE_DASHES,
+            prompt.encode('utf-8'),
+            b"\n", _SAVE_DASHES,
+            b"\nOUTPUT:\n",
+            _SAVE_DASHES,
+            content.encode('utf-8'),
+            b"\n", _SAVE_DASHES,
+        ])
+        _output_writer.put(filepath, data)
+        
+        logger.info("💾 Saving output to: %s", filepath)
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the pooled async client, creating it on first use."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
+                timeout=HTTP_TIMEOUT,
+                limits=HTTP_LIMITS,
+                transport=self._transport
+            )
+        return self._client
+    
+    async def aclose(self):
+        """Close the pooled HTTP client (safe to call more than once)."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
+    async def _run_and_close(self, coro):
+        """
+        Await coro, then close the client.
+        
+        Pooled connections are bound to the event loop that opened them, so
+        the sync wrapper must not leak them past its own asyncio.run().
+        """
+        try:
+            return await coro
+        finally:
+            await self.aclose()
+    
+    async def warmup(self, *models: str):
+        """
+        Ask Ollama to load models and keep them resident for keep_alive.
+        
+        A request without a prompt only loads the model. Best effort: a
+        failure here just means the real call pays the load time.
+        """
+        url = self._generate_url
+        
+        async def _load(model: str):
+            try:
+                response = await self._post_json(
+                    url, {"model": model, "keep_alive": self.keep_alive}
+                )
+                response.raise_for_status()
+            except httpx.HTTPError as e:
+                logger.warning("⚠️ Warmup of %s failed: %s", model, e)
+        
+        await asyncio.gather(*[_load(m) for m in models])
+    
+    async def _embed(self, text: str) -> Optional[list]:
+        """Embed text for the semantic cache. Returns None on failure."""
+        try:
+            response = await self._post_json(
+                self._embed_url,
+                {"model": self.embedding_model, "input": text}
+            )
+            response.raise_for_status()
+            embeddings = self._loads(response.content).get("embeddings")
+            return embeddings[0] if embeddings else None
+        except (httpx.HTTPError, ValueError) as e:
+            logger.warning("⚠️ Prompt embedding failed, semantic cache skipped: %s", e)
+            return None
+    
+    async def _call_ollama(
+        self,
+        model: str,
+        prompt: str,
+        json_mode: bool = False,
+        stream: bool = False,
+        json_schema: Optional[dict] = None
+    ) -> str:
+        """
+        Internal method to call Ollama API.
+        
+        With stream=True the response is read as NDJSON chunks and joined.
+        The read timeout then applies per chunk instead of to the whole
+        generation, so long reasoning runs are not cut off while tokens
+        are still flowing. json_schema constrains the output to that schema
+        (takes precedence over json_mode).
+        """
+        url = self._generate_url
         
         payload = {
             "model": model,
             "prompt": prompt,
-            "stream": False
+            "stream": stream,
+            "keep_alive": self.keep_alive
         }
         
-        if json_mode:
+        if json_schema is not None:
+            payload["format"] = json_schema
+        elif json_mode:
             payload["format"] = "json"
         
-        response = requests.post(url, json=payload, timeout=180)
-        response.raise_for_status()
+        if stream:
+            return await self._with_retries(self._stream_ollama, url, payload)
         
-        result = response.json()
+        result = await self._with_retries(self._request_json, url, payload)
         return result.get('response', '')
+    
+    async def _chat_ollama(self, model: str, messages: List[dict], json_mode: bool = False) -> str:
+        """Internal method to call Ollama's /api/chat and return the reply text."""
+        url = self._chat_url
+        
+        payload = {
+            "model": model,
+            "messages": messages,
+            "stream": False,
+            "keep_alive": self.keep_alive
+        }
+        
+        if json_mode:
+            payload["format"] = "json"
+        
+        result = await self._with_retries(self._request_json, url, payload)
+        return result.get('message', {}).get('content', '')
+    
+    async def _stream_ollama(self, url: str, payload: dict) -> str:
+        """Collect a streamed /api/generate response into one string."""
+        parts = []
+        async with self._get_client().stream(
+            "POST", url, content=self._dumps(payload), headers=JSON_HEADERS
+        ) as response:
+            if not response.is_success:
+                response.raise_for_status()
+            async for line in response.aiter_lines():
+                if not line:
+                    continue
+                chunk = self._loads(line)
+                if "error" in chunk:
+                    raise RuntimeError(f"Ollama stream error: {chunk['error']}")
+                parts.append(chunk.get("response", ""))
+                if chunk.get("done"):
+                    break
+        return "".join(parts)
+    
+    @staticmethod
+    def _compact_reasoning(text: str) -> str:
+        """
+        Keep only the plan-bearing lines of a reasoning text.
+        
+        Falls back to the full text when no role is mentioned, since the
+        skeleton would then not describe a plan the parser can use.
+        """
+        lines = [m.group(0).strip() for m in _PLAN_LINE_RE.finditer(text)]
+        compact = "\n".join(lines)
+        if "Actor" not in compact and "Auditor" not in compact:
+            return text
+        return compact
+    
+    async def _with_retries(self, func, *args):
+        """
+        Await func(*args), retrying transient HTTP failures.
+        
+        Connection errors and 5xx responses are retried up to
+        retry_attempts times in total with exponential backoff; 4xx
+        responses (bad model name, bad request) fail immediately.
+        """
+        for attempt in range(1, self.retry_attempts + 1):
+            try:
+                return await func(*args)
+            except (httpx.TransportError, httpx.HTTPStatusError) as e:
+                if isinstance(e, httpx.HTTPStatusError) and e.response.status_code < 500:
+                    raise
+                if attempt >= self.retry_attempts:
+                    raise
+                delay = min(self.retry_max_delay, self.retry_base_delay * 2 ** (attempt - 1))
+                logger.warning(
+                    "⚠️ Ollama request failed (%s), retry %d/%d in %.1fs",
+                    e, attempt, self.retry_attempts - 1, delay
+                )
+                await asyncio.sleep(delay)
+    
+    async def _request_json(self, url: str, payload: dict) -> dict:
+        """POST payload and return the decoded JSON body (raises on HTTP errors)."""
+        response = await self._post_json(url, payload)
+        # Status check inlined: raise_for_status is only entered on errors
+        if not response.is_success:
+            response.raise_for_status()
+        return self._loads(response.content)
+    
+    async def _post_json(self, url: str, payload: dict) -> httpx.Response:
+        """POST payload as JSON, serialized with orjson when available."""
+        return await self._get_client().post(
+            url, content=self._dumps(payload), headers=JSON_HEADERS
+        )
+    
+    @staticmethod
+    def _dumps(payload) -> bytes:
+        """Serialize a request payload to UTF-8 JSON bytes."""
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(payload)
+        return json.dumps(payload, ensure_ascii=False).encode('utf-8')
+    
+    @staticmethod
+    def _loads(data):
+        """Parse JSON from str or bytes (orjson when available)."""
+        if ORJSON_AVAILABLE:
+            return orjson.loads(data)
+        return json.loads(data)
+    
+    @staticmethod
+    def _dumps_pretty(obj) -> str:
+        """Serialize obj as 2-space indented JSON for display."""
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+        return json.dumps(obj, indent=2)
+
+
+class BatchedTwoStageClient:
+    """
+    Coalesces concurrent plan requests and runs them with bounded concurrency.
+    
+    Requests submitted within `window` seconds of each other are released
+    together, at most `max_parallel` at a time (matching the server's
+    OLLAMA_NUM_PARALLEL), so Ollama can batch them instead of N callers
+    racing for the model or overrunning its request queue.
+    
+    Usage:
+        batcher = BatchedTwoStageClient()
+        plans = await asyncio.gather(*[
+            batcher.submit(reasoning_model, parser_model, p, Plan) for p in prompts
+        ])
+        await batcher.aclose()
+    """
+    
+    def __init__(
+        self,
+        client: Optional[TwoStageOllamaClient] = None,
+        max_parallel: Optional[int] = None,
+        window: float = 0.01
+    ):
+        """
+        Initialize batcher.
+        
+        Args:
+            client: Client to run requests on. If None, a default client.
+            max_parallel: Concurrent requests. If None, loads from config
+                (OLLAMA_NUM_PARALLEL).
+            window: Seconds to collect requests before releasing them
+        """
+        if max_parallel is None:
+            from core.config import config
+            max_parallel = config.OLLAMA_NUM_PARALLEL
+        
+        self.client = client or TwoStageOllamaClient()
+        self.max_parallel = max(1, max_parallel)
+        self.window = window
+        
+        self._pending: List[tuple] = []
+        self._flusher: Optional[asyncio.Task] = None
+        self._running: Set[asyncio.Task] = set()
+        # Created inside the running loop on first submit
+        self._semaphore: Optional[asyncio.Semaphore] = None
+    
+    async def submit(
+        self,
+        reasoning_model: str,
+        parser_model: str,
+        prompt: str,
+        schema: Type[T],
+        system_prompt: str = ""
+    ) -> T:
+        """
+        Queue one request and wait for its validated result.
+        
+        Takes the same arguments as generate_with_reasoning.
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_parallel)
+        
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((future, {
+            "reasoning_model": reasoning_model,
+            "parser_model": parser_model,
+            "prompt": prompt,
+            "schema": schema,
+            "system_prompt": system_prompt
+        }))
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._flush_after_window())
+        return await future
+    
+    async def aclose(self):
+        """Close the underlying client's HTTP pool."""
+        await self.client.aclose()
+    
+    async def _flush_after_window(self):
+        """
+        Release everything queued during each window.
+        
+        Batches are started, not awaited, so requests submitted while one is
+        in flight are picked up by the next window instead of waiting on it.
+        """
+        while self._pending:
+            await asyncio.sleep(self.window)
+            batch, self._pending = self._pending, []
+            for future, kwargs in batch:
+                task = asyncio.create_task(self._run(future, kwargs))
+                # The loop only keeps weak references to tasks
+                self._running.add(task)
+                task.add_done_callback(self._running.discard)
+    
+    async def _run(self, future: asyncio.Future, kwargs: dict):
+        async with self._semaphore:
+            try:
+                result = await self.client.generate_with_reasoning_async(**kwargs)
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+                return
+        if not future.done():
+            future.set_result(result)
 
 
 # Test the two-stage approach
@@ -302,6 +1078,9 @@ if __name__ == "__main__":
     from core.models import Plan
     from core.config import config
     
+    # Show progress and the full stage outputs
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s")
+    
     client = TwoStageOllamaClient()
     
     print("=" * 70)
@@ -0,0 +1,39 @@
+"""
+Shared Ollama provider for the legacy Pydantic AI scripts.
+
+Every Agent built from ollama_model() talks to Ollama's OpenAI-compatible
+endpoint through one pooled httpx.AsyncClient, so scripts that create
+several agents (e.g. test_two_stage.py) reuse keep-alive connections
+instead of each Agent('ollama:...') building its own client.
+
+Usage (scripts in this folder):
+    from _ollama_fixture import ollama_model
+    agent = Agent(ollama_model('llama3.1:8b'), output_type=Plan)
+"""
+
+import os
+import httpx
+from pydantic_ai.models.openai import OpenAIChatModel
+from pydantic_ai.providers.ollama import OllamaProvider
+
+OLLAMA_URL = os.getenv("OLLAMA_BASE_URL", "http://192.168.4.102:11434").rstrip('/')
+if not OLLAMA_URL.endswith('/v1'):
+    OLLAMA_URL += '/v1'  # OpenAI-compatible API
+
+SHARED_HTTP = httpx.AsyncClient(
+    limits=httpx.Limits(max_keepalive_connections=16, max_connections=32),
+    timeout=httpx.Timeout(120.0, connect=3.0)
+)
+
+SHARED_PROVIDER = OllamaProvider(base_url=OLLAMA_URL, http_client=SHARED_HTTP)
+
+
+def ollama_model(model_name: str) -> OpenAIChatModel:
+    """Model for model_name on the shared provider."""
+    return OpenAIChatModel(model_name, provider=SHARED_PROVIDER)
+
+
+def head(obj, n: int = 200) -> str:
+    """First n characters of obj (repr for non-strings), with '…' if cut."""
+    text = obj if isinstance(obj, str) else repr(obj)
+    return text[:n] + ("…" if len(text) > n else "")
@@ -0,0 +1,17 @@
+"""
+Put the project root first on sys.path, exactly once.
+
+Importing this module is idempotent: the root is moved to the front
+instead of being inserted again, so collecting many scripts does not
+grow sys.path.
+
+Usage (scripts in this folder):
+    import _path  # noqa: F401
+"""
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+sys.path[:] = [ROOT] + [p for p in sys.path if p != ROOT]
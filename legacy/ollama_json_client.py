@@ -4,10 +4,18 @@ Uses Ollama's native JSON mode which we know works.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
 from typing import TypeVar, Type
 from pydantic import BaseModel
 
+# Optional: orjson (Rust) for request/response JSON, stdlib json otherwise
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 T = TypeVar('T', bound=BaseModel)
 
 class OllamaJSONClient:
@@ -16,6 +24,13 @@ class OllamaJSONClient:
     def __init__(self, base_url: str = "http://192.168.4.102:11434"):
         self.base_url = base_url
         
+        # Reuse keep-alive connections across generate() calls
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._session.headers["Connection"] = "keep-alive"
+        
     def generate(self, model: str, prompt: str, schema: Type[T], system_prompt: str = "") -> T:
         """
         Generate structured output using Ollama's native JSON mode.
@@ -52,10 +67,24 @@ Generate the plan now as valid JSON:"""
             "format": "json"  # Enable native JSON mode
         }
         
-        response = requests.post(url, json=payload, timeout=180)
-        response.raise_for_status()
+        if ORJSON_AVAILABLE:
+            body = orjson.dumps(payload)
+        else:
+            body = json.dumps(payload).encode('utf-8')
+        
+        response = self._session.post(
+            url,
+            data=body,
+            headers={"Content-Type": "application/json"},
+            timeout=180
+        )
+        if not response.ok:
+            response.raise_for_status()
         
-        result = response.json()
+        if ORJSON_AVAILABLE:
+            result = orjson.loads(response.content)
+        else:
+            result = response.json()
         generated_json = result.get('response', '{}')
         
         # Validate and return
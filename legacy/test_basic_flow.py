@@ -1,13 +1,12 @@
 """Simple test script to verify the core infrastructure."""
 
-import sys
 import os
 
 # Force mock provider for testing
 os.environ["LLM_PROVIDER"] = "mock"
 
 # Add project root to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import _path  # noqa: F401  (project root on sys.path)
 
 from core.state import AgentState
 from core.llm import get_llm
@@ -4,8 +4,7 @@ import os
 os.environ["LLM_PROVIDER"] = "ollama"
 os.environ["ENABLE_OBSERVABILITY"] = "false"
 
-import sys
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import _path  # noqa: F401  (project root on sys.path)
 
 from pydantic import BaseModel
 from pydantic_ai import Agent
@@ -13,9 +13,8 @@ This test validates the CORE workflow, not Finn-specific skills.
 """
 
 import sys
-from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import _path  # noqa: F401  (project root on sys.path)
 
 from core.agent import Agent
 from core.state import AgentState
@@ -1,13 +1,12 @@
 """Test the full LangGraph workflow using the refactored engine."""
 
-import sys
 import os
 
 # Force mock provider for testing
 os.environ["LLM_PROVIDER"] = "mock"
 
 # Add project root to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import _path  # noqa: F401  (project root on sys.path)
 
 from core.engine import run_agent
 
@@ -3,54 +3,73 @@
 import os
 os.environ["LLM_PROVIDER"] = "ollama"
 
-import sys
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import asyncio
+import functools
+import _path  # noqa: F401  (project root on sys.path)
 
 from pydantic_ai import Agent
 from pydantic_ai.models import ModelSettings
 from core.models import Plan
+from _ollama_fixture import ollama_model, head
+
+SYS_PROMPT = "Generate a structured execution plan."
+PROMPT = "Create a file named test.txt with 'Hello World'"
+
+# Try with model_settings to pass format parameter (built once, shared)
+_SHARED_SETTINGS = ModelSettings(extra_body={"format": "json"})
+
+
+@functools.lru_cache(maxsize=8)
+def make_agent(model_name):
+    """Build (once per model) an Agent with JSON mode enabled via model_settings."""
+    return Agent(
+        ollama_model(model_name),
+        output_type=Plan,
+        system_prompt=SYS_PROMPT,
+        model_settings=_SHARED_SETTINGS
+    )
+
 
 print("=" * 70)
 print("Testing model_settings for JSON Mode")
 print("=" * 70)
 
-# Try with model_settings to pass format parameter
 models_to_test = [
     ("llama3.1:8b", "🔧 Tool-calling model"),
     ("gpt-oss:20b", "🧠 Reasoning model")
 ]
 
-for model_name, description in models_to_test:
+agents = {model_name: make_agent(model_name) for model_name, _ in models_to_test}
+
+
+async def main():
+    """Run every model concurrently; exceptions are returned per model."""
+    return await asyncio.gather(
+        *[agents[model_name].run(PROMPT) for model_name, _ in models_to_test],
+        return_exceptions=True
+    )
+
+
+print(f"Running {len(models_to_test)} models concurrently...")
+results = asyncio.run(main())
+
+for (model_name, description), result in zip(models_to_test, results):
     print(f"\n{'='*70}")
     print(f"🤖 MODEL: {model_name} - {description}")
     print(f"{'='*70}")
     
-    try:
-        # Create agent with JSON mode enabled via model_settings
-        agent = Agent(
-            f'ollama:{model_name}',
-            output_type=Plan,
-            system_prompt="Generate a structured execution plan.",
-            model_settings=ModelSettings(
-                extra_body={"format": "json"}  # Try passing format parameter
-            )
-        )
-        
-        print("Agent created, running", end="", flush=True)
-        result = agent.run_sync("Create a file named test.txt with 'Hello World'")
-        print(" ✅")
-        
-        print(f"\n📊 Result type: {type(result.output)}")
-        
-        if isinstance(result.output, Plan):
-            print(f"✅ SUCCESS! Got Plan with {len(result.output.plan)} steps:")
-            for i, step in enumerate(result.output.plan, 1):
-                print(f"  {i}. [{step.role}] {step.instruction[:60]}...")
-        else:
-            print(f"❌ Got string ({len(str(result.output))} chars):")
-            print(f"{str(result.output)[:200]}...")
-            
-    except Exception as e:
-        print(f"\n❌ Error: {str(e)[:200]}")
+    if isinstance(result, Exception):
+        print(f"\n❌ Error: {head(str(result))}")
+        continue
+    
+    print(f"\n📊 Result type: {type(result.output)}")
+    
+    if isinstance(result.output, Plan):
+        print(f"✅ SUCCESS! Got Plan with {len(result.output.plan)} steps:")
+        for i, step in enumerate(result.output.plan, 1):
+            print(f"  {i}. [{step.role}] {step.instruction[:60]}...")
+    else:
+        print(f"❌ Got string ({len(str(result.output))} chars):")
+        print(head(result.output))
 
 print(f"\n{'='*70}")
@@ -1,11 +1,65 @@
 """Test with Ollama's native format parameter for JSON mode."""
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+from enum import IntEnum
+from typing import List
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Optional: orjson (Rust) for all JSON in/out, stdlib json otherwise
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dumps(obj) -> bytes:
+    """Compact JSON bytes (orjson when available)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def loads(data):
+    """Parse JSON from str or bytes (orjson when available)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# Pooled keep-alive session, importable by the other legacy Ollama scripts
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=2, backoff_factor=0.2)
+))
+
+# (connect, read) timeouts: fail fast if the server is down, wait for generation
+TIMEOUT = (3.05, 120)
+
+# Optional: jsonschema to validate responses against the schema
+try:
+    from jsonschema import Draft7Validator
+    JSONSCHEMA_AVAILABLE = True
+except ImportError:
+    JSONSCHEMA_AVAILABLE = False
+
+# Optional: msgspec to decode + validate responses in one compiled pass
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+
+class Role(IntEnum):
+    """Step role as a one-token integer tag; names are only used for display."""
+    Actor = 0
+    Auditor = 1
 
-print("=" * 70)
-print("Testing Ollama Native JSON Mode")
-print("=" * 70)
 
 # Test with llama3.1:8b using native Ollama API
 url = "http://192.168.4.102:11434/api/generate"
@@ -19,7 +73,11 @@ schema = {
             "items": {
                 "type": "object",
                 "properties": {
-                    "role": {"type": "string", "enum": ["Actor", "Auditor"]},
+                    "role": {
+                        "type": "integer",
+                        "enum": [r.value for r in Role],
+                        "description": ", ".join(f"{r.value}={r.name}" for r in Role)
+                    },
                     "instruction": {"type": "string"}
                 },
                 "required": ["role", "instruction"]
@@ -29,59 +87,158 @@ schema = {
     "required": ["plan"]
 }
 
+# Built once at import and reused for every response
+if JSONSCHEMA_AVAILABLE:
+    Draft7Validator.check_schema(schema)
+    _VALIDATOR = Draft7Validator(schema)
+else:
+    _VALIDATOR = None
+
+# Typed mirror of the schema: decoding is also validation, no dict walk
+if MSGSPEC_AVAILABLE:
+    class PlanStepMs(msgspec.Struct):
+        role: Role
+        instruction: str
+
+    class PlanMs(msgspec.Struct):
+        plan: List[PlanStepMs]
+
+    PLAN_DECODER = msgspec.json.Decoder(PlanMs)
+else:
+    PLAN_DECODER = None
+
 prompt = f"""You are a planning expert. Create a structured execution plan.
 
 User request: Create a file named test.txt with content 'Hello World'
 
 Respond with a JSON object matching this schema:
-{json.dumps(schema, indent=2)}
+{dumps(schema).decode("utf-8")}
 
 Your response must be valid JSON only, nothing else."""
 
 models_to_test = ["llama3.1:8b", "gpt-oss:20b"]
 
-for model_name in models_to_test:
+# Everything but the model name is shared by every request
+BASE_PAYLOAD = {
+    "prompt": prompt,
+    "stream": True,   # NDJSON chunks; the inner JSON is parsed once at the end
+    "format": "json"  # Enable JSON mode
+}
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def encode_payload(model_name):
+    """Serialize the request body for one model."""
+    return dumps({"model": model_name, **BASE_PAYLOAD})
+
+
+def call(model_name):
+    """
+    POST the JSON-mode request for one model (runs in a worker thread).
+    
+    Returns (status_code, text): the joined generated text on 200, the
+    error body otherwise. Only the small per-chunk envelopes are parsed
+    while streaming.
+    """
+    with SESSION.post(
+        url,
+        data=encode_payload(model_name),
+        headers=JSON_HEADERS,
+        timeout=TIMEOUT,
+        stream=True
+    ) as response:
+        if response.status_code != 200:
+            return response.status_code, response.text
+        
+        parts = []
+        for line in response.iter_lines():
+            if not line:
+                continue
+            chunk = loads(line)
+            parts.append(chunk.get('response', ''))
+            if chunk.get('done'):
+                break
+        return response.status_code, "".join(parts)
+
+
+def role_name(value):
+    """Display name for an integer role tag (the raw value if unknown)."""
+    try:
+        return Role(value).name
+    except ValueError:
+        return value if value is not None else 'N/A'
+
+
+def report(model_name, status_code, generated_text):
+    """Print the result for one model."""
     print(f"\n{'='*70}")
     print(f"🤖 MODEL: {model_name}")
     print(f"{'='*70}")
+    print(f"✅ Status {status_code}")
     
-    payload = {
-        "model": model_name,
-        "prompt": prompt,
-        "stream": False,
-        "format": "json"  # Enable JSON mode
-    }
-    
-    print(f"Sending request... ", end="", flush=True)
-    try:
-        response = requests.post(url, json=payload, timeout=120)
-        print(f"✅ Status {response.status_code}")
+    if status_code == 200:
+        print(f"\n📄 Raw response ({len(generated_text)} chars):")
+        print(generated_text[:500])
         
-        if response.status_code == 200:
-            result = response.json()
-            generated_text = result.get('response', '')
-            
-            print(f"\n📄 Raw response ({len(generated_text)} chars):")
-            print(generated_text[:500])
-            
-            # Try to parse as JSON
+        if PLAN_DECODER is not None:
             try:
-                parsed = json.loads(generated_text)
-                print(f"\n✅ Valid JSON! Structure:")
-                if "plan" in parsed:
-                    print(f"   - Plan has {len(parsed['plan'])} steps")
-                    for i, step in enumerate(parsed['plan'], 1):
-                        print(f"   {i}. [{step.get('role', 'N/A')}] {step.get('instruction', 'N/A')[:60]}...")
-                else:
-                    print(f"   Keys: {list(parsed.keys())}")
-                    
-            except json.JSONDecodeError as e:
+                result = PLAN_DECODER.decode(generated_text)
+            except msgspec.ValidationError as e:  # subclass of DecodeError
+                print(f"\n❌ Schema error: {e}")
+            except msgspec.DecodeError as e:
                 print(f"\n❌ JSON Parse Error: {e}")
+            else:
+                print(f"\n✅ Valid JSON! Matches schema")
+                print(f"   - Plan has {len(result.plan)} steps")
+                for i, step in enumerate(result.plan, 1):
+                    print(f"   {i}. [{step.role.name}] {step.instruction[:60]}...")
+            return
+        
+        # Try to parse as JSON
+        try:
+            parsed = loads(generated_text)
+            print(f"\n✅ Valid JSON! Structure:")
+            if _VALIDATOR is not None:
+                errors = sorted(_VALIDATOR.iter_errors(parsed), key=lambda e: list(e.path))
+                if errors:
+                    print(f"   ❌ {len(errors)} schema error(s):")
+                    for error in errors:
+                        location = "/".join(str(p) for p in error.path) or "<root>"
+                        print(f"      - {location}: {error.message}")
+                else:
+                    print(f"   ✅ Matches schema")
+            if isinstance(parsed, dict) and "plan" in parsed:
+                print(f"   - Plan has {len(parsed['plan'])} steps")
+                for i, step in enumerate(parsed['plan'], 1):
+                    print(f"   {i}. [{role_name(step.get('role'))}] {step.get('instruction', 'N/A')[:60]}...")
+            else:
+                print(f"   Keys: {list(parsed.keys()) if isinstance(parsed, dict) else type(parsed).__name__}")
                 
-        else:
-            print(f"\n❌ HTTP Error: {response.text}")
+        except ValueError as e:  # json / orjson JSONDecodeError
+            print(f"\n❌ JSON Parse Error: {e}")
             
-    except Exception as e:
-        print(f"\n❌ Request failed: {e}")
+    else:
+        print(f"\n❌ HTTP Error: {generated_text}")
+
+
+def main():
+    print("=" * 70)
+    print("Testing Ollama Native JSON Mode")
+    print("=" * 70)
+    
+    # Query all models at once; results print in completion order
+    print(f"Sending {len(models_to_test)} requests concurrently...")
+    with ThreadPoolExecutor(max_workers=len(models_to_test)) as ex:
+        futures = {ex.submit(call, m): m for m in models_to_test}
+        for future in as_completed(futures):
+            model_name = futures[future]
+            try:
+                report(model_name, *future.result())
+            except Exception as e:
+                print(f"\n❌ {model_name}: Request failed: {e}")
+    
+    print(f"\n{'='*70}")
+
 
-print(f"\n{'='*70}")
+if __name__ == "__main__":
+    main()
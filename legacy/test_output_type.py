@@ -3,11 +3,11 @@
 import os
 os.environ["LLM_PROVIDER"] = "ollama"
 
-import sys
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import _path  # noqa: F401  (project root on sys.path)
 
 from pydantic_ai import Agent
 from core.models import Plan
+from _ollama_fixture import ollama_model, head
 
 print("=" * 70)
 print("Testing output_type Parameter")
@@ -17,7 +17,7 @@ print("=" * 70)
 print("\n[Test] Using output_type parameter explicitly...")
 
 agent = Agent(
-    'ollama:llama3.1:8b',
+    ollama_model('llama3.1:8b'),
     output_type=Plan,  # Explicit output type
     system_prompt="You are a planning assistant. Generate a structured execution plan."
 )
@@ -34,6 +34,6 @@ if isinstance(result.output, Plan):
     for i, step in enumerate(result.output.plan, 1):
         print(f"  {i}. [{step.role}] {step.instruction}")
 else:
-    print(f"\n❌ Still string: {result.output[:200]}")
+    print(f"\n❌ Still string: {head(result.output)}")
 
 print("\n" + "=" * 70)
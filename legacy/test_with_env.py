@@ -13,9 +13,21 @@ if not ollama_url:
 from pydantic_ai import Agent
 import asyncio
 
+# Optional: uvloop (libuv) event loop, stdlib asyncio otherwise
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 async def test():
     agent: Agent[None, str] = Agent('ollama:llama3.1:8b')
     result = await agent.run('Say hello')
     print(f"✅ Result: {result.output}")
 
-asyncio.run(test())
+# One explicit loop for every await in this script
+loop = uvloop.new_event_loop() if UVLOOP_AVAILABLE else asyncio.new_event_loop()
+try:
+    loop.run_until_complete(test())
+finally:
+    loop.close()
@@ -1,15 +1,39 @@
 import os
 import sys
 import subprocess
+import importlib.util
+from pathlib import Path
+
+# Skill initializer (was finn/skills/skill_creator/, now under core/)
+INIT_SCRIPT = Path(__file__).parent.parent / "core" / "skill_creator" / "scripts" / "init.py"
+
+# IN_PROCESS=0 runs the initializer in a subprocess (for debugging)
+IN_PROCESS = os.getenv("IN_PROCESS", "1") != "0"
+
+_init = None
+
+
+def _load_init():
+    """Import the initializer script once (by path; it is not a package)."""
+    global _init
+    if _init is None:
+        spec = importlib.util.spec_from_file_location("skill_creator_init", INIT_SCRIPT)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _init = module
+    return _init
+
 
 def create_skill(name, path="finn/skills"):
     """Tool: Initialize a new skill structure."""
     print(f"[Tool] Creating skill '{name}' in '{path}'...")
-    # Adjust path to relative to project root
-    script = os.path.join("finn", "skills", "skill_creator", "scripts", "init.py")
     try:
-        # We want to see output in real time
-        subprocess.run([sys.executable, script, name, "--path", path], check=True)
+        if IN_PROCESS:
+            if _load_init().init_skill(name, path) is None:
+                raise RuntimeError(f"initializer failed for '{name}'")
+        else:
+            # We want to see output in real time
+            subprocess.run([sys.executable, str(INIT_SCRIPT), name, "--path", path], check=True)
         print(f"[Tool] Success: Skill '{name}' created.")
     except Exception as e:
         print(f"[Tool] Error: {e}")
@@ -0,0 +1,44 @@
+"""
+Pytest configuration for the test suite.
+
+Puts the project root on sys.path once per session, so test modules can
+import `core` without each growing sys.path. (Test files also run as
+scripts, so they keep a guarded fallback of their own.)
+"""
+
+import sys
+import pytest
+from pathlib import Path
+
+ROOT = str(Path(__file__).resolve().parent.parent)
+
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+def pytest_configure(config):
+    """Register the project's markers."""
+    config.addinivalue_line("markers", "llm: requires a live LLM server (Ollama)")
+    config.addinivalue_line("markers", "slow: takes more than a few seconds (live LLM workflows)")
+    config.addinivalue_line("markers", "tag(*names): test case categories, selectable with -k <name>")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Make tag(...) names keywords, so `-k portfolio` selects by tag."""
+    for item in items:
+        for marker in item.iter_markers("tag"):
+            item.extra_keyword_matches.update(marker.args)
+
+
+@pytest.fixture(scope="session")
+def core_agent():
+    """The shared core Agent (skills discovered once per session)."""
+    from core.agent import get_agent
+    return get_agent("core", "Core AgentOS")
+
+
+@pytest.fixture(scope="session")
+def finn_agent():
+    """The shared Finn Agent (skills discovered once per session)."""
+    from core.agent import get_agent
+    return get_agent("finn", "Financial portfolio agent")
@@ -4,33 +4,69 @@ Utility to reset/clean memory for test agents.
 Use this to clean up memory from test runs.
 """
 
-import shutil
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# os.unlink releases the GIL, so a few threads overlap syscall latency
+UNLINK_WORKERS = 8
 
-def reset_agent_memory(agent_name: str, base_path: str = "."):
-    """
-    Reset all memory for a specific agent.
-    
-    Args:
-        agent_name: Name of the agent (e.g., 'test_agent', 'agent1')
-        base_path: Base path where agent folders are located
-    """
+
+def _collect(path: str, files: list, dirs: list):
+    """Gather files and (post-order) directories under path, without following symlinks."""
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                _collect(entry.path, files, dirs)
+            else:
+                files.append(entry.path)
+    dirs.append(path)
+
+
+def _fast_rmtree(path: Path):
+    """Remove a directory tree: parallel unlinks, then one rmdir pass."""
+    # Like shutil.rmtree: scandir would follow a symlinked root and empty
+    # the directory it points to
+    if os.path.islink(path):
+        raise OSError("Cannot call rmtree on a symbolic link")
+    files, dirs = [], []
+    _collect(str(path), files, dirs)
+    with ThreadPoolExecutor(max_workers=UNLINK_WORKERS) as ex:
+        list(ex.map(os.unlink, files))
+    for directory in dirs:
+        os.rmdir(directory)
+
+
+def _reset_agent_memory(agent_name: str, base_path: str = ".") -> list:
+    """Reset one agent's memory and return the report lines."""
     agent_path = Path(base_path) / agent_name
     
     if not agent_path.exists():
-        print(f"Agent '{agent_name}' has no memory folder - nothing to reset")
-        return
+        return [f"Agent '{agent_name}' has no memory folder - nothing to reset"]
     
-    print(f"Resetting memory for agent: {agent_name}")
-    print(f"  Location: {agent_path}")
+    lines = [
+        f"Resetting memory for agent: {agent_name}",
+        f"  Location: {agent_path}"
+    ]
     
     # Remove the entire agent folder
     try:
-        shutil.rmtree(agent_path)
-        print(f"  ✅ Memory reset complete for '{agent_name}'")
+        _fast_rmtree(agent_path)
+        lines.append(f"  ✅ Memory reset complete for '{agent_name}'")
     except Exception as e:
-        print(f"  ❌ Error resetting memory: {e}")
+        lines.append(f"  ❌ Error resetting memory: {e}")
+    return lines
+
+
+def reset_agent_memory(agent_name: str, base_path: str = "."):
+    """
+    Reset all memory for a specific agent.
+    
+    Args:
+        agent_name: Name of the agent (e.g., 'test_agent', 'agent1')
+        base_path: Base path where agent folders are located
+    """
+    print("\n".join(_reset_agent_memory(agent_name, base_path)))
 
 
 def reset_all_test_memory(base_path: str = "."):
@@ -46,8 +82,12 @@ def reset_all_test_memory(base_path: str = "."):
     print("RESETTING ALL TEST AGENT MEMORY")
     print("="*60)
     
-    for agent in test_agents:
-        reset_agent_memory(agent, base_path)
+    # Agents are independent folders, so reset them in parallel; reports
+    # are printed afterwards, in agent order, so they don't interleave
+    with ThreadPoolExecutor(max_workers=len(test_agents)) as ex:
+        reports = list(ex.map(lambda agent: _reset_agent_memory(agent, base_path), test_agents))
+    for lines in reports:
+        print("\n".join(lines))
     
     print("="*60)
     print("✅ All test memory reset complete")
@@ -2,19 +2,26 @@
 
 import sys
 import os
+import logging
 
 # Force mock provider for testing
 os.environ["LLM_PROVIDER"] = "mock"
 
 # Add project root to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
 
 from core.state import AgentState
 from core.nodes.actor import actor_node
 
+# Lazy %-style logging: messages are only formatted when the level is enabled
+log = logging.getLogger("agentos.tests")
+log.setLevel(os.getenv("TEST_LOG_LEVEL", "INFO"))
+
 def test_actor():
     """Test just the Actor node."""
-    print("=== Testing Actor Node ===\n")
+    log.info("=== Testing Actor Node ===\n")
     
     # Initialize state with a pre-made plan
     state: AgentState = {
@@ -31,8 +38,9 @@ def test_actor():
     updates = actor_node(state)
     state.update(updates)
     
-    print(f"\n=== Actor Test Complete ===")
-    print(f"Tool outputs: {state['tool_outputs']}")
+    log.info("\n=== Actor Test Complete ===")
+    log.info("Tool outputs: %s", state['tool_outputs'])
 
 if __name__ == "__main__":
+    logging.basicConfig(format="%(message)s")
     test_actor()
@@ -7,7 +7,10 @@ and that the full workflow (Planner→Actor→Auditor) works with Agent instance
 
 import sys
 import os
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import asyncio
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
 
 from core.agent import Agent
 from core.config import config
@@ -85,11 +88,15 @@ def test_memory_isolation():
     print("TEST 4: Memory isolation between agents")
     print("="*70)
     
-    agent1 = Agent(name="agent1", description="First agent")
-    agent2 = Agent(name="agent2", description="Second agent")
+    # Isolation is decided at construction; skill loading is not needed
+    agent1 = Agent(name="agent1", description="First agent", auto_initialize=False)
+    agent2 = Agent(name="agent2", description="Second agent", auto_initialize=False)
     
-    # Each should have separate memory managers
+    # Each should have separate names and registries
     assert agent1.name != agent2.name
+    assert agent1.registry is not agent2.registry
+    assert agent1.registry.agent_name == "agent1"
+    assert agent2.registry.agent_name == "agent2"
     
     print(f"\n✅ Test passed - Agents are isolated!")
     print(f"   Agent 1: {agent1.name}")
@@ -98,6 +105,18 @@ def test_memory_isolation():
     return True
 
 
+async def main():
+    """Run the integration tests concurrently; each one is a blocking pipeline."""
+    await asyncio.gather(*[
+        asyncio.to_thread(test) for test in (
+            test_agent_run_simple,
+            test_agent_run_with_skills,
+            test_backward_compatibility,
+            test_memory_isolation,
+        )
+    ])
+
+
 if __name__ == "__main__":
     print("\n" + "="*70)
     print("AGENT-ENGINE INTEGRATION TEST SUITE")
@@ -107,11 +126,8 @@ if __name__ == "__main__":
     print(f"Parser Model: {config.PARSER_MODEL}")
     
     try:
-        # Run integration tests
-        test_agent_run_simple()
-        test_agent_run_with_skills()
-        test_backward_compatibility()
-        test_memory_isolation()
+        # Run integration tests concurrently (independent agents/intents)
+        asyncio.run(main())
         
         print("\n" + "="*70)
         print("✅ ALL INTEGRATION TESTS PASSED!")
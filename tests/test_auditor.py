@@ -16,21 +16,29 @@ TEST FLOW:
 
 import sys
 import os
+import logging
 
 # Force mock provider for testing
 os.environ["LLM_PROVIDER"] = "mock"
 
 # Add project root to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
 
 from core.state import AgentState
 from core.nodes.auditor import auditor_node
 
+# Lazy %-style logging: messages are only formatted when the level is enabled
+log = logging.getLogger("agentos.tests")
+log.setLevel(os.getenv("TEST_LOG_LEVEL", "INFO"))
+RULE = "-" * 70
+_BAR_EQ = "=" * 70
+
 def print_section(title):
-    """Print a clear section header."""
-    print(f"\n{'='*70}")
-    print(f"  {title}")
-    print(f"{'='*70}")
+    """Log a clear section header."""
+    if log.isEnabledFor(logging.INFO):
+        log.info("\n%s\n  %s\n%s", _BAR_EQ, title, _BAR_EQ)
 
 def test_auditor():
     """Test the Auditor node with clear input/output visibility."""
@@ -40,8 +48,8 @@ def test_auditor():
     # ========================================================================
     # STEP 1: DEFINE INPUT
     # ========================================================================
-    print("\n[Step 1] 📝 INPUT - Initial State")
-    print("-" * 70)
+    log.info("\n[Step 1] 📝 INPUT - Initial State")
+    log.info(RULE)
     
     instruction = "Verify hello.txt exists and contains correct text"
     
@@ -56,20 +64,20 @@ def test_auditor():
         "final_response": None
     }
     
-    print(f"Current Step Index: {state['current_step_index']}")
-    print(f"Current Step Role:  {state['plan'][1]['role']}")
-    print(f"Instruction:        {instruction}")
-    print(f"Previous Outputs:   {state['tool_outputs']}")
+    log.info("Current Step Index: %s", state['current_step_index'])
+    log.info("Current Step Role:  %s", state['plan'][1]['role'])
+    log.info("Instruction:        %s", instruction)
+    log.info("Previous Outputs:   %s", state['tool_outputs'])
     
     # ========================================================================
     # STEP 2: EXECUTE AUDITOR NODE
     # ========================================================================
     print_section("STEP 2: EXECUTE - Auditor Processing")
-    print("-" * 70)
-    print("Provider: MOCK")
-    print("LLM Model: MockLLM (simulated auditor)")
-    print("\nCalling auditor_node()...")
-    print("-" * 70)
+    log.info(RULE)
+    log.info("Provider: MOCK")
+    log.info("LLM Model: MockLLM (simulated auditor)")
+    log.info("\nCalling auditor_node()...")
+    log.info(RULE)
     
     # Run auditor (this will print MockLLM output)
     updates = auditor_node(state)
@@ -78,26 +86,26 @@ def test_auditor():
     # STEP 3: INTERMEDIATE RESULTS
     # ========================================================================
     print_section("STEP 3: INTERMEDIATE - LLM Response")
-    print("-" * 70)
-    print("The MockLLM auditor response is shown above")
-    print("(In production, OllamaLLM would generate audit verdict)")
+    log.info(RULE)
+    log.info("The MockLLM auditor response is shown above")
+    log.info("(In production, OllamaLLM would generate audit verdict)")
     
     # ========================================================================
     # STEP 4: FINAL OUTPUT
     # ========================================================================
     print_section("STEP 4: OUTPUT - State Updates")
-    print("-" * 70)
+    log.info(RULE)
     
     state.update(updates)
     
-    print(f"Updated Step Index: {state['current_step_index']}")
-    print(f"Expected:           2 (moved to next step)")
+    log.info("Updated Step Index: %s", state['current_step_index'])
+    log.info("Expected:           2 (moved to next step)")
     
     # ========================================================================
     # STEP 5: ASSERTIONS
     # ========================================================================
     print_section("STEP 5: VALIDATION")
-    print("-" * 70)
+    log.info(RULE)
     
     try:
         assert state['current_step_index'] == 2, \
@@ -109,18 +117,19 @@ def test_auditor():
         assert updates['current_step_index'] == 2, \
             "Updated index should be 2"
         
-        print("✅ All assertions passed!")
-        print("✅ Auditor correctly processed the step")
-        print("✅ State correctly incremented to next step")
+        log.info("✅ All assertions passed!")
+        log.info("✅ Auditor correctly processed the step")
+        log.info("✅ State correctly incremented to next step")
         
         print_section("TEST RESULT: PASSED ✅")
         return True
         
     except AssertionError as e:
-        print(f"❌ Assertion failed: {e}")
+        log.error("❌ Assertion failed: %s", e)
         print_section("TEST RESULT: FAILED ❌")
         return False
 
 if __name__ == "__main__":
+    logging.basicConfig(format="%(message)s")
     success = test_auditor()
     sys.exit(0 if success else 1)
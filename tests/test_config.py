@@ -7,21 +7,43 @@ TEST FLOW:
 1. INPUT:  .env file with model configurations
 2. LOAD:   Configuration system loads and validates
 3. OUTPUT: Verify correct models are accessible
+
+FAST_TESTS=1 skips the STEP 4 invariant checks (types, non-empty names,
+provider whitelist) for local loops on a known-good .env; full validation
+runs whenever the flag is unset, as in pre-merge CI.
 """
 
 import sys
 import os
+import logging
+import pytest
+from pathlib import Path
 
 # Add project root to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+ROOT = str(Path(__file__).resolve().parent.parent)
+if ROOT not in sys.path:  # already set by conftest.py under pytest
+    sys.path.insert(0, ROOT)
+
+from core.config import config, get_reasoning_model, get_parser_model, get_tool_model, normalize_ollama_url
+
+# Lazy %-style logging: messages are only formatted when the level is enabled
+log = logging.getLogger("agentos.tests")
+log.setLevel(os.getenv("TEST_LOG_LEVEL", "INFO"))
 
-from core.config import config, get_reasoning_model, get_parser_model, get_tool_model
+# Model settings that must be non-empty strings
+EXPECTED_TYPES = {"REASONING_MODEL": str, "PARSER_MODEL": str, "TOOL_MODEL": str}
+ACTIVE_KEYS = {"reasoning_model", "parser_model", "tool_model", "provider"}
+
+# Section bars for the two header styles, built once
+_BAR_EQ = "=" * 70
+_BAR_DASH = "-" * 70
+_BARS = {"=": _BAR_EQ, "-": _BAR_DASH}
 
 def print_section(title, char="="):
-    """Print a clear section header."""
-    print(f"\n{char*70}")
-    print(f"  {title}")
-    print(f"{char*70}")
+    """Log a clear section header."""
+    if log.isEnabledFor(logging.INFO):
+        bar = _BARS.get(char) or char * 70
+        log.info("\n%s\n  %s\n%s", bar, title, bar)
 
 def test_configuration():
     """Test configuration loading and access."""
@@ -33,11 +55,11 @@ def test_configuration():
     # ========================================================================
     print_section("STEP 1: Configuration Loaded", "-")
     
-    print(f"Provider:         {config.LLM_PROVIDER}")
-    print(f"Reasoning Model:  {config.REASONING_MODEL}")
-    print(f"Parser Model:     {config.PARSER_MODEL}")
-    print(f"Tool Model:       {config.TOOL_MODEL}")
-    print(f"Ollama Base URL:  {config.OLLAMA_BASE_URL}")
+    log.info("Provider:         %s", config.LLM_PROVIDER)
+    log.info("Reasoning Model:  %s", config.REASONING_MODEL)
+    log.info("Parser Model:     %s", config.PARSER_MODEL)
+    log.info("Tool Model:       %s", config.TOOL_MODEL)
+    log.info("Ollama Base URL:  %s", config.OLLAMA_BASE_URL)
     
     # ========================================================================
     # STEP 2: VERIFY CONVENIENCE FUNCTIONS
@@ -48,9 +70,9 @@ def test_configuration():
     parser = get_parser_model()
     tool = get_tool_model()
     
-    print(f"get_reasoning_model(): {reasoning}")
-    print(f"get_parser_model():    {parser}")
-    print(f"get_tool_model():      {tool}")
+    log.info("get_reasoning_model(): %s", reasoning)
+    log.info("get_parser_model():    %s", parser)
+    log.info("get_tool_model():      %s", tool)
     
     # ========================================================================
     # STEP 3: VERIFY ACTIVE MODELS
@@ -59,73 +81,79 @@ def test_configuration():
     
     active = config.get_active_models()
     for key, value in active.items():
-        print(f"  {key}: {value}")
+        log.info("  %s: %s", key, value)
     
     # ========================================================================
     # STEP 4: VALIDATION
     # ========================================================================
     print_section("STEP 4: VALIDATION", "-")
     
-    all_passed = True
+    if os.getenv("FAST_TESTS") == "1":
+        pytest.skip("FAST_TESTS=1: invariant checks skipped")
+    
+    # Check that configuration exists
+    assert config is not None, "Config should not be None"
+    
+    # Check provider
+    assert config.LLM_PROVIDER in ["ollama", "mock", "google"], \
+        f"Invalid provider: {config.LLM_PROVIDER}"
+    
+    # Check models are non-empty strings
+    assert all(
+        isinstance(getattr(config, k), t) and getattr(config, k)
+        for k, t in EXPECTED_TYPES.items()
+    ), f"Models should be non-empty strings: { {k: getattr(config, k) for k in EXPECTED_TYPES} }"
+    
+    # Check ollama URL if ollama provider
+    if config.LLM_PROVIDER == "ollama":
+        assert config.OLLAMA_BASE_URL.startswith("http"), \
+            f"Ollama URL should start with http, got: {config.OLLAMA_BASE_URL}"
+    
+    # Check convenience functions return same values
+    assert (reasoning, parser, tool) == \
+        (config.REASONING_MODEL, config.PARSER_MODEL, config.TOOL_MODEL), \
+        "Convenience functions should return the config values"
     
+    # Check active models dict
+    assert ACTIVE_KEYS <= active.keys(), \
+        f"Active models missing: {sorted(ACTIVE_KEYS - active.keys())}"
+    
+    log.info("✅ All assertions passed!")
+    log.info("✅ Configuration system working correctly")
+    log.info("✅ Models loaded from .env successfully")
+    log.info("✅ Using provider: %s", config.LLM_PROVIDER)
+    log.info("✅ Reasoning model: %s", config.REASONING_MODEL)
+    log.info("✅ Parser/Tool model: %s", config.PARSER_MODEL)
+    
+    print_section("TEST RESULT: PASSED ✅")
+
+def test_normalize_ollama_url():
+    """Suffixes are stripped as path segments, never as character sets."""
+    
+    print_section("TEST: Ollama URL Normalization")
+    
+    cases = {
+        "http://host:11434": "http://host:11434",
+        "http://host:11434/": "http://host:11434",
+        "http://host:11434/v1": "http://host:11434",
+        "http://host:11434/v1/": "http://host:11434",
+        "http://host:11434/api": "http://host:11434",
+        "http://host:11431": "http://host:11431",   # rstrip('/v1') ate the port
+        "http://api:11434/v/1": "http://api:11434/v/1",
+    }
+    for raw, expected in cases.items():
+        assert normalize_ollama_url(raw) == expected, raw
+        log.info("✅ %s -> %s", raw, expected)
+
+if __name__ == "__main__":
+    logging.basicConfig(format="%(message)s")
     try:
-        # Check that configuration exists
-        assert config is not None, "Config should not be None"
-        
-        # Check provider
-        assert config.LLM_PROVIDER in ["ollama", "mock", "google"], \
-            f"Invalid provider: {config.LLM_PROVIDER}"
-        
-        # Check models are strings
-        assert isinstance(config.REASONING_MODEL, str), "Reasoning model should be string"
-        assert isinstance(config.PARSER_MODEL, str), "Parser model should be string"
-        assert isinstance(config.TOOL_MODEL, str), "Tool model should be string"
-        
-        # Check models are not empty
-        assert len(config.REASONING_MODEL) > 0, "Reasoning model should not be empty"
-        assert len(config.PARSER_MODEL) > 0, "Parser model should not be empty"
-        assert len(config.TOOL_MODEL) > 0, "Tool model should not be empty"
-        
-        # Check ollama URL if ollama provider
-        if config.LLM_PROVIDER == "ollama":
-            assert config.OLLAMA_BASE_URL.startswith("http"), \
-                f"Ollama URL should start with http, got: {config.OLLAMA_BASE_URL}"
-        
-        # Check convenience functions return same values
-        assert get_reasoning_model() == config.REASONING_MODEL, \
-            "get_reasoning_model() should return config.REASONING_MODEL"
-        assert get_parser_model() == config.PARSER_MODEL, \
-            "get_parser_model() should return config.PARSER_MODEL"
-        assert get_tool_model() == config.TOOL_MODEL, \
-            "get_tool_model() should return config.TOOL_MODEL"
-        
-        # Check active models dict
-        assert "reasoning_model" in active, "Active models should have reasoning_model"
-        assert "parser_model" in active, "Active models should have parser_model"
-        assert "tool_model" in active, "Active models should have tool_model"
-        assert "provider" in active, "Active models should have provider"
-        
-        print("✅ All assertions passed!")
-        print("✅ Configuration system working correctly")
-        print("✅ Models loaded from .env successfully")
-        print(f"✅ Using provider: {config.LLM_PROVIDER}")
-        print(f"✅ Reasoning model: {config.REASONING_MODEL}")
-        print(f"✅ Parser/Tool model: {config.PARSER_MODEL}")
-        
-        print_section("TEST RESULT: PASSED ✅")
-        return True
-        
+        try:
+            test_configuration()
+        except pytest.skip.Exception as e:
+            log.info("⏭️  %s", e.msg)
+        test_normalize_ollama_url()
     except AssertionError as e:
-        print(f"❌ Assertion failed: {e}")
+        log.error("❌ Assertion failed: %s", e)
         print_section("TEST RESULT: FAILED ❌")
-        return False
-    except Exception as e:
-        print(f"❌ Unexpected error: {e}")
-        import traceback
-        traceback.print_exc()
-        print_section("TEST RESULT: ERROR ❌")
-        return False
-
-if __name__ == "__main__":
-    success = test_configuration()
-    sys.exit(0 if success else 1)
+        sys.exit(1)
@@ -35,74 +35,131 @@ TEST FLOW:
 REQUIREMENTS:
 - Ollama running at http://192.168.4.102:11434
 - Models: gpt-oss:20b, llama3.1:8b available
+
+FAST PATH:
+test_e2e_workflow_canned runs the same verification with run_agent
+replaced by a canned result (no LLM). The live test is marked slow:
+    pytest tests/test_e2e_workflow.py -m "not slow"
+Running this file directly with SKIP_LLM=1 uses the canned result too.
 """
 
 import sys
 import os
+import re
+import logging
+import tempfile
+import pytest
+from pathlib import Path
 
 # Use Ollama for real end-to-end testing
 os.environ["LLM_PROVIDER"] = "ollama"
 os.environ["ENABLE_OBSERVABILITY"] = "true"
 
 # Add project root to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+ROOT = str(Path(__file__).resolve().parent.parent)
+if ROOT not in sys.path:  # already set by conftest.py under pytest
+    sys.path.insert(0, ROOT)
 
 from core.engine import run_agent
-import time
+
+# Lazy %-style logging: messages are only formatted when the level is enabled
+log = logging.getLogger("agentos.tests")
+log.setLevel(os.getenv("TEST_LOG_LEVEL", "INFO"))
+# Section bars for the two header styles, built once
+_BAR_EQ = "=" * 70
+_BAR_DASH = RULE = "-" * 70
+_BARS = {"=": _BAR_EQ, "-": _BAR_DASH}
 
 def print_section(title, char="="):
-    """Print a clear section header."""
-    print(f"\n{char*70}")
-    print(f"  {title}")
-    print(f"{char*70}")
+    """Log a clear section header."""
+    if log.isEnabledFor(logging.INFO):
+        bar = _BARS.get(char) or char * 70
+        log.info("\n%s\n  %s\n%s", bar, title, bar)
+
+E2E_FILENAME = "e2e_test.txt"
+E2E_CONTENT = "End-to-End Test Successful"
+
+# The file path the user intent asks for
+_INTENT_FILE = re.compile(r"Create a file named (\S+) with content")
+
 
+def canned_run_agent(intent: str) -> dict:
+    """Stand-in for run_agent: does the Actor's work and returns a completed state."""
+    path = _INTENT_FILE.search(intent).group(1)
+    with open(path, 'w') as f:
+        f.write(E2E_CONTENT)
+    return {
+        "plan": [
+            {"role": "Actor", "instruction": f"Write '{E2E_CONTENT}' to {path}"},
+            {"role": "Auditor", "instruction": f"Verify {path} exists"}
+        ],
+        "current_step_index": 2,
+        "tool_outputs": {"step_0": "ok", "step_1": "ok"},
+        "final_response": "Done"
+    }
+
+
+@pytest.mark.llm
+@pytest.mark.slow
 def test_e2e_workflow():
     """
     Test the complete end-to-end workflow through LangGraph.
+
+    The file is created in a scratch directory that is removed on every
+    path, so a failed run leaves nothing behind.
     """
+    with tempfile.TemporaryDirectory() as tmp:
+        success = run_e2e_workflow(os.path.join(tmp, E2E_FILENAME))
+    log.info("\n🧹 Removed scratch directory %s", tmp)
+    return success
+
+
+def run_e2e_workflow(expected_file):
+    """Run the workflow for a file at expected_file and verify it."""
     
     print_section("END-TO-END WORKFLOW TEST", "=")
-    print("Testing: Planner → Actor → Auditor → Loop → Complete")
+    log.info("Testing: Planner → Actor → Auditor → Loop → Complete")
     
     # ========================================================================
     # STEP 1: DEFINE INPUT
     # ========================================================================
     print_section("STEP 1: INPUT - User Intent", "-")
     
-    user_intent = "Create a file named tests/results/e2e_test.txt with content 'End-to-End Test Successful'"
+    user_intent = f"Create a file named {expected_file} with content '{E2E_CONTENT}'"
     
-    print(f"User Intent: {user_intent}")
-    print("\nExpected Workflow:")
-    print("  1. Planner analyzes intent")
-    print("  2. Planner generates plan (Actor + Auditor steps)")
-    print("  3. LangGraph routes to first step")
-    print("  4. Actor creates the file")
-    print("  5. Auditor verifies file exists and has correct content")
-    print("  6. LangGraph marks workflow complete")
+    log.info("User Intent: %s", user_intent)
+    log.info("\nExpected Workflow:")
+    log.info("  1. Planner analyzes intent")
+    log.info("  2. Planner generates plan (Actor + Auditor steps)")
+    log.info("  3. LangGraph routes to first step")
+    log.info("  4. Actor creates the file")
+    log.info("  5. Auditor verifies file exists and has correct content")
+    log.info("  6. LangGraph marks workflow complete")
     
     # ========================================================================
     # STEP 2: RUN THE FULL WORKFLOW
     # ========================================================================
     print_section("STEP 2: EXECUTE - Full Workflow via LangGraph", "-")
     
+    import time  # only the live run is timed, like traceback below
     start_time = time.time()
     
     try:
-        print("\nCalling run_agent()...")
-        print("(This will show detailed logs from each node)\n")
-        print("-" * 70)
+        log.info("\nCalling run_agent()...")
+        log.info("(This will show detailed logs from each node)\n")
+        log.info(RULE)
         
         result = run_agent(user_intent)
         
         elapsed = time.time() - start_time
         
-        print("-" * 70)
-        print(f"\n✅ Workflow completed in {elapsed:.1f} seconds")
+        log.info(RULE)
+        log.info("\n✅ Workflow completed in %.1f seconds", elapsed)
         
     except Exception as e:
         elapsed = time.time() - start_time
-        print(f"\n❌ Workflow failed after {elapsed:.1f} seconds")
-        print(f"Error: {e}")
+        log.error("\n❌ Workflow failed after %.1f seconds", elapsed)
+        log.error("Error: %s", e)
         import traceback
         traceback.print_exc()
         return False
@@ -113,26 +170,26 @@ def test_e2e_workflow():
     print_section("STEP 3: INTERMEDIATE - Workflow Breakdown", "-")
     
     if result:
-        print("\n📊 PLANNER OUTPUT:")
-        print(f"   Generated Plan: {len(result.get('plan', []))} steps")
+        log.info("\n📊 PLANNER OUTPUT:")
+        log.info("   Generated Plan: %s steps", len(result.get('plan', [])))
         for i, step in enumerate(result.get('plan', []), 1):
             role = step.get('role', 'Unknown')
             instruction = step.get('instruction', 'No instruction')
-            print(f"   {i}. [{role}] {instruction[:60]}{'...' if len(instruction) > 60 else ''}")
+            log.info("   %s. [%s] %s%s", i, role, instruction[:60], '...' if len(instruction) > 60 else '')
         
-        print("\n📊 EXECUTION OUTPUTS:")
+        log.info("\n📊 EXECUTION OUTPUTS:")
         tool_outputs = result.get('tool_outputs', {})
         if tool_outputs:
             for key, output in tool_outputs.items():
-                print(f"   {key}: {output}")
+                log.info("   %s: %s", key, output)
         else:
-            print("   (No tool outputs captured)")
+            log.info("   (No tool outputs captured)")
         
-        print(f"\n📊 FINAL STATE:")
-        print(f"   Current Step Index: {result.get('current_step_index', 'Unknown')}")
-        print(f"   Total Steps in Plan: {len(result.get('plan', []))}")
+        log.info("\n📊 FINAL STATE:")
+        log.info("   Current Step Index: %s", result.get('current_step_index', 'Unknown'))
+        log.info("   Total Steps in Plan: %s", len(result.get('plan', [])))
     else:
-        print("❌ No result returned from workflow")
+        log.error("❌ No result returned from workflow")
         return False
     
     # ========================================================================
@@ -140,35 +197,36 @@ def test_e2e_workflow():
     # ========================================================================
     print_section("STEP 4: OUTPUT - File Verification", "-")
     
-    expected_file = "tests/results/e2e_test.txt"
-    expected_content = "End-to-End Test Successful"
+    expected_content = E2E_CONTENT
     
-    # Check if file was created
-    if os.path.exists(expected_file):
-        print(f"✅ File '{expected_file}' was created")
+    # Read the file once (EAFP); STEP 5 reuses the content
+    try:
+        with open(expected_file, 'r') as f:
+            content = f.read()
+    except FileNotFoundError:
+        log.error("❌ File '%s' was NOT created", expected_file)
+        log.info("   This indicates the Actor step failed to execute")
+        return False
+    
+    try:
+        log.info("✅ File '%s' was created", expected_file)
         
         # Check file content
-        with open(expected_file, 'r') as f:
-            actual_content = f.read().strip()
+        actual_content = content.strip()
         
-        print(f"   Expected content: '{expected_content}'")
-        print(f"   Actual content:   '{actual_content}'")
+        log.info("   Expected content: '%s'", expected_content)
+        log.info("   Actual content:   '%s'", actual_content)
         
         if expected_content in actual_content or actual_content in expected_content:
-            print("✅ File content matches!")
+            log.info("✅ File content matches!")
         else:
-            print("⚠️  File content doesn't exactly match (might still be valid)")
-    else:
-        print(f"❌ File '{expected_file}' was NOT created")
-        print("   This indicates the Actor step failed to execute")
-        return False
-    
-    # ========================================================================
-    # STEP 5: ASSERTIONS
-    # ========================================================================
-    print_section("STEP 5: VALIDATION", "-")
-    
-    try:
+            log.info("⚠️  File content doesn't exactly match (might still be valid)")
+        
+        # ====================================================================
+        # STEP 5: ASSERTIONS
+        # ====================================================================
+        print_section("STEP 5: VALIDATION", "-")
+        
         # Assert basic structure
         assert result is not None, "Result should not be None"
         assert 'plan' in result, "Result must contain 'plan'"
@@ -179,48 +237,50 @@ def test_e2e_workflow():
         assert result['current_step_index'] >= len(result['plan']), \
             f"Workflow should complete all steps (index={result['current_step_index']}, total={len(result['plan'])})"
         
-        # Assert file creation
-        assert os.path.exists(expected_file), f"File '{expected_file}' must exist"
-        
-        with open(expected_file, 'r') as f:
-            content = f.read()
+        # Assert file creation (content was read above)
         assert len(content) > 0, "File must have content"
         
-        print("✅ All assertions passed!")
-        print("✅ Workflow completed successfully")
-        print("✅ File was created with correct content")
-        print("✅ LangGraph routing worked correctly")
+        log.info("✅ All assertions passed!")
+        log.info("✅ Workflow completed successfully")
+        log.info("✅ File was created with correct content")
+        log.info("✅ LangGraph routing worked correctly")
         
         print_section("TEST RESULT: PASSED ✅", "=")
-        
-        # Cleanup
-        print("\n🧹 Cleaning up test file...")
-        os.remove(expected_file)
-        print("✅ Cleanup complete")
-        
         return True
         
     except AssertionError as e:
-        print(f"❌ Assertion failed: {e}")
+        log.error("❌ Assertion failed: %s", e)
         print_section("TEST RESULT: FAILED ❌", "=")
-        
-        # Cleanup even on failure
-        if os.path.exists(expected_file):
-            print("\n🧹 Cleaning up test file...")
-            os.remove(expected_file)
-        
         return False
     except Exception as e:
-        print(f"❌ Unexpected error: {e}")
+        log.error("❌ Unexpected error: %s", e)
         print_section("TEST RESULT: ERROR ❌", "=")
         return False
 
+def test_e2e_workflow_canned(monkeypatch):
+    """Workflow checks and cleanup against a canned run_agent (no LLM)."""
+    intents = []
+
+    def run(intent):
+        intents.append(intent)
+        return canned_run_agent(intent)
+
+    monkeypatch.setitem(globals(), "run_agent", run)
+    
+    assert test_e2e_workflow() is True
+    path = _INTENT_FILE.search(intents[0]).group(1)
+    assert not os.path.exists(os.path.dirname(path)), "Scratch directory should be removed"
+
+
 if __name__ == "__main__":
-    print("\n" + "="*70)
-    print("  🚀 Starting End-to-End Workflow Test")
-    print("  ⚠️  This test requires Ollama running with gpt-oss:20b and llama3.1:8b")
-    print("  ⏱️  Expected duration: 2-3 minutes")
-    print("="*70)
+    logging.basicConfig(format="%(message)s")
+    if os.getenv("SKIP_LLM"):
+        run_agent = canned_run_agent
+    log.info("\n" + _BAR_EQ)
+    log.info("  🚀 Starting End-to-End Workflow Test")
+    log.info("  ⚠️  This test requires Ollama running with gpt-oss:20b and llama3.1:8b")
+    log.info("  ⏱️  Expected duration: 2-3 minutes")
+    log.info(_BAR_EQ)
     
     success = test_e2e_workflow()
     sys.exit(0 if success else 1)
@@ -0,0 +1,183 @@
+"""
+Test File Operations - Unit tests for the file-operations skill script
+
+Exercises the deterministic helpers in
+core/skills/file-operations/scripts/file_ops.py directly (no LLM).
+"""
+
+import pytest
+from pathlib import Path
+import importlib.util
+import tempfile
+import shutil
+
+
+FILE_OPS_PATH = (
+    Path(__file__).parent.parent
+    / "core" / "skills" / "file-operations" / "scripts" / "file_ops.py"
+)
+
+# The skill directory name contains a hyphen, so load it by path
+_spec = importlib.util.spec_from_file_location("file_ops", FILE_OPS_PATH)
+file_ops = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(file_ops)
+
+
+class TestFileOps:
+    """Test suite for file_ops helpers."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a temporary directory for testing."""
+        temp = Path(tempfile.mkdtemp())
+        yield temp
+        # Cleanup
+        if temp.exists():
+            shutil.rmtree(temp)
+
+    def test_read_text(self, temp_dir):
+        """Test reading text, including newline normalization."""
+        path = temp_dir / "notes.txt"
+        path.write_bytes("line 1\r\nline 2 é\n".encode("utf-8"))
+
+        assert file_ops.read_text(str(path)) == "line 1\nline 2 é\n"
+
+    def test_read_text_max_bytes(self, temp_dir):
+        """Test that truncated reads never split a multi-byte character."""
+        path = temp_dir / "notes.txt"
+        path.write_bytes("abé".encode("utf-8"))
+
+        # 'é' is two bytes; cutting after the first must drop it
+        assert file_ops.read_text(str(path), max_bytes=3) == "ab"
+        assert file_ops.read_text(str(path), max_bytes=4) == "abé"
+
+    def test_read_missing_file(self, temp_dir):
+        """Test that reading a missing file returns None."""
+        assert file_ops.read_text(str(temp_dir / "missing.txt")) is None
+
+    def test_read_csv_columns(self, temp_dir):
+        """Test column-major CSV reading."""
+        path = temp_dir / "data.csv"
+        path.write_text("ticker,qty\nAAPL,10\nMSFT,\n", encoding="utf-8")
+
+        columns = file_ops.read_csv_columns(str(path))
+        assert columns == {"ticker": ["AAPL", "MSFT"], "qty": ["10", ""]}
+
+    def test_json_roundtrip(self, temp_dir):
+        """Test write_json / read_json, pretty and compact."""
+        path = str(temp_dir / "config.json")
+        data = {"name": "finn", "ids": [1, 2], 3: "non-str key"}
+
+        assert file_ops.write_json(path, data) is True
+        assert file_ops.read_json(path) == {"name": "finn", "ids": [1, 2], "3": "non-str key"}
+        assert "\n" not in Path(path).read_text(encoding="utf-8")
+
+        assert file_ops.write_json(path, data, pretty=True) is True
+        assert '\n  "name": "finn"' in Path(path).read_text(encoding="utf-8")
+
+    def test_append_json_line(self, temp_dir):
+        """Test JSON Lines appends."""
+        path = temp_dir / "logs" / "events.jsonl"
+
+        assert file_ops.append_json_line(str(path), {"event": "start"}) is True
+        assert file_ops.append_json_line(str(path), {"event": "stop"}) is True
+        assert path.read_text(encoding="utf-8") == '{"event":"start"}\n{"event":"stop"}\n'
+
+    def test_copy_file(self, temp_dir):
+        """Test copying a file, including into an existing directory."""
+        src = temp_dir / "src.bin"
+        src.write_bytes(b"\x00payload" * 1000)
+
+        dst = temp_dir / "nested" / "dst.bin"
+        assert file_ops.copy_file(str(src), str(dst)) is True
+        assert dst.read_bytes() == src.read_bytes()
+        assert dst.stat().st_mtime == src.stat().st_mtime
+
+        assert file_ops.copy_file(str(src), str(temp_dir / "nested")) is True
+        assert (temp_dir / "nested" / "src.bin").read_bytes() == src.read_bytes()
+
+    def test_copy_file_onto_itself(self, temp_dir):
+        """Test copying a file onto itself fails and keeps its contents."""
+        src = temp_dir / "same.txt"
+        src.write_text("keep me", encoding="utf-8")
+
+        assert file_ops.copy_file(str(src), str(src)) is False
+        # Copying into its own directory resolves back to src
+        assert file_ops.copy_file(str(src), str(temp_dir)) is False
+        assert src.read_text(encoding="utf-8") == "keep me"
+
+    def test_files_exist(self, temp_dir):
+        """Test batched existence checks keep input order."""
+        (temp_dir / "a.txt").write_text("a", encoding="utf-8")
+        (temp_dir / "b.txt").write_text("b", encoding="utf-8")
+        (temp_dir / "sub").mkdir()
+
+        paths = [
+            str(temp_dir / "b.txt"),
+            str(temp_dir / "missing.txt"),
+            str(temp_dir / "sub"),          # directory, not a file
+            str(temp_dir / "a.txt"),
+            str(temp_dir / "nodir" / "x.txt"),
+        ]
+        assert file_ops.files_exist(paths) == [True, False, False, True, False]
+        assert file_ops.execute("files_exist", filepaths=paths[:1]) == [True]
+
+    def test_move_file(self, temp_dir):
+        """Test moving a file, overwriting, and moving into a directory."""
+        src = temp_dir / "a.txt"
+        src.write_text("new", encoding="utf-8")
+        dst = temp_dir / "b.txt"
+        dst.write_text("old", encoding="utf-8")
+
+        assert file_ops.move_file(str(src), str(dst)) is True
+        assert not src.exists()
+        assert dst.read_text(encoding="utf-8") == "new"
+
+        (temp_dir / "archive").mkdir()
+        assert file_ops.move_file(str(dst), str(temp_dir / "archive")) is True
+        assert (temp_dir / "archive" / "b.txt").read_text(encoding="utf-8") == "new"
+
+        assert file_ops.move_file(str(temp_dir / "missing"), str(dst)) is False
+
+    def test_list_and_iter_dir(self, temp_dir):
+        """Test list_dir names and lazy iter_dir entries."""
+        (temp_dir / "a.txt").write_text("a", encoding="utf-8")
+        (temp_dir / "sub").mkdir()
+
+        assert sorted(file_ops.list_dir(str(temp_dir))) == ["a.txt", "sub"]
+
+        files = [e.name for e in file_ops.iter_dir(str(temp_dir)) if e.is_file()]
+        assert files == ["a.txt"]
+        assert list(file_ops.iter_dir(str(temp_dir / "missing"))) == []
+
+    def test_read_large_json(self, temp_dir):
+        """Test reading a JSON file above the mmap threshold."""
+        path = str(temp_dir / "large.json")
+        data = {"rows": [{"id": i, "name": f"row-{i}"} for i in range(5000)]}
+
+        assert file_ops.write_json(path, data, pretty=True) is True
+        assert Path(path).stat().st_size >= file_ops.JSON_MMAP_THRESHOLD
+        assert file_ops.read_json(path) == data
+
+    def test_write_and_read_roundtrip(self, temp_dir):
+        """Test write_text / read_text through execute()."""
+        path = str(temp_dir / "sub" / "out.txt")
+
+        assert file_ops.execute("write_text", filepath=path, content="hello") is True
+        assert file_ops.execute("read_text", filepath=path) == "hello"
+
+    def test_write_text_overwrites(self, temp_dir):
+        """Test that write_text truncates and honors create_dirs."""
+        path = temp_dir / "out.txt"
+
+        assert file_ops.write_text(str(path), "a much longer first version") is True
+        assert file_ops.write_text(str(path), "short é") is True
+        assert path.read_text(encoding="utf-8") == "short é"
+
+        missing = temp_dir / "no" / "such" / "dir.txt"
+        assert file_ops.write_text(str(missing), "x", create_dirs=False) is False
+        assert not missing.exists()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -13,6 +13,7 @@ Implements:
 """
 
 import pytest
+import re
 import sys
 import os
 from pathlib import Path
@@ -25,6 +26,9 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from core.memory_manager import MemoryManager
 
+# LOG.md entry timestamps (YYYY-MM-DD HH:MM:SS)
+_TIMESTAMP = re.compile(r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}')
+
 
 class TestMemoryIntegration:
     """Integration tests for the persistent memory system."""
@@ -246,8 +250,7 @@ class TestMemoryIntegration:
         log_content = memory_manager.read_log()
         
         # Check for ISO timestamp format (YYYY-MM-DD)
-        import re
-        timestamps = re.findall(r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}', log_content)
+        timestamps = _TIMESTAMP.findall(log_content)
         assert len(timestamps) >= 3, f"Should have at least 3 timestamps, found {len(timestamps)}"
         print(f"✓ Step 3: Found {len(timestamps)} timestamps in LOG.md")
         
@@ -12,8 +12,9 @@ from pathlib import Path
 import tempfile
 import shutil
 import os
+import time
 
-from core.memory_manager import MemoryManager
+from core.memory_manager import MemoryManager, get_memory_manager, FACTS_PER_INSERT
 
 
 class TestMemoryManager:
@@ -43,6 +44,14 @@ class TestMemoryManager:
         now_content = memory_manager.read_now()
         assert "Status: Idle" in now_content
     
+    def test_cold_memory_is_lazy(self, memory_manager):
+        """Test that LanceDB is only connected when cold memory is used."""
+        memory_manager.save_fact("k", "v")
+        memory_manager.format_context_for_prompt()
+        
+        assert memory_manager._lance_initialized is False
+        assert not memory_manager.lancedb_path.exists()
+    
     def test_update_now(self, memory_manager):
         """Test updating NOW.md."""
         success = memory_manager.update_now(
@@ -58,6 +67,25 @@ class TestMemoryManager:
         assert "Run tests" in content
         assert "Verify functionality" in content
     
+    def test_update_now_write_back(self, memory_manager):
+        """Test that NOW.md is served from memory and written on flush."""
+        memory_manager.update_now("Step 1")
+        memory_manager.update_now("Step 2")
+        assert "Status: Step 2" in memory_manager.read_now()
+        
+        # A restart on the same memory sees the latest status
+        restarted = MemoryManager("test_agent", base_path=memory_manager.base_path)
+        assert "Status: Step 2" in restarted.read_now()
+        assert "Status: Step 2" in memory_manager.now_file.read_text(encoding="utf-8")
+    
+    def test_read_now_sees_other_instance(self, memory_manager):
+        """Test that a status set through one instance is read by another."""
+        other = MemoryManager("test_agent", base_path=memory_manager.base_path)
+        other.read_now()
+        
+        memory_manager.update_now("Step 3")
+        assert "Status: Step 3" in other.read_now()
+    
     def test_append_log(self, memory_manager):
         """Test appending to LOG.md."""
         success = memory_manager.append_log(
@@ -73,6 +101,127 @@ class TestMemoryManager:
         assert "TOOL_USE" in log_content
         assert "Created test file" in log_content
     
+    def test_append_logs_batch(self, memory_manager):
+        """Test appending several LOG.md entries in one batch."""
+        success = memory_manager.append_logs([
+            ("THOUGHT", "First thought", None),
+            ("TOOL_USE", "Used a tool", {"tool": "x"}, "2024-01-01 12:00:00"),
+        ])
+        
+        assert success is True
+        
+        log_content = memory_manager.read_log()
+        assert log_content.index("First thought") < log_content.index("Used a tool")
+        assert "## [TOOL_USE] 2024-01-01 12:00:00" in log_content
+    
+    def test_log_write_behind(self, memory_manager):
+        """Test that entries are buffered until a read, flush() or an ERROR."""
+        size = memory_manager.log_file.stat().st_size
+        
+        memory_manager.append_log("THOUGHT", "Buffered thought")
+        assert memory_manager.log_file.stat().st_size == size
+        
+        # Another instance on the same memory sees the buffered entry
+        restarted = MemoryManager("test_agent", base_path=memory_manager.base_path)
+        assert "Buffered thought" in restarted.read_log()
+        
+        memory_manager.append_log("ERROR", "Written immediately")
+        assert "Written immediately" in memory_manager.log_file.read_text(encoding="utf-8")
+    
+    def test_background_writer_flushes(self, memory_manager):
+        """Test that buffered entries reach LOG.md without an explicit flush."""
+        memory_manager.append_log("THOUGHT", "Written in the background")
+        
+        deadline = time.monotonic() + 2
+        while time.monotonic() < deadline:
+            if "Written in the background" in memory_manager.log_file.read_text(encoding="utf-8"):
+                break
+            time.sleep(0.01)
+        else:
+            pytest.fail("background writer did not flush LOG.md")
+    
+    def test_log_handle_kept_open(self, memory_manager):
+        """Test that batches reuse one LOG.md handle and survive a deleted file."""
+        memory_manager.append_log("THOUGHT", "first")
+        memory_manager.flush()
+        handle = memory_manager._log_fd
+        
+        memory_manager.append_log("THOUGHT", "second")
+        memory_manager.flush()
+        assert memory_manager._log_fd == handle
+        
+        memory_manager.log_file.unlink()
+        memory_manager.append_log("THOUGHT", "third")
+        memory_manager.close()
+        assert memory_manager.log_file.read_text(encoding="utf-8").count("third") == 1
+    
+    def test_log_tail_matches_file(self, memory_manager):
+        """Test that read_log(n) from the in-memory tail matches LOG.md."""
+        def from_file(n):
+            entries = memory_manager.log_file.read_text(encoding="utf-8").split("\n---\n")
+            return "\n---\n".join(entries[-n:])
+        
+        for i in range(5):
+            memory_manager.append_log("THOUGHT", f"entry {i}")
+            assert memory_manager.read_log(last_n_entries=3) == from_file(3)
+        
+        # A write from outside the manager is picked up
+        with open(memory_manager.log_file, "a", encoding="utf-8") as f:
+            f.write("\n## [SYSTEM] external\n\n---\n")
+        assert "external" in memory_manager.read_log(last_n_entries=2)
+        assert memory_manager.read_log(last_n_entries=2) == from_file(2)
+    
+    def test_read_log_tail(self, memory_manager):
+        """Test that the byte-bounded tail holds the newest entries only."""
+        for i in range(50):
+            memory_manager.append_log("THOUGHT", f"entry {i:02d} é")
+        
+        tail = memory_manager.read_log_tail(max_bytes=300)
+        assert "entry 49 é" in tail
+        assert "entry 00" not in tail
+        assert len(tail.encode("utf-8")) <= 300
+        assert memory_manager.read_log().endswith(tail)
+    
+    def test_rotate_log_keeps_pinned_entries(self, memory_manager):
+        """Test that rotation trims LOG.md but keeps newest and pinned entries."""
+        memory_manager.log_max_size_kb = 1
+        memory_manager.log_rotate_size_kb = 4
+        memory_manager.append_log("ERROR", "disk full")
+        for i in range(60):
+            memory_manager.append_log("THOUGHT", f"thought {i:02d} " + "x" * 40)
+        memory_manager.flush()
+    
+        content = memory_manager.log_file.read_text(encoding="utf-8")
+        assert len(content.encode("utf-8")) < 4 * 1024
+        assert "## Summary of Previous Activity" in content
+        assert "disk full" in content
+        assert "thought 59" in content
+        assert "thought 00" not in content
+        assert memory_manager.read_log(last_n_entries=2).strip().startswith("## [THOUGHT]")
+    
+        with memory_manager._db_lock:
+            summary, = memory_manager._db.execute(
+                "SELECT summary FROM compaction_history"
+            ).fetchone()
+        assert "THOUGHT" in summary
+    
+    def test_prune_log_metadata(self, memory_manager):
+        """Test that old compacted metadata is deleted except pinned types."""
+        memory_manager.append_logs([("THOUGHT", "old", None), ("ERROR", "old", None), ("THOUGHT", "new", None)])
+        memory_manager.flush()
+        with memory_manager._db_lock, memory_manager._db:
+            memory_manager._db.execute(
+                """UPDATE log_metadata SET compacted = 1,
+                   timestamp = datetime('now', '-90 days') WHERE id < 3"""
+            )
+    
+        assert memory_manager._prune_log_metadata() == 1
+        with memory_manager._db_lock:
+            rows = memory_manager._db.execute(
+                "SELECT entry_type FROM log_metadata ORDER BY id"
+            ).fetchall()
+        assert rows == [("ERROR",), ("THOUGHT",)]
+    
     def test_save_and_get_fact(self, memory_manager):
         """Test saving and retrieving user facts."""
         # Save fact
@@ -91,6 +240,29 @@ class TestMemoryManager:
         none_value = memory_manager.get_fact("nonexistent")
         assert none_value is None
     
+    def test_save_facts_bulk(self, memory_manager):
+        """Test saving several facts in one transaction."""
+        success = memory_manager.save_facts([
+            ("color", "blue", "preference"),
+            ("city", "Lisbon", "personal"),
+        ])
+        
+        assert success is True
+        assert memory_manager.get_fact("color") == "blue"
+        assert memory_manager.get_all_facts(category="personal") == {"city": "Lisbon"}
+        assert "Saved fact: city = Lisbon" in memory_manager.read_log()
+        
+        # Spans several multi-row INSERTs; the last duplicate wins
+        facts = [(f"k{i}", str(i), "bulk") for i in range(FACTS_PER_INSERT + 10)]
+        facts.append(("k0", "last", "bulk"))
+        assert memory_manager.save_facts(facts) is True
+        
+        stored = memory_manager.get_all_facts(category="bulk")
+        assert len(stored) == FACTS_PER_INSERT + 10
+        assert stored["k0"] == "last"
+        restarted = MemoryManager("test_agent", base_path=memory_manager.base_path)
+        assert restarted.get_all_facts(category="bulk") == stored
+    
     def test_get_all_facts(self, memory_manager):
         """Test retrieving all facts."""
         # Save multiple facts
@@ -106,6 +278,23 @@ class TestMemoryManager:
         # Get facts by category
         category1_facts = memory_manager.get_all_facts(category="category1")
         assert len(category1_facts) == 2
+        
+        # Re-saving under another category moves the fact
+        memory_manager.save_fact("fact1", "value1b", "category2")
+        assert memory_manager.get_all_facts(category="category1") == {"fact3": "value3"}
+        assert memory_manager.get_all_facts(category="category2") == {"fact2": "value2", "fact1": "value1b"}
+        assert memory_manager.get_all_facts(category="missing") == {}
+    
+    def test_fact_cache_sees_other_writers(self, memory_manager):
+        """Test that cached facts refresh after another instance writes."""
+        memory_manager.save_fact("mode", "fast")
+        assert memory_manager.get_fact("mode") == "fast"
+        
+        other = MemoryManager("test_agent", base_path=memory_manager.base_path)
+        other.save_fact("mode", "safe", "config")
+        
+        assert memory_manager.get_fact("mode") == "safe"
+        assert memory_manager.get_all_facts(category="config") == {"mode": "safe"}
     
     def test_context_reading(self, memory_manager):
         """Test reading full context."""
@@ -125,6 +314,11 @@ class TestMemoryManager:
         assert "Working on tests" in context["now"]
         assert "Testing context reading" in context["log"]
         assert "user_name" in context["facts"]
+        
+        # Unchanged memory: the same read-only snapshot
+        assert memory_manager.read_context() is context
+        with pytest.raises(TypeError):
+            context["now"] = "overwritten"
     
     def test_formatted_context_for_prompt(self, memory_manager):
         """Test formatted context for LLM prompts."""
@@ -137,6 +331,81 @@ class TestMemoryManager:
         assert "RECENT ACTIVITY LOG" in formatted
         assert "Active task" in formatted
     
+    def test_formatted_context_is_cached(self, memory_manager):
+        """Test that the prompt context is reused until memory changes."""
+        first = memory_manager.format_context_for_prompt()
+        assert memory_manager.format_context_for_prompt() is first
+        
+        memory_manager.append_log("THOUGHT", "New thought")
+        second = memory_manager.format_context_for_prompt()
+        assert "New thought" in second
+        
+        memory_manager.save_fact("user_name", "Ada")
+        assert "Ada" in memory_manager.format_context_for_prompt()
+    
+    def test_get_embeddings_batches_request(self, memory_manager, monkeypatch):
+        """Test that several texts are embedded with one /api/embed call."""
+        calls = []
+        
+        class FakeResponse:
+            status_code = 200
+            def __init__(self, payload):
+                self._payload = payload
+            def json(self):
+                return self._payload
+        
+        def fake_post(url, json):
+            calls.append(url)
+            return FakeResponse({"embeddings": [[float(i)] for i in range(len(json["input"]))]})
+        
+        monkeypatch.setattr("core.memory_manager.requests.post", fake_post)
+        
+        embeddings = memory_manager._get_embeddings(["a", "b", "c"])
+        
+        assert embeddings == [[0.0], [1.0], [2.0]]
+        assert len(calls) == 1 and calls[0].endswith("/api/embed")
+    
+    def test_vector_index_built_once(self, memory_manager, monkeypatch, recwarn):
+        """Test the ANN index is built at the row threshold, then never rechecked."""
+        pytest.importorskip("lancedb")
+        np = pytest.importorskip("numpy")
+        rng = np.random.default_rng(0)
+        monkeypatch.setattr(
+            memory_manager, "_get_embedding",
+            lambda text: rng.random(8, dtype=np.float32).tolist()
+        )
+        memory_manager.vector_index_min_rows = 64
+        
+        # Below the threshold: flat search, check still pending
+        assert memory_manager.store_memory("first")
+        assert memory_manager.store_memory("second")
+        tbl = memory_manager.lance_db.open_table("test_agent_memory")
+        assert tbl.list_indices() == []
+        assert memory_manager._vector_index_checked is False
+        
+        tbl.add([
+            {"id": f"bulk_{i}", "vector": rng.random(8, dtype=np.float32).tolist(), "text": "t", "metadata": ""}
+            for i in range(61)
+        ])
+        assert memory_manager.store_memory("at threshold")
+        
+        tbl = memory_manager.lance_db.open_table("test_agent_memory")
+        indices = tbl.list_indices()
+        assert len(indices) == 1 and indices[0].index_type == "IvfHnswSq"
+        assert memory_manager._vector_index_checked is True
+        assert not [w for w in recwarn if "create_index" in str(w.message)]
+        
+        # Once checked, the table is not queried again
+        class Untouchable:
+            def __getattr__(self, name):
+                raise AssertionError(f"table accessed: {name}")
+        
+        memory_manager._ensure_vector_index(Untouchable())
+        assert memory_manager.store_memory("after index")
+        tbl = memory_manager.lance_db.open_table("test_agent_memory")
+        assert tbl.count_rows() == 65
+        assert len(tbl.list_indices()) == 1
+    
     def test_agent_isolation(self, temp_dir):
         """Test that different agents have isolated memory."""
         agent1 = MemoryManager("agent1", base_path=temp_dir / "agent1")
@@ -152,7 +421,51 @@ class TestMemoryManager:
         
         # Verify different directories
         assert agent1.memory_path != agent2.memory_path
+    
+    def test_in_memory_database(self, temp_dir):
+        """Test that in_memory managers keep SQLite off disk and private."""
+        manager = MemoryManager("test_agent", base_path=temp_dir / "test_agent", in_memory=True)
+        manager.save_fact("key", "value")
+        
+        assert manager.get_fact("key") == "value"
+        assert "Saved fact: key = value" in manager.read_log()
+        assert not manager.db_file.exists()
+        
+        other = MemoryManager("test_agent", base_path=temp_dir / "test_agent", in_memory=True)
+        assert other.get_fact("key") is None
+    
+    def test_get_memory_manager_is_shared(self, temp_dir):
+        """Test that skills reuse one manager per agent and path."""
+        first = get_memory_manager("test_agent", temp_dir / "test_agent")
+        second = get_memory_manager("test_agent", temp_dir / "test_agent")
+        other = get_memory_manager("other_agent", temp_dir / "other_agent")
+        
+        assert first is second
+        assert first is not other
 
+    
+    def test_get_memory_manager_after_reset(self, temp_dir):
+        """Test that a deleted memory directory gets a fresh shared manager."""
+        base_path = temp_dir / "test_agent"
+        first = get_memory_manager("test_agent", base_path)
+        first.save_fact("k1", "v1")
+        shutil.rmtree(base_path)
+        
+        second = get_memory_manager("test_agent", base_path)
+        assert second is not first
+        assert second.save_fact("k2", "v2")
+        assert MemoryManager("test_agent", base_path=base_path).get_fact("k2") == "v2"    
+    def test_log_activity_error_visible_immediately(self, temp_dir):
+        """Test that a log_activity ERROR reaches LOG.md and the prompt at once."""
+        from core.skills.memory.scripts import log_activity
+        
+        base_path = temp_dir / "test_agent"
+        assert log_activity.execute("test_agent", "ERROR", "disk full!", base_path=base_path)
+        
+        manager = get_memory_manager("test_agent", base_path)
+        assert "disk full!" in manager.memory_path.joinpath("LOG.md").read_text(encoding="utf-8")
+        assert "disk full!" in manager.read_log()
+        assert "disk full!" in manager.format_context_for_prompt()
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,48 @@
+"""
+Test Observability - Unit tests for core/observability.py
+
+Checks that concurrent runs record separate traces on the shared tracer.
+"""
+
+import pytest
+import sys
+import os
+import threading
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import core.observability as observability
+from core.observability import SimpleTracer
+
+
+def test_concurrent_traces_are_separate(monkeypatch, capsys):
+    """Test that each thread's spans land in its own trace."""
+    monkeypatch.setattr(observability, "ENABLE_TRACING", True)
+    tracer = SimpleTracer()
+    started = threading.Barrier(2)
+
+    def run(name):
+        tracer.start_trace(name)
+        # Both traces are open before either adds spans or ends
+        started.wait()
+        for i in range(3):
+            tracer.add_span(f"{name}.{i}", "agent", {})
+        started.wait()
+        tracer.end_trace()
+
+    threads = [threading.Thread(target=run, args=(name,)) for name in ("a", "b")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    traces = {trace["name"]: trace for trace in tracer.get_traces()}
+    assert sorted(traces) == ["a", "b"]
+    for name, trace in traces.items():
+        assert [span["name"] for span in trace["spans"]] == [f"{name}.{i}" for i in range(3)]
+    assert tracer.current_trace is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -2,6 +2,7 @@
 
 import sys
 import os
+import pytest
 
 # Use Ollama for testing
 os.environ["LLM_PROVIDER"] = "ollama"
@@ -13,6 +14,8 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from core.state import AgentState
 from core.nodes.planner import planner_node
 
+@pytest.mark.llm
+@pytest.mark.slow
 def test_planner_pydantic():
     """Test the Pydantic AI-based Planner node."""
     print("=== Testing Pydantic AI Planner Node ===\n")
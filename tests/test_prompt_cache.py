@@ -0,0 +1,93 @@
+"""
+Test Prompt Cache - Unit tests for core/prompt_cache.py
+
+Covers exact/semantic lookup, literal scoping, LRU eviction and SQLite
+persistence. No LLM or embedding server needed (vectors are hand-made).
+"""
+
+import pytest
+import sys
+import os
+import tempfile
+import shutil
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.prompt_cache import PromptCache, NUMPY_AVAILABLE
+from core.models import Plan
+
+
+def make_plan(objective: str) -> Plan:
+    return Plan(
+        objective=objective,
+        plan=[{"role": "Actor", "instruction": objective}],
+        total_steps=1
+    )
+
+
+class TestPromptCache:
+    """Test suite for PromptCache."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a temporary directory for testing."""
+        temp = Path(tempfile.mkdtemp())
+        yield temp
+        # Cleanup
+        if temp.exists():
+            shutil.rmtree(temp)
+
+    def test_exact_hit_returns_fresh_instance(self):
+        """Test exact lookups re-validate into a new model instance."""
+        cache = PromptCache(path=None)
+        scope, key = cache.make_keys("Create test.txt", "system", Plan)
+        plan = make_plan("Create test.txt")
+        cache.put(key, scope, plan)
+
+        hit = cache.get(key, Plan)
+        assert hit == plan
+        assert hit is not plan
+        assert cache.get(cache.make_keys("Create test.txt", "other system", Plan)[1], Plan) is None
+
+    def test_literals_change_scope(self):
+        """Test that differing quoted/file/number literals split the scope."""
+        scope_a, _ = PromptCache.make_keys("Create a.txt", "", Plan)
+        scope_b, _ = PromptCache.make_keys("Create b.txt", "", Plan)
+        scope_a2, _ = PromptCache.make_keys("Please write a.txt", "", Plan)
+
+        assert scope_a != scope_b
+        assert scope_a == scope_a2
+
+    @pytest.mark.skipif(not NUMPY_AVAILABLE, reason="numpy not installed")
+    def test_semantic_threshold(self):
+        """Test semantic hits honor the similarity threshold."""
+        cache = PromptCache(path=None, threshold=0.9)
+        scope, key = cache.make_keys("Summarize holdings", "", Plan)
+        cache.put(key, scope, make_plan("summary"), embedding=[1.0, 0.0, 0.0])
+
+        assert cache.get_similar(scope, [0.99, 0.05, 0.0], Plan).objective == "summary"
+        assert cache.get_similar(scope, [0.5, 0.5, 0.5], Plan) is None
+        assert cache.get_similar("other-scope", [1.0, 0.0, 0.0], Plan) is None
+
+    def test_lru_eviction_and_persistence(self, temp_dir):
+        """Test eviction order and reload from SQLite."""
+        path = temp_dir / "cache.sqlite"
+        cache = PromptCache(path=path, max_entries=2)
+        keys = []
+        for name in ("one", "two", "three"):
+            scope, key = cache.make_keys(name, "", Plan)
+            cache.put(key, scope, make_plan(name), embedding=[1.0, 0.0])
+            keys.append(key)
+
+        assert len(cache) == 2
+        assert cache.get(keys[0], Plan) is None
+
+        reloaded = PromptCache(path=path, max_entries=2)
+        assert len(reloaded) == 2
+        assert reloaded.get(keys[2], Plan).objective == "three"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -11,22 +11,33 @@ This is an ongoing test suite - add new cases as edge cases are discovered.
 
 Usage:
     pytest tests/test_skill_intent_recognition.py -v
+    pytest tests/test_skill_intent_recognition.py -k TC001       # one case
+    pytest tests/test_skill_intent_recognition.py -k portfolio   # by tag
 """
 
+import re
+import os
 import sys
+import logging
+import functools
+import pytest
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from types import SimpleNamespace
+from typing import Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from core.agent import Agent
 from core.state import AgentState
 from core.nodes.planner import planner_node
 
+# Lazy %-style logging: shown for failing tests, or live with --log-cli-level
+log = logging.getLogger("agentos.tests")
+log.setLevel(os.getenv("TEST_LOG_LEVEL", "INFO"))
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class IntentTestCase:
     """
     Represents a test case for intent recognition.
@@ -34,58 +45,58 @@ class IntentTestCase:
     Attributes:
         id: Unique test case identifier
         user_input: What the user asks
-        expected_skills: List of skill names that should be identified
+        expected_skills: Skill names that should be identified
         expected_plan_steps: Expected number of plan steps (approximate)
         description: Human-readable description of what we're testing
         tags: Categories for organizing tests (e.g., "database", "portfolio", "read")
     """
     id: str
     user_input: str
-    expected_skills: List[str]
+    expected_skills: Tuple[str, ...]
     expected_plan_steps: int
     description: str
-    tags: List[str] = None
+    tags: Tuple[str, ...] = ()
     
     # Optional: More specific assertions
-    should_not_use_skills: List[str] = None  # Skills that should NOT be called
-    expected_output_type: str = None  # "table", "chart", "json", "narrative"
+    should_not_use_skills: Tuple[str, ...] = ()  # Skills that should NOT be called
+    expected_output_type: Optional[str] = None  # "table", "chart", "json", "narrative"
 
 
 # ============================================================================
 # TEST CASES LIBRARY
 # ============================================================================
 
-INTENT_TEST_CASES = [
+INTENT_TEST_CASES: Tuple[IntentTestCase, ...] = (
     
     # ========== PORTFOLIO READ OPERATIONS ==========
     
     IntentTestCase(
         id="TC001",
         user_input="Show me my portfolio holdings",
-        expected_skills=["get_portfolio_holdings"],
+        expected_skills=("get_portfolio_holdings",),
         expected_plan_steps=2,  # Read + Present
         description="Basic portfolio read - should use get_portfolio_holdings skill",
-        tags=["portfolio", "read", "database"],
+        tags=("portfolio", "read", "database"),
         expected_output_type="table"
     ),
     
     IntentTestCase(
         id="TC002",
         user_input="What stocks do I own?",
-        expected_skills=["get_portfolio_holdings"],
+        expected_skills=("get_portfolio_holdings",),
         expected_plan_steps=2,
         description="Natural language portfolio query - same as TC001",
-        tags=["portfolio", "read", "natural_language"],
+        tags=("portfolio", "read", "natural_language"),
         expected_output_type="table"
     ),
     
     IntentTestCase(
         id="TC003",
         user_input="List all my investments",
-        expected_skills=["get_portfolio_holdings"],
+        expected_skills=("get_portfolio_holdings",),
         expected_plan_steps=2,
         description="Another variant of portfolio read",
-        tags=["portfolio", "read", "natural_language"],
+        tags=("portfolio", "read", "natural_language"),
         expected_output_type="table"
     ),
     
@@ -94,20 +105,20 @@ INTENT_TEST_CASES = [
     IntentTestCase(
         id="TC004",
         user_input="Add Apple stock to my portfolio",
-        expected_skills=["db_upsert_asset"],
+        expected_skills=("db_upsert_asset",),
         expected_plan_steps=3,  # Gather info + Upsert + Confirm
         description="Adding a new asset - should use db_upsert_asset",
-        tags=["portfolio", "write", "database", "asset"],
-        should_not_use_skills=["get_portfolio_holdings"]
+        tags=("portfolio", "write", "database", "asset"),
+        should_not_use_skills=("get_portfolio_holdings",)
     ),
     
     IntentTestCase(
         id="TC005",
         user_input="I bought 100 shares of TSLA yesterday",
-        expected_skills=["db_upsert_asset"],
+        expected_skills=("db_upsert_asset",),
         expected_plan_steps=3,
         description="Implicit asset addition with transaction details",
-        tags=["portfolio", "write", "transaction", "natural_language"],
+        tags=("portfolio", "write", "transaction", "natural_language"),
     ),
     
     # ========== DATABASE SETUP ==========
@@ -115,19 +126,19 @@ INTENT_TEST_CASES = [
     IntentTestCase(
         id="TC006",
         user_input="Initialize the portfolio database",
-        expected_skills=["initialize_portfolio_database"],
+        expected_skills=("initialize_portfolio_database",),
         expected_plan_steps=1,
         description="Database initialization - setup operation",
-        tags=["database", "setup", "initialization"],
+        tags=("database", "setup", "initialization"),
     ),
     
     IntentTestCase(
         id="TC007",
         user_input="Set up my portfolio tracking system",
-        expected_skills=["initialize_portfolio_database"],
+        expected_skills=("initialize_portfolio_database",),
         expected_plan_steps=2,  # Initialize + Confirm
         description="Natural language database setup",
-        tags=["database", "setup", "natural_language"],
+        tags=("database", "setup", "natural_language"),
     ),
     
     # ========== GENERIC DATABASE OPERATIONS ==========
@@ -135,20 +146,20 @@ INTENT_TEST_CASES = [
     IntentTestCase(
         id="TC008",
         user_input="Query the database for all assets in the Technology sector",
-        expected_skills=["sqlite-crud"],
+        expected_skills=("sqlite-crud",),
         expected_plan_steps=2,  # Construct query + Execute
         description="Generic SQL query - should use core sqlite-crud skill",
-        tags=["database", "query", "core_skill"],
-        should_not_use_skills=["get_portfolio_holdings"]  # Too specific
+        tags=("database", "query", "core_skill"),
+        should_not_use_skills=("get_portfolio_holdings",)  # Too specific
     ),
     
     IntentTestCase(
         id="TC009",
         user_input="Show me the database schema",
-        expected_skills=["sqlite-crud"],
+        expected_skills=("sqlite-crud",),
         expected_plan_steps=2,
         description="Schema inspection - generic database operation",
-        tags=["database", "schema", "core_skill"],
+        tags=("database", "schema", "core_skill"),
     ),
     
     # ========== MULTI-SKILL OPERATIONS ==========
@@ -156,10 +167,10 @@ INTENT_TEST_CASES = [
     IntentTestCase(
         id="TC010",
         user_input="Add Microsoft to my portfolio and then show all my holdings",
-        expected_skills=["db_upsert_asset", "get_portfolio_holdings"],
+        expected_skills=("db_upsert_asset", "get_portfolio_holdings"),
         expected_plan_steps=4,  # Add asset + Confirm + Read holdings + Present
         description="Sequential operations requiring multiple skills",
-        tags=["portfolio", "multi_skill", "read", "write"],
+        tags=("portfolio", "multi_skill", "read", "write"),
     ),
     
     # ========== EDGE CASES & AMBIGUITY ==========
@@ -167,40 +178,69 @@ INTENT_TEST_CASES = [
     IntentTestCase(
         id="TC011",
         user_input="Tell me about my portfolio",
-        expected_skills=["get_portfolio_holdings"],
+        expected_skills=("get_portfolio_holdings",),
         expected_plan_steps=3,  # Read + Analyze + Present
         description="Ambiguous request - should default to showing holdings",
-        tags=["portfolio", "ambiguous", "read"],
+        tags=("portfolio", "ambiguous", "read"),
     ),
     
     IntentTestCase(
         id="TC012",
         user_input="What's in the assets table?",
-        expected_skills=["sqlite-crud"],  # Generic query, not portfolio-specific
+        expected_skills=("sqlite-crud",),  # Generic query, not portfolio-specific
         expected_plan_steps=2,
         description="Direct table query - should use generic SQL skill",
-        tags=["database", "query", "technical"],
+        tags=("database", "query", "technical"),
     ),
-]
+)
 
 
 # ============================================================================
 # TEST EXECUTION
 # ============================================================================
 
+@functools.lru_cache(maxsize=None)
+def _skill_matcher(skill_names):
+    """
+    Build a single-pass matcher for skill names in plan text (once per
+    skill set, shared by every test case).
+    
+    skill_names holds (name, *Skill.name_variants) tuples, so each skill
+    matches as written or with underscores as spaces (both lowercased).
+    The pattern tries every position, longest name first; skill_hits maps
+    a matched name to all skills it implies, including skills whose names
+    are a prefix of it.
+    
+    Returns:
+        (compiled pattern, {matched text: set of skill names})
+    """
+    variants = {}
+    for skill, *texts in skill_names:
+        for text in texts:
+            variants.setdefault(text, set()).add(skill)
+    
+    skill_hits = {
+        text: {skill for other, skills in variants.items() if text.startswith(other) for skill in skills}
+        for text in variants
+    }
+    # Lookahead: zero-width, so overlapping names are all found
+    alternation = "|".join(map(re.escape, sorted(variants, key=len, reverse=True)))
+    return re.compile(f"(?=({alternation}))" if variants else r"(?!)"), skill_hits
+
+
+@pytest.mark.llm
 class TestSkillIntentRecognition:
     """
     Test suite for validating intent recognition and skill routing.
     """
     
-    @classmethod
-    def setup_class(cls):
-        """Initialize agent once for all tests."""
-        print("\n" + "=" * 70)
-        print("Setting up Finn Agent for Intent Recognition Tests")
-        print("=" * 70)
-        cls.finn = Agent(name="finn", description="Financial portfolio agent")
-        print(f"✅ Agent initialized with {len(cls.finn.list_skills())} skills")
+    @pytest.fixture(autouse=True)
+    def _agent(self, finn_agent):
+        """Use the session-wide Finn agent (see conftest.py)."""
+        self.finn = finn_agent
+        self.skill_pattern, self.skill_hits = _skill_matcher(tuple(
+            (skill.name, *skill.name_variants) for skill in finn_agent.registry.get_all_skills()
+        ))
     
     def _run_planner(self, user_input: str) -> Dict[str, Any]:
         """
@@ -223,16 +263,14 @@ class TestSkillIntentRecognition:
         # Run planner
         updated_state = planner_node(mock_state, registry=self.finn.registry)
         
-        # Extract skills mentioned in plan
-        plan = updated_state.get("plan", [])
+        # Extract skills mentioned in plan (every planner_node return sets it)
+        plan = updated_state["plan"]
         skills_used = set()
         
         for step in plan:
-            # Check if step mentions any skills
-            step_text = str(step).lower()
-            for skill in self.finn.list_skills():
-                if skill.lower() in step_text or skill.replace("_", " ") in step_text:
-                    skills_used.add(skill)
+            # One scan per step finds every skill name mentioned in it
+            for match in self.skill_pattern.finditer(str(step).lower()):
+                skills_used.update(self.skill_hits[match.group(1)])
         
         return {
             "state": updated_state,
@@ -240,25 +278,25 @@ class TestSkillIntentRecognition:
             "skills_used": list(skills_used)
         }
     
-    def test_case(self, test_case: IntentTestCase):
+    def check_case(self, test_case: IntentTestCase):
         """
         Execute a single test case.
         
         Args:
             test_case: The test case to run
         """
-        print(f"\n{'=' * 70}")
-        print(f"[{test_case.id}] {test_case.description}")
-        print(f"User Input: \"{test_case.user_input}\"")
-        print(f"Expected Skills: {test_case.expected_skills}")
+        log.info("=" * 70)
+        log.info("[%s] %s", test_case.id, test_case.description)
+        log.info('User Input: "%s"', test_case.user_input)
+        log.info("Expected Skills: %s", list(test_case.expected_skills))
         
         # Run planner
         result = self._run_planner(test_case.user_input)
         plan = result["plan"]
         skills_used = result["skills_used"]
         
-        print(f"Plan Steps Generated: {len(plan)}")
-        print(f"Skills Identified: {skills_used}")
+        log.info("Plan Steps Generated: %d", len(plan))
+        log.info("Skills Identified: %s", skills_used)
         
         # Assertions
         failures = []
@@ -268,7 +306,7 @@ class TestSkillIntentRecognition:
             if expected_skill not in skills_used:
                 failures.append(f"❌ Missing expected skill: {expected_skill}")
             else:
-                print(f"  ✅ Found expected skill: {expected_skill}")
+                log.info("  ✅ Found expected skill: %s", expected_skill)
         
         # 2. Check skills that should NOT be used
         if test_case.should_not_use_skills:
@@ -283,66 +321,66 @@ class TestSkillIntentRecognition:
                 f"❌ Plan steps mismatch: expected ~{test_case.expected_plan_steps}, got {len(plan)}"
             )
         else:
-            print(f"  ✅ Plan steps within expected range")
+            log.info("  ✅ Plan steps within expected range")
         
         # Report
         if failures:
-            print("\n⚠️  FAILURES:")
-            for failure in failures:
-                print(f"  {failure}")
             assert False, f"Test case {test_case.id} failed:\n" + "\n".join(failures)
-        else:
-            print(f"\n✅ {test_case.id} PASSED")
-    
-    # ========== INDIVIDUAL TEST METHODS ==========
-    
-    def test_tc001_basic_portfolio_read(self):
-        """TC001: Show me my portfolio holdings"""
-        self.test_case(INTENT_TEST_CASES[0])
-    
-    def test_tc002_natural_portfolio_query(self):
-        """TC002: What stocks do I own?"""
-        self.test_case(INTENT_TEST_CASES[1])
-    
-    def test_tc003_list_investments(self):
-        """TC003: List all my investments"""
-        self.test_case(INTENT_TEST_CASES[2])
-    
-    def test_tc004_add_asset(self):
-        """TC004: Add Apple stock"""
-        self.test_case(INTENT_TEST_CASES[3])
-    
-    def test_tc005_record_transaction(self):
-        """TC005: I bought 100 shares of TSLA"""
-        self.test_case(INTENT_TEST_CASES[4])
-    
-    def test_tc006_initialize_database(self):
-        """TC006: Initialize portfolio database"""
-        self.test_case(INTENT_TEST_CASES[5])
-    
-    def test_tc007_setup_system(self):
-        """TC007: Set up portfolio tracking system"""
-        self.test_case(INTENT_TEST_CASES[6])
-    
-    def test_tc008_generic_sql_query(self):
-        """TC008: Query database for Tech sector"""
-        self.test_case(INTENT_TEST_CASES[7])
-    
-    def test_tc009_show_schema(self):
-        """TC009: Show database schema"""
-        self.test_case(INTENT_TEST_CASES[8])
-    
-    def test_tc010_multi_skill_operation(self):
-        """TC010: Add MSFT and show holdings"""
-        self.test_case(INTENT_TEST_CASES[9])
-    
-    def test_tc011_ambiguous_request(self):
-        """TC011: Tell me about my portfolio"""
-        self.test_case(INTENT_TEST_CASES[10])
+        log.info("✅ %s PASSED", test_case.id)
+    
+    @pytest.mark.parametrize("test_case", [
+        pytest.param(tc, id=tc.id, marks=pytest.mark.tag(*tc.tags))
+        for tc in INTENT_TEST_CASES
+    ])
+    def test_intent(self, test_case: IntentTestCase):
+        """Run one INTENT_TEST_CASES entry (select with -k TC001 or -k portfolio)."""
+        self.check_case(test_case)
+
+
+def canned_planner(state: AgentState, registry=None) -> Dict[str, Any]:
+    """
+    Stand-in for planner_node: a plan that names exactly the expected skills.
     
-    def test_tc012_direct_table_query(self):
-        """TC012: What's in the assets table?"""
-        self.test_case(INTENT_TEST_CASES[11])
+    Skills are written with underscores as spaces, the way planners often
+    phrase them, and the plan is padded with Auditor steps to the expected
+    length.
+    """
+    user_input = state["messages"][-1]["content"]
+    test_case = next(tc for tc in INTENT_TEST_CASES if tc.user_input == user_input)
+    plan = [
+        {"role": "Actor", "instruction": f"Use {skill.replace('_', ' ')}"}
+        for skill in test_case.expected_skills
+    ]
+    while len(plan) < test_case.expected_plan_steps:
+        plan.append({"role": "Auditor", "instruction": "Verify the result"})
+    return {**state, "plan": plan}
+
+
+def test_intent_checks_canned(monkeypatch):
+    """Skill extraction and case checks against canned plans (no LLM)."""
+    monkeypatch.setattr(sys.modules[__name__], "planner_node", canned_planner)
+    skill_names = sorted({
+        skill for tc in INTENT_TEST_CASES
+        for skill in tc.expected_skills + tc.should_not_use_skills
+    })
+    suite = TestSkillIntentRecognition()
+    suite.finn = SimpleNamespace(registry=None)  # canned_planner ignores it
+    suite.skill_pattern, suite.skill_hits = _skill_matcher(tuple(
+        (name, name.lower(), name.replace("_", " ").lower()) for name in skill_names
+    ))
+    
+    for test_case in INTENT_TEST_CASES:
+        suite.check_case(test_case)
+    
+    # A plan that also reads holdings must fail TC004's forbidden-skill check
+    add_asset = INTENT_TEST_CASES[3]
+    def over_eager(state, registry=None):
+        updated = canned_planner(state)
+        updated["plan"].append({"role": "Actor", "instruction": "Run get_portfolio_holdings"})
+        return updated
+    monkeypatch.setattr(sys.modules[__name__], "planner_node", over_eager)
+    with pytest.raises(AssertionError, match="forbidden skill: get_portfolio_holdings"):
+        suite.check_case(add_asset)
 
 
 # ============================================================================
@@ -350,51 +388,5 @@ class TestSkillIntentRecognition:
 # ============================================================================
 
 if __name__ == "__main__":
-    import argparse
-    
-    parser = argparse.ArgumentParser(description="Run intent recognition tests")
-    parser.add_argument("--test", help="Run specific test case by ID (e.g., TC001)")
-    parser.add_argument("--tag", help="Run tests with specific tag (e.g., portfolio)")
-    parser.add_argument("--all", action="store_true", help="Run all tests")
-    
-    args = parser.parse_args()
-    
-    # Initialize test suite
-    test_suite = TestSkillIntentRecognition()
-    test_suite.setup_class()
-    
-    # Filter test cases
-    tests_to_run = INTENT_TEST_CASES
-    
-    if args.test:
-        tests_to_run = [tc for tc in INTENT_TEST_CASES if tc.id == args.test]
-    elif args.tag:
-        tests_to_run = [tc for tc in INTENT_TEST_CASES if args.tag in (tc.tags or [])]
-    
-    if not tests_to_run:
-        print(f"❌ No tests found matching criteria")
-        sys.exit(1)
-    
-    # Run tests
-    print(f"\n🧪 Running {len(tests_to_run)} test case(s)...")
-    
-    passed = 0
-    failed = 0
-    
-    for test_case in tests_to_run:
-        try:
-            test_suite.test_case(test_case)
-            passed += 1
-        except AssertionError:
-            failed += 1
-            continue
-    
-    # Summary
-    print("\n" + "=" * 70)
-    print("TEST SUMMARY")
-    print("=" * 70)
-    print(f"✅ Passed: {passed}")
-    print(f"❌ Failed: {failed}")
-    print(f"📊 Total: {passed + failed}")
-    
-    sys.exit(0 if failed == 0 else 1)
+    # Extra arguments go to pytest, e.g. -k TC001 or -k portfolio
+    sys.exit(pytest.main([__file__, "-v", *sys.argv[1:]]))
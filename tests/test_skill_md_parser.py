@@ -0,0 +1,72 @@
+"""
+Test SKILL.md Parser - Unit tests for core/skill_md_parser.py
+
+The regex fast path for flat frontmatter must give the same result as
+yaml.safe_load, or hand the text to YAML.
+"""
+
+import pytest
+import sys
+import os
+import yaml
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.skill_md_parser import _parse_frontmatter_fast, parse_skill_md
+
+
+FRONTMATTER_VALUES = [
+    "file-operations",
+    "Read, write and list files",
+    "1.0.0",
+    "2024-01-01",
+    "2024-01-01 10:00:00",
+    "0x1F",
+    "0o17",
+    "1_000",
+    "12:30",
+    ".5",
+    ".inf",
+    "+1",
+    "1e3",
+    "yes",
+    "Off",
+    "~",
+    "null",
+    "=",
+    "trailing:",
+    "has: colon",
+    "has # comment",
+    "'quoted'",
+    "[a, b]",
+    "tab\tinside",
+]
+
+
+@pytest.mark.parametrize("value", FRONTMATTER_VALUES)
+def test_fast_path_matches_yaml(value):
+    """Test the fast path agrees with yaml.safe_load or defers to it."""
+    text = f"name: {value}\ndescription: A skill"
+    fast = _parse_frontmatter_fast(text)
+    if fast is not None:
+        assert fast == yaml.safe_load(text)
+
+
+def test_typed_values_use_yaml(tmp_path):
+    """Test that date, hex and sexagesimal values keep their YAML types."""
+    skill_md = tmp_path / "SKILL.md"
+    skill_md.write_text(
+        "---\nname: 0x1F\ndescription: 12:30\nversion: 2024-01-01\n---\n\n# Body\n",
+        encoding="utf-8"
+    )
+
+    frontmatter, body = parse_skill_md(str(skill_md))
+
+    assert frontmatter == yaml.safe_load("name: 0x1F\ndescription: 12:30\nversion: 2024-01-01")
+    assert frontmatter["name"] == 31
+    assert "# Body" in body
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
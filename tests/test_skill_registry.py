@@ -12,19 +12,56 @@ TEST FLOW:
 
 import sys
 import os
+import pytest
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from core.skill_registry import SkillRegistry, Skill
 
+# Section bars for the two header styles, built once
+_BAR_EQ = "=" * 70
+_BAR_DASH = "-" * 70
+_BARS = {"=": _BAR_EQ, "-": _BAR_DASH}
+
 def print_section(title, char="="):
     """Print a clear section header."""
-    print(f"\n{char*70}")
-    print(f"  {title}")
-    print(f"{char*70}")
+    bar = _BARS.get(char) or char * 70
+    print(f"\n{bar}\n  {title}\n{bar}")
+
+# Finn skills every scan must find, with their required parameters
+FINN_SKILLS = [
+    ("db_upsert_asset", ("ticker",)),
+    ("get_portfolio_holdings", ()),
+    ("initialize_portfolio_database", ()),
+]
+
+FINN_SKILLS_DIR = "./finn/skills"
+
+def scan_finn_skills():
+    """Registry with the Finn agent's skills."""
+    registry = SkillRegistry()
+    registry.scan_directory(FINN_SKILLS_DIR, agent_name="finn")
+    return registry
 
-def test_skill_registry():
+@pytest.fixture(scope="module")
+def finn_registry():
+    """One scan of ./finn/skills shared by the module's tests."""
+    if not os.path.isdir(FINN_SKILLS_DIR):
+        pytest.skip("finn/skills not present")
+    return scan_finn_skills()
+
+@pytest.mark.parametrize("name,required", FINN_SKILLS, ids=[name for name, _ in FINN_SKILLS])
+def test_skill_metadata(finn_registry, name, required):
+    """Each expected Finn skill is registered with its required parameters."""
+    skill = finn_registry.get_skill(name)
+    assert skill is not None, f"Should find {name} skill"
+    assert finn_registry.has_skill(name)
+    assert skill.agent == "finn"
+    for param in required:
+        assert skill.parameters[param]["required"] is True
+
+def test_skill_registry(finn_registry):
     """Test SkillRegistry functionality."""
     
     print_section("TEST: Skill Registry System")
@@ -34,8 +71,8 @@ def test_skill_registry():
     # ========================================================================
     print_section("STEP 1: Scan Skills Directory", "-")
     
-    registry = SkillRegistry()
-    count = registry.scan_directory("./finn/skills", agent_name="finn")
+    registry = finn_registry
+    count = len(registry.get_all_skills())
     
     print(f"Skills found: {count}")
     print(f"Registry: {registry}")
@@ -72,8 +109,7 @@ def test_skill_registry():
     print(f"  Agent: {skill.agent}")
     print(f"  Category: {skill.category}")
     
-    # Test has_skill
-    assert registry.has_skill("db_upsert_asset")
+    # Test has_skill (expected skills: test_skill_metadata)
     assert not registry.has_skill("nonexistent_skill")
     print("\n✅ has_skill() works correctly")
     
@@ -123,9 +159,7 @@ def test_skill_registry():
     print(f"Examples: {len(skill.examples)}")
     print(f"Tags: {skill.tags}")
     
-    # Verify parameter metadata
-    assert "ticker" in skill.parameters
-    assert skill.parameters["ticker"]["required"] == True
+    # Verify parameter metadata (required flags: test_skill_metadata)
     assert skill.parameters["ticker"]["type"] == "str"
     print("\n✅ Parameter metadata correct")
     
@@ -203,8 +237,8 @@ def test_skill_registry():
     try:
         # Check registry state
         assert len(registry._skills) > 0, "Should have skills"
-        assert len(registry._skills_by_agent) > 0, "Should have agent index"
-        assert len(registry._skills_by_category) > 0, "Should have category index"
+        assert registry.get_skills_by_agent("finn"), "Should have agent view"
+        assert stats['categories'], "Should have category view"
         
         # Check all skills have required metadata
         for skill in registry.get_all_skills():
@@ -214,11 +248,6 @@ def test_skill_registry():
             assert skill.category, f"Skill {skill.name} missing category"
             assert skill._execute_func is not None, f"Skill {skill.name} missing execute function"
         
-        # Check skill discovery works
-        assert registry.has_skill("db_upsert_asset")
-        assert registry.has_skill("get_portfolio_holdings")
-        assert registry.has_skill("initialize_portfolio_database")
-        
         # Check stats are consistent
         assert stats['total_skills'] == len(registry.get_all_skills())
         
@@ -242,6 +271,45 @@ def test_skill_registry():
         print_section("TEST RESULT: ERROR ❌")
         return False
 
+def test_module_cache_shared_across_registries():
+    """Skill modules are exec'd once and reused by later registries."""
+    
+    print_section("TEST: Skill Module Cache")
+    
+    first = SkillRegistry(agent_name="core")
+    first.initialize()
+    second = SkillRegistry(agent_name="core")
+    second.initialize()
+    
+    skill_a = first.get_skill("sqlite_crud")
+    skill_b = second.get_skill("sqlite_crud")
+    assert skill_a is not None and skill_b is not None
+    
+    # Same function object => the module was not re-executed
+    assert skill_a._execute_func is skill_b._execute_func
+    print("✅ Second registry reused the cached skill module")
+
+def test_views_follow_registrations():
+    """Agent / category views reflect the latest registration of each name."""
+    
+    def make_skill(name, agent, category, is_core=False):
+        return Skill(name=name, description="test", agent=agent, category=category,
+                     module_path="", is_core=is_core)
+    
+    registry = SkillRegistry()
+    registry.register_skill(make_skill("lookup", "core", "database", is_core=True))
+    assert [s.name for s in registry.get_skills_by_agent("core")] == ["lookup"]
+    
+    # An agent skill overriding the core one moves it in both views
+    registry.register_skill(make_skill("lookup", "finn", "files"))
+    assert registry.get_skills_by_agent("core") == []
+    assert registry.get_skills_by_category("database") == []
+    assert registry.get_skills_by_category("files")[0].overrides_core
+    assert registry.get_stats()["skills_by_agent"] == {"finn": 1}
+    print("✅ Views rebuilt after override")
+
 if __name__ == "__main__":
-    success = test_skill_registry()
+    success = test_skill_registry(scan_finn_skills())
+    test_module_cache_shared_across_registries()
+    test_views_follow_registrations()
     sys.exit(0 if success else 1)
@@ -0,0 +1,378 @@
+"""
+Test Two-Stage Client - Unit tests for core/two_stage_client.py
+
+Runs the reasoning → parsing pipeline against an in-process mock Ollama
+server (httpx.MockTransport), so no model server is needed.
+"""
+
+import pytest
+import asyncio
+import json
+import logging
+import sys
+import os
+import httpx
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.two_stage_client import TwoStageOllamaClient, BatchedTwoStageClient, flush_outputs, _json_schema
+from core.prompt_cache import PromptCache
+from core.models import Plan
+
+
+PLAN_JSON = json.dumps({
+    "objective": "Create test.txt",
+    "plan": [
+        {"role": "Actor", "instruction": "Write 'Hello World' to test.txt"},
+        {"role": "Auditor", "instruction": "Verify test.txt exists"}
+    ],
+    "total_steps": 2
+})
+
+
+class TestTwoStageClient:
+    """Test suite for TwoStageOllamaClient."""
+
+    @pytest.fixture
+    def calls(self):
+        """Request payloads seen by the mock server."""
+        return []
+
+    @pytest.fixture
+    def warmups(self):
+        """Models the mock server was asked to load."""
+        return []
+
+    @pytest.fixture
+    def client(self, calls, warmups):
+        """Client wired to a mock Ollama /api/generate endpoint."""
+        def handler(request: httpx.Request) -> httpx.Response:
+            payload = json.loads(request.content)
+            if request.url.path == "/api/embed":
+                # Every prompt mentioning a file embeds to the same vector
+                vector = [1.0, 0.0] if "file" in payload["input"] else [0.0, 1.0]
+                return httpx.Response(200, json={"embeddings": [vector]})
+            if request.url.path == "/api/generate" and "prompt" not in payload:
+                # Model load (warmup) request
+                warmups.append(payload["model"])
+                return httpx.Response(200, json={"response": "", "done": True})
+            calls.append((request.url.path, payload))
+            if request.url.path == "/api/chat":
+                return httpx.Response(200, json={
+                    "message": {"role": "assistant", "content": PLAN_JSON}
+                })
+            if payload.get("format"):
+                return httpx.Response(200, json={"response": PLAN_JSON})
+            if payload.get("stream"):
+                chunks = ["1. Actor ", "writes the file", ""]
+                body = "\n".join(
+                    json.dumps({"response": c, "done": not c}) for c in chunks
+                )
+                return httpx.Response(200, content=body.encode())
+            return httpx.Response(200, json={"response": "1. Actor writes the file"})
+
+        client = TwoStageOllamaClient(
+            base_url="http://ollama.test:11434",
+            verbose=False,
+            save_outputs=False,
+            cache=False
+        )
+        client._transport = httpx.MockTransport(handler)
+        return client
+
+    def test_generate_with_reasoning(self, client, calls):
+        """Test the blocking wrapper runs both stages and validates."""
+        plan = client.generate_with_reasoning(
+            reasoning_model="reasoner",
+            parser_model="parser",
+            prompt="Create test.txt",
+            schema=Plan
+        )
+
+        assert plan.total_steps == 2
+        assert [c[1]["model"] for c in calls] == ["reasoner", "parser"]
+        assert [path for path, _ in calls] == ["/api/generate", "/api/chat"]
+        assert all(c[1]["keep_alive"] == client.keep_alive for c in calls)
+        # Stage 1 streams; its joined text is the Stage 2 user message,
+        # after a system message that is identical on every call
+        assert calls[0][1]["stream"] is True
+        system, user = calls[1][1]["messages"]
+        assert system["content"] == TwoStageOllamaClient._PARSER_SYSTEM_PROMPT
+        assert "1. Actor writes the file" in user["content"]
+        # The sync wrapper must not leak a client bound to a closed loop
+        assert client._client is None
+
+    def test_verbose_output_validates(self, client, caplog):
+        """Test the verbose path pretty-prints and still validates."""
+        caplog.set_level(logging.DEBUG, logger="core.two_stage_client")
+        client.verbose = True
+        plan = client.generate_with_reasoning(
+            reasoning_model="reasoner",
+            parser_model="parser",
+            prompt="Create test.txt",
+            schema=Plan
+        )
+
+        assert plan.plan[1].role == "Auditor"
+        assert '"objective": "Create test.txt"' in caplog.text
+
+    def test_save_outputs(self, client, tmp_path):
+        """Test that both stage outputs are written by the writer thread."""
+        client.save_outputs = True
+        client.output_dir = tmp_path
+        client.generate_with_reasoning(
+            reasoning_model="reasoner",
+            parser_model="parser",
+            prompt="Create test.txt",
+            schema=Plan
+        )
+        flush_outputs()
+
+        saved = sorted(p.name for p in tmp_path.iterdir())
+        assert len(saved) == 2
+        assert "stage1_reasoning_reasoner" in saved[0]
+        assert "stage2_json_parser" in saved[1]
+        assert "OUTPUT:\n" in (tmp_path / saved[1]).read_text(encoding="utf-8")
+
+    def test_structured_single_call(self, client, calls):
+        """Test the schema-constrained path makes one call with the schema."""
+        client.use_structured_grammar = True
+        plan = client.generate_with_reasoning(
+            reasoning_model="reasoner",
+            parser_model="parser",
+            prompt="Create test.txt",
+            schema=Plan
+        )
+
+        assert plan.total_steps == 2
+        assert len(calls) == 1
+        assert calls[0][1]["model"] == "reasoner"
+        assert calls[0][1]["format"] == Plan.model_json_schema()
+        # Generated once per model class, then reused
+        assert _json_schema(Plan) is _json_schema(Plan)
+
+    def test_generate_batch(self, client, calls):
+        """Test that a batch returns one plan per prompt, in order."""
+        plans = asyncio.run(client._run_and_close(client.generate_batch(
+            reasoning_model="reasoner",
+            parser_model="parser",
+            prompts=["a", "b", "c"],
+            schema=Plan
+        )))
+
+        assert len(plans) == 3
+        assert all(isinstance(p, Plan) for p in plans)
+        assert len(calls) == 6
+
+    def test_prompt_cache(self, client, calls):
+        """Test exact and semantic cache hits skip both stages."""
+        client.cache = PromptCache(path=None)
+
+        def generate(prompt):
+            return client.generate_with_reasoning(
+                reasoning_model="reasoner",
+                parser_model="parser",
+                prompt=prompt,
+                schema=Plan
+            )
+
+        first = generate("Create the file test.txt")
+        assert len(calls) == 2
+
+        # Exact repeat, then a paraphrase with the same literals
+        assert generate("Create the file test.txt") == first
+        assert generate("Please make a file called test.txt") == first
+        assert len(calls) == 2
+
+        # A different filename must not reuse the cached plan
+        generate("Create the file other.txt")
+        assert len(calls) == 4
+
+    def test_prompt_cache_context(self, client, calls, tmp_path, monkeypatch):
+        """Test the cache is opt-in and keyed on cache_context, not memory."""
+        monkeypatch.chdir(tmp_path)
+        assert TwoStageOllamaClient(save_outputs=False).cache is None
+        assert TwoStageOllamaClient(save_outputs=False, cache=True).cache.semantic is False
+
+        client.cache = PromptCache(path=None, semantic=False)
+
+        def generate(memory):
+            return client.generate_with_reasoning(
+                reasoning_model="reasoner",
+                parser_model="parser",
+                prompt="Create the file test.txt",
+                schema=Plan,
+                system_prompt=f"skills\n{memory}",
+                cache_context="skills"
+            )
+
+        generate("LOG: 10:00 started")
+        generate("LOG: 10:05 created test.txt")
+        assert len(calls) == 2
+
+    def test_batched_client_bounds_concurrency(self, client):
+        """Test the batcher returns each caller's result with <= N in flight."""
+        in_flight = {"now": 0, "peak": 0}
+
+        async def fake_generate(**kwargs):
+            in_flight["now"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+            await asyncio.sleep(0.01)
+            in_flight["now"] -= 1
+            if kwargs["prompt"] == "bad":
+                raise ValueError("bad prompt")
+            return kwargs["prompt"].upper()
+
+        client.generate_with_reasoning_async = fake_generate
+        batcher = BatchedTwoStageClient(client=client, max_parallel=2)
+
+        async def run():
+            return await asyncio.gather(
+                *[batcher.submit("r", "p", prompt, Plan) for prompt in ("a", "b", "c", "d", "bad")],
+                return_exceptions=True
+            )
+
+        results = asyncio.run(run())
+
+        assert results[:4] == ["A", "B", "C", "D"]
+        assert isinstance(results[4], ValueError)
+        assert in_flight["peak"] == 2
+
+    def test_batched_client_submit_during_batch(self, client):
+        """Test a request submitted while a batch is in flight still resolves."""
+        release = None
+
+        async def fake_generate(**kwargs):
+            if kwargs["prompt"] == "first":
+                await release.wait()
+            return kwargs["prompt"].upper()
+
+        client.generate_with_reasoning_async = fake_generate
+        batcher = BatchedTwoStageClient(client=client, max_parallel=2, window=0)
+
+        async def run():
+            nonlocal release
+            release = asyncio.Event()
+            first = asyncio.create_task(batcher.submit("r", "p", "first", Plan))
+            # Let the first batch start and block
+            await asyncio.sleep(0.01)
+            late = await asyncio.wait_for(batcher.submit("r", "p", "late", Plan), 1)
+            release.set()
+            return late, await first
+
+        assert asyncio.run(run()) == ("LATE", "FIRST")
+        assert batcher._pending == []
+
+    def test_stage2_retry_reuses_stage1(self, tmp_path):
+        """Test 5xx retries, and that a failed Stage 2 keeps Stage 1 on disk once."""
+        stage1_calls = []
+        chat_status = [503, 500, 500, 503, 200, 500, 500, 500, 500, 500, 500]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            payload = json.loads(request.content)
+            if request.url.path == "/api/chat":
+                status = chat_status.pop(0)
+                if status != 200:
+                    return httpx.Response(status, json={"error": "model loading"})
+                return httpx.Response(200, json={
+                    "message": {"role": "assistant", "content": PLAN_JSON}
+                })
+            if "prompt" not in payload:
+                return httpx.Response(200, json={"done": True})
+            stage1_calls.append(payload["model"])
+            return httpx.Response(200, content=json.dumps(
+                {"response": "1. Actor writes the file", "done": True}
+            ).encode())
+
+        client = TwoStageOllamaClient(
+            base_url="http://ollama.test:11434",
+            verbose=False,
+            save_outputs=False,
+            cache=PromptCache(path=None)
+        )
+        client._transport = httpx.MockTransport(handler)
+        client.retry_base_delay = 0
+        client.reuse_stage1 = True
+        client.stage1_cache_dir = tmp_path
+
+        def generate():
+            return client.generate_with_reasoning(
+                reasoning_model="reasoner",
+                parser_model="parser",
+                prompt="Create test.txt",
+                schema=Plan
+            )
+
+        # Three 5xx in a row exhaust the retries; Stage 1 stays cached
+        with pytest.raises(httpx.HTTPStatusError):
+            generate()
+        assert len(list(tmp_path.iterdir())) == 1
+
+        # The rerun skips Stage 1, retries once, then clears the cache file
+        assert generate().total_steps == 2
+        assert stage1_calls == ["reasoner"]
+        assert list(tmp_path.iterdir()) == []
+
+        # A kept reasoning is replayed once, not on every retry
+        client.cache = None
+        with pytest.raises(httpx.HTTPStatusError):
+            generate()
+        with pytest.raises(httpx.HTTPStatusError):
+            generate()
+        assert stage1_calls == ["reasoner", "reasoner"]
+        assert list(tmp_path.iterdir()) == []
+        assert chat_status == []
+
+        # Expired files are neither reused nor kept
+        stale = tmp_path / "stale.txt"
+        stale.write_text("old reasoning", encoding="utf-8")
+        os.utime(stale, (0, 0))
+        assert client._take_stage1(stale) is None
+        assert not stale.exists()
+
+    def test_redirect_raises_status_error(self):
+        """Test a non-2xx, non-error status raises instead of failing to decode."""
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(307, headers={"Location": "http://elsewhere.test/"})
+
+        client = TwoStageOllamaClient(
+            base_url="http://ollama.test:11434",
+            verbose=False,
+            save_outputs=False,
+            cache=False
+        )
+        client._transport = httpx.MockTransport(handler)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            client.generate_structured(model="reasoner", prompt="Create test.txt", schema=Plan)
+
+    def test_compact_reasoning(self):
+        """Test the Stage 2 skeleton keeps steps and drops prose."""
+        text = (
+            "Let me think about what the user wants here.\n"
+            "\n"
+            "1. Actor: create test.txt with the greeting\n"
+            "   - Why: the file must exist\n"
+            "It is important to double check.\n"
+            "2. Auditor verifies the file content\n"
+        )
+        compact = TwoStageOllamaClient._compact_reasoning(text)
+
+        assert compact.splitlines() == [
+            "1. Actor: create test.txt with the greeting",
+            "- Why: the file must exist",
+            "2. Auditor verifies the file content",
+        ]
+        # No role mentioned: keep everything
+        assert TwoStageOllamaClient._compact_reasoning("just prose") == "just prose"
+
+    def test_warmup(self, client, warmups):
+        """Test that warmup asks the server to load each model."""
+        asyncio.run(client._run_and_close(client.warmup("reasoner", "parser")))
+
+        assert sorted(warmups) == ["parser", "reasoner"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])